@@ -0,0 +1,53 @@
+"""
+Whole-grid vs chunked pricing of spot x vol scenario grids: time and peak memory
+
+Run with: uv run python -m benchmarks.chunked_grid
+"""
+
+import tracemalloc
+from collections.abc import Callable
+from functools import partial
+
+import numpy as np
+
+from benchmarks.timing import best_time
+from bspx.pricing import black_scholes_price, black_scholes_price_chunked
+
+GRID_SIDES: tuple[int, ...] = (100, 300, 1_000, 3_162)
+BUDGETS: tuple[int, ...] = (256 * 2**10, 2 * 2**20, 32 * 2**20)
+
+
+def _peak_bytes(func: Callable[[], object]) -> int:
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    print(f"{'n':>12}{'mode':>20}{'time (s)':>14}{'peak (MiB)':>14}")
+
+    for side in GRID_SIDES:
+        S = np.linspace(20.0, 80.0, side)[:, None]
+        vol = np.linspace(0.05, 1.0, side)[None, :]
+        args = (S, 50.0, 0.5, 0.03, vol)
+        out = np.empty((side, side))
+
+        runs: dict[str, Callable[[], object]] = {
+            "whole grid": partial(black_scholes_price, *args)
+        }
+        for budget in BUDGETS:
+            runs[f"chunked {budget >> 10} KiB"] = partial(
+                black_scholes_price_chunked, *args, memory_budget=budget, out=out
+            )
+
+        for mode, func in runs.items():
+            seconds = best_time(func)
+            peak = _peak_bytes(func) / 2**20
+            print(f"{side * side:>12,d}{mode:>20}{seconds:>14.3e}{peak:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""
+Prices and Greeks of both sides: NumPy formulas vs the numba-compiled fused loop
+
+Run with: uv run python -m benchmarks.compiled_kernel
+"""
+
+from functools import partial
+
+from benchmarks.timing import SIZES, best_time, format_row, random_market
+from bspx.greeks.formulas import compiled
+
+
+def main() -> None:
+    if not compiled.NUMBA_AVAILABLE:
+        print("numba is not installed, only the NumPy path is available")
+        return
+
+    # The first call compiles (or loads the on-disk cache), keep it out of the timings
+    compiled.price_and_greeks(*random_market(1), use_jit=True)
+
+    print(f"{'n':>10}{'numpy (s)':>14}{'numba (s)':>14}{'speedup':>14}")
+    for n in SIZES[:-1]:
+        market = random_market(n)
+        numpy_time = best_time(
+            partial(compiled.price_and_greeks, *market, use_jit=False)
+        )
+        numba_time = best_time(
+            partial(compiled.price_and_greeks, *market, use_jit=True)
+        )
+        print(format_row(n, numpy_time, numba_time, numpy_time / numba_time))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Greeks by complex step against central differences: time per batch and the worst
+error of each Greek relative to the analytical values
+
+Run with: uv run python -m benchmarks.complex_step
+"""
+
+from functools import partial
+
+import numpy as np
+
+from benchmarks.timing import SIZES, best_time, random_market
+from bspx.greeks import (
+    AnalyticalBackend,
+    ComplexStepBackend,
+    NumericalBackend,
+    calculate_greeks,
+)
+from bspx.greeks.formulas.complex_step import black_scholes_complex
+from bspx.instruments import Greeks
+from bspx.pricing import BlackScholesState, black_scholes_price
+
+GREEK_NAMES: tuple[str, ...] = ("delta", "theta", "gamma", "vega", "rho")
+
+# Greeks below this size are compared in absolute terms, deep OTM values are ~0
+_ERROR_FLOOR: float = 1e-3
+
+
+def max_errors(greeks: Greeks, reference: Greeks) -> list[float]:
+    """Worst error of each Greek, relative to the reference above the floor"""
+    errors = []
+    for name in GREEK_NAMES:
+        expected = getattr(reference, name)
+        scale = np.maximum(np.abs(expected), _ERROR_FLOOR)
+        errors.append(float((np.abs(getattr(greeks, name) - expected) / scale).max()))
+    return errors
+
+
+def main() -> None:
+    header = "".join(f"{name:>10}" for name in GREEK_NAMES)
+    print(f"{'n':>10}{'method':>14}{'time (s)':>14}{'speedup':>10}{header}")
+
+    for n in SIZES[2:-1]:
+        market = random_market(n)
+        reference = calculate_greeks(
+            AnalyticalBackend(BlackScholesState.build(*market))
+        )
+        numerical_time = 0.0
+
+        for backend in (
+            NumericalBackend(black_scholes_price, *market),
+            ComplexStepBackend(black_scholes_complex, *market),
+        ):
+            run = partial(calculate_greeks, backend)
+            seconds = best_time(run)
+            numerical_time = numerical_time or seconds
+            errors = "".join(f"{e:>10.1e}" for e in max_errors(run(), reference))
+            print(
+                f"{n:>10,d}{backend.method:>14}{seconds:>14.3e}"
+                f"{numerical_time / seconds:>10.2f}{errors}"
+            )
+
+
+if __name__ == "__main__":
+    main()
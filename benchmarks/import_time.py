@@ -0,0 +1,116 @@
+"""
+Cold import time of the package entry points, measured with 'python -X importtime'
+
+Every statement runs in a fresh interpreter; the time reported is what it adds on top
+of a bare interpreter start. Exits with status 1 when a statement exceeds its budget
+or loads a module it should not need, so it can guard against import regressions.
+
+Run with: uv run python -m benchmarks.import_time
+"""
+
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+
+_REPEATS: int = 5
+
+# Top-level entries of the '-X importtime' report ("import time: self | cumulative |
+# name"), nested imports are indented below the module that triggered them
+_TOP_LEVEL = re.compile(r"^import time:\s+\d+ \|\s+(\d+) \| (\S+)$")
+_ANY_LEVEL = re.compile(r"^import time:\s+\d+ \|\s+\d+ \| \s*(\S+)$")
+
+_HEAVY: tuple[str, ...] = ("scipy", "pandas", "pyarrow", "numba", "yfinance", "plotly")
+
+
+@dataclass(frozen=True)
+class Case:
+    """
+    Parameters:
+
+        statement:  Python statement run in a fresh interpreter
+        budget_ms:  Largest accepted import time (in milliseconds)
+        allowed:    Heavy dependencies the statement is expected to load
+    """
+
+    statement: str
+    budget_ms: float
+    allowed: tuple[str, ...] = ()
+
+
+# Note: Budgets are about 1.5-2x the times measured when they were set (about 10 ms
+# for the bare packages, 55-67 ms for the entry points, 190 and 275 ms for the first
+# evaluations), tight enough that an import regression fails rather than hides
+CASES: tuple[Case, ...] = (
+    Case("import bspx", 20.0),
+    Case("import bspx.pricing", 20.0),
+    Case("import bspx.volatility", 20.0),
+    Case("import bspx.greeks", 120.0),
+    Case("from bspx.instruments import OptionChain", 120.0),
+    Case("from bspx.pricing import black_scholes_price", 120.0),
+    Case("from bspx.greeks import AnalyticalBackend", 120.0),
+    Case("from bspx.volatility import implied_vol", 120.0),
+    # First evaluations, which load scipy on demand
+    Case(
+        "from bspx.pricing import black_scholes_price; "
+        "black_scholes_price(42.0, 40.0, 0.5, 0.1, 0.2)",
+        350.0,
+        ("scipy",),
+    ),
+    Case(
+        "from bspx.volatility import implied_vol; "
+        "implied_vol(4.76, 42.0, 40.0, 0.5, 0.1)",
+        500.0,
+        ("scipy",),
+    ),
+)
+
+
+def _import_report(statement: str) -> tuple[float, set[str]]:
+    """(Import time in milliseconds, names of the loaded modules) of one fresh run"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    lines = result.stderr.splitlines()
+
+    micros = sum(int(m[1]) for line in lines if (m := _TOP_LEVEL.match(line)))
+    modules = {m[1] for line in lines if (m := _ANY_LEVEL.match(line))}
+    return micros / 1_000, modules
+
+
+def _best_report(statement: str) -> tuple[float, set[str]]:
+    reports = [_import_report(statement) for _ in range(_REPEATS)]
+    return min(ms for ms, _ in reports), reports[0][1]
+
+
+def main() -> int:
+    startup_ms, startup_modules = _best_report("pass")
+    print(f"{'time (ms)':>10}{'budget':>10}  {'unexpected':<14}statement")
+
+    failed = False
+    for case in CASES:
+        total_ms, modules = _best_report(case.statement)
+        ms = total_ms - startup_ms
+        unexpected = sorted(
+            name
+            for name in _HEAVY
+            if name in modules - startup_modules and name not in case.allowed
+        )
+        failed |= ms > case.budget_ms or bool(unexpected)
+        print(
+            f"{ms:>10.1f}{case.budget_ms:>10.0f}  "
+            f"{', '.join(unexpected) or '-':<14}{case.statement}"
+        )
+
+    if failed:
+        print(
+            "Import regression: a statement exceeded its budget or loaded a heavy module"
+        )
+    return int(failed)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,170 @@
+"""
+Peak memory of the public entry points per element, checked against declared budgets
+
+Each case is called once to warm up (lazy imports, caches), then traced with
+'tracemalloc' while it runs on inputs built beforehand, so the peak counts the
+temporaries and the result but not the inputs. Exits with status 1 when a case needs
+more bytes per element than its budget.
+
+Run with: uv run python -m benchmarks.memory_budget [--size N]
+"""
+
+import argparse
+import gc
+import sys
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import partial
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.timing import random_market
+from bspx.greeks import (
+    AnalyticalBackend,
+    NumericalBackend,
+    calculate_greeks,
+    calculate_greeks_chunked,
+)
+from bspx.indicators import add_bollinger_bands, add_moving_averages, add_rsi
+from bspx.instruments import OptionChain
+from bspx.pricing import (
+    BlackScholesState,
+    black_scholes_price,
+    black_scholes_price_chunked,
+)
+from bspx.pricing.chunked import DEFAULT_MEMORY_BUDGET
+from bspx.volatility import add_volatility_columns
+
+DEFAULT_SIZE: int = 1_000_000
+
+
+@dataclass(frozen=True)
+class Case:
+    """
+    Parameters:
+
+        name:       Entry point being measured
+        setup:      Builds the inputs for n elements and returns the traced call
+        budget:     Largest accepted peak allocation, in bytes per element
+        overhead:   Bytes allowed on top of the budget whatever the size, e.g. the
+                    block buffers of the chunked paths
+    """
+
+    name: str
+    setup: Callable[[int], Callable[[], object]]
+    budget: float
+    overhead: int = 0
+
+    def limit(self, n: int) -> float:
+        """Largest accepted peak allocation (in bytes) for n elements"""
+        return self.budget * n + self.overhead
+
+
+def _price(n: int) -> Callable[[], object]:
+    return partial(black_scholes_price, *random_market(n), "call")
+
+
+def _price_chunked(n: int) -> Callable[[], object]:
+    return partial(black_scholes_price_chunked, *random_market(n), "call")
+
+
+def _state_price(n: int) -> Callable[[], object]:
+    market = random_market(n)
+    return lambda: BlackScholesState.build(*market).call_price()
+
+
+def _analytical_greeks(n: int) -> Callable[[], object]:
+    market = random_market(n)
+    return lambda: calculate_greeks(AnalyticalBackend(BlackScholesState.build(*market)))
+
+
+def _chunked_greeks(n: int) -> Callable[[], object]:
+    return partial(calculate_greeks_chunked, *random_market(n))
+
+
+def _numerical_greeks(n: int) -> Callable[[], object]:
+    backend = NumericalBackend(black_scholes_price, *random_market(n))
+    return partial(calculate_greeks, backend)
+
+
+def _chain(n: int) -> Callable[[], object]:
+    rng = np.random.default_rng(0)
+    chain = OptionChain.build(*random_market(n), option_type=rng.random(n) < 0.5)
+    return chain.price_and_greeks
+
+
+def _frame_case(func: Callable[[pd.DataFrame], object]) -> Callable[[int], Callable]:
+    def setup(n: int) -> Callable[[], object]:
+        rng = np.random.default_rng(0)
+        close = 100.0 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+        return partial(func, pd.DataFrame({"Close": close}))
+
+    return setup
+
+
+# Note: Budgets are about 25% above the peaks measured when they were set. A float64
+# result alone is 8 bytes per element, the five Greeks 40; the chunked paths only add
+# their block temporaries, bounded by the memory budget they are given.
+CASES: tuple[Case, ...] = (
+    Case("black_scholes_price", _price, 64.0),
+    Case(
+        "black_scholes_price_chunked", _price_chunked, 10.0, 2 * DEFAULT_MEMORY_BUDGET
+    ),
+    Case("BlackScholesState.call_price", _state_price, 104.0),
+    Case("calculate_greeks[analytical]", _analytical_greeks, 136.0),
+    Case("calculate_greeks_chunked", _chunked_greeks, 50.0, 2 * DEFAULT_MEMORY_BUDGET),
+    Case("calculate_greeks[numerical]", _numerical_greeks, 96.0),
+    Case("OptionChain.price_and_greeks", _chain, 168.0),
+    Case("add_rsi", _frame_case(add_rsi), 72.0),
+    Case("add_bollinger_bands", _frame_case(add_bollinger_bands), 112.0),
+    Case("add_moving_averages", _frame_case(add_moving_averages), 96.0),
+    Case("add_volatility_columns", _frame_case(add_volatility_columns), 96.0),
+)
+
+
+def peak_bytes(func: Callable[[], object]) -> int:
+    """Peak traced allocation while 'func' runs, its result included"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak
+
+
+def measure(case: Case, n: int) -> int:
+    """Peak bytes of one case on n elements"""
+    func = case.setup(n)
+    func()
+    return peak_bytes(func)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=DEFAULT_SIZE)
+    args = parser.parse_args(argv)
+
+    print(f"{'case':>32}{'bytes/elem':>14}{'budget':>10}{'peak (MB)':>12}")
+    over_budget = []
+    for case in CASES:
+        peak = measure(case, args.size)
+        flag = "  OVER BUDGET" if peak > case.limit(args.size) else ""
+        print(
+            f"{case.name:>32}{peak / args.size:>14.1f}{case.budget:>10.0f}"
+            f"{peak / 2**20:>12.1f}{flag}"
+        )
+        if flag:
+            over_budget.append(case.name)
+
+    if over_budget:
+        print(f"\n{len(over_budget)} case(s) exceeded their memory budget")
+    return int(bool(over_budget))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,37 @@
+"""
+Black-Scholes pricing time of each precision tier, with the worst price error
+relative to max(S, K) against the float64 reference
+
+Run with: uv run python -m benchmarks.precision_tiers
+"""
+
+from functools import partial
+
+import numpy as np
+
+from benchmarks.timing import SIZES, best_time, random_market
+from bspx.pricing import black_scholes_price
+from bspx.types import Precision
+
+
+def main() -> None:
+    print(f"{'n':>10}{'tier':>14}{'time (s)':>14}{'speedup':>14}{'max error':>14}")
+
+    for n in SIZES[3:-1]:
+        market = random_market(n)
+        scale = np.maximum(market[0], market[1])
+        reference = black_scholes_price(*market)
+        exact_time = best_time(partial(black_scholes_price, *market))
+
+        for precision in Precision:
+            run = partial(black_scholes_price, *market, precision=precision)
+            seconds = best_time(run)
+            error = (np.abs(run() - reference) / scale).max()
+            print(
+                f"{n:>10,d}{precision:>14}{seconds:>14.3e}"
+                f"{exact_time / seconds:>14.2f}{error:>14.1e}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Fused pricing kernel vs the previous 'scipy.stats.norm' implementation
+
+Run with: uv run python -m benchmarks.pricing_kernel
+"""
+
+from functools import partial
+
+import numpy as np
+from scipy.stats import norm
+
+from benchmarks.timing import SIZES, best_time, format_row, random_market
+from bspx.pricing import black_scholes_price
+from bspx.types import _F64
+
+
+def _reference_call_price(S: _F64, K: _F64, T: _F64, r: _F64, vol: _F64) -> _F64:
+    """Call price as 'black_scholes_price' computed it before the fused kernel"""
+    sqrt_t = np.sqrt(T)
+    vol_sqrt_t = vol * sqrt_t
+    safe_vol_sqrt_t = np.where(T > 0, vol_sqrt_t, 1.0)
+
+    d1 = (np.log(S / K) + (r + 0.5 * np.square(vol)) * T) / safe_vol_sqrt_t
+    d1 = np.where(T > 0, d1, np.where(S >= K, 1e10, 1e-10))
+    d2 = d1 - vol_sqrt_t
+
+    discount = np.exp(-r * T)
+    _ = norm.pdf(d1)
+    payoff = np.maximum(S - K * discount, 0.0)
+    price = S * norm.cdf(d1) - K * discount * norm.cdf(d2)
+    return np.where(T > 0, price, payoff)
+
+
+def main() -> None:
+    print(f"{'n':>10}{'reference (s)':>14}{'fused (s)':>14}{'speedup':>14}")
+
+    for n in SIZES:
+        S, K, T, r, vol = random_market(n)
+        reference = best_time(partial(_reference_call_price, S, K, T, r, vol))
+        fused = best_time(partial(black_scholes_price, S, K, T, r, vol, "call"))
+        print(format_row(n, reference, fused) + f"{reference / fused:>13.2f}x")
+
+
+if __name__ == "__main__":
+    main()
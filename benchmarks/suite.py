@@ -0,0 +1,207 @@
+"""
+Throughput of the public entry points, compared against a stored baseline
+
+Every case is timed at each of its sizes and reported in elements per second. Without
+'--update' the results are compared with 'benchmarks/baseline.json' and the run exits
+with status 1 when any of them drops more than '--threshold' below its baseline.
+
+Run with: uv run python -m benchmarks.suite [--update] [--max-size N] [--only NAME]
+"""
+
+import argparse
+import json
+import platform
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.timing import SIZES, best_time, random_market
+from bspx.greeks import (
+    AnalyticalBackend,
+    AutomaticBackend,
+    NumericalBackend,
+    calculate_greeks,
+)
+from bspx.greeks.formulas.automatic import black_scholes_formula
+from bspx.indicators import add_bollinger_bands, add_moving_averages, add_rsi
+from bspx.pricing import BlackScholesState, black_scholes_price
+from bspx.volatility import add_volatility_columns, implied_vol, implied_vol_batch
+
+BASELINE_PATH: Path = Path(__file__).with_name("baseline.json")
+DEFAULT_THRESHOLD: float = 0.30
+
+
+@dataclass(frozen=True)
+class Case:
+    """
+    Parameters:
+
+        name:       Identifier of the case in the baseline
+        setup:      Builds the inputs for n elements and returns the timed call
+        sizes:      Numbers of elements the case is timed at
+    """
+
+    name: str
+    setup: Callable[[int], Callable[[], object]]
+    sizes: tuple[int, ...] = SIZES
+
+
+def _pricing(n: int) -> Callable[[], object]:
+    return partial(black_scholes_price, *random_market(n), "call")
+
+
+def _state(n: int) -> Callable[[], object]:
+    return partial(BlackScholesState.build, *random_market(n))
+
+
+def _analytical_greeks(n: int) -> Callable[[], object]:
+    market = random_market(n)
+    return lambda: calculate_greeks(AnalyticalBackend(BlackScholesState.build(*market)))
+
+
+def _call_put(n: int) -> Callable[[], object]:
+    market = random_market(n)
+    return lambda: AnalyticalBackend(
+        BlackScholesState.build(*market)
+    ).calculate_call_put()
+
+
+def _extended_greeks(n: int) -> Callable[[], object]:
+    market = random_market(n)
+    return lambda: AnalyticalBackend(BlackScholesState.build(*market)).extended_greeks()
+
+
+def _numerical_greeks(n: int) -> Callable[[], object]:
+    backend = NumericalBackend(black_scholes_price, *random_market(n))
+    return partial(calculate_greeks, backend)
+
+
+def _automatic_greeks(n: int) -> Callable[[], object]:
+    market = random_market(n)
+    return lambda: calculate_greeks(AutomaticBackend(black_scholes_formula, *market))
+
+
+def _scalar_iv(n: int) -> Callable[[], object]:
+    return partial(implied_vol, 4.76, 42.0, 40.0, 0.5, 0.1, "call")
+
+
+def _batch_iv(n: int) -> Callable[[], object]:
+    S, K, T, r, vol = random_market(n)
+    return partial(implied_vol_batch, black_scholes_price(S, K, T, r, vol), S, K, T, r)
+
+
+def _prices_frame(n: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({"Close": 100.0 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))})
+
+
+def _frame_case(func: Callable[[pd.DataFrame], object]) -> Callable[[int], Callable]:
+    return lambda n: partial(func, _prices_frame(n))
+
+
+# Note: Finite differences price their nine bumped scenarios in blocks bounded by a
+# memory budget, so they run at every size. Automatic differentiation carries a
+# gradient array per seed direction through every step and the IV solvers loop in
+# Python, their largest sizes are capped to keep a full run within minutes and memory
+CASES: tuple[Case, ...] = (
+    Case("pricing", _pricing),
+    Case("state_build", _state),
+    Case("greeks_analytical", _analytical_greeks),
+    Case("greeks_call_put", _call_put),
+    Case("greeks_extended", _extended_greeks),
+    Case("greeks_numerical", _numerical_greeks),
+    Case("greeks_automatic", _automatic_greeks, SIZES[:-1]),
+    Case("iv_scalar", _scalar_iv, (1,)),
+    Case("iv_batch", _batch_iv, SIZES[:4]),
+    Case("rsi", _frame_case(add_rsi), SIZES[2:]),
+    Case("bollinger", _frame_case(add_bollinger_bands), SIZES[2:]),
+    Case("moving_averages", _frame_case(add_moving_averages), SIZES[2:]),
+    Case("historical_vol", _frame_case(add_volatility_columns), SIZES[2:]),
+)
+
+
+def _machine() -> dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "processor": platform.processor() or platform.machine(),
+        "system": platform.system(),
+    }
+
+
+def run(max_size: int, only: str | None) -> dict[str, float]:
+    """Elements per second of every selected case and size, keyed 'name/n'"""
+    results: dict[str, float] = {}
+    for case in CASES:
+        if only is not None and only not in case.name:
+            continue
+        for n in case.sizes:
+            if n > max_size:
+                continue
+            seconds = best_time(case.setup(n))
+            results[f"{case.name}/{n}"] = n / seconds
+            print(f"{case.name:>20}{n:>12,d}{n / seconds:>16.3e} elem/s", flush=True)
+    return results
+
+
+def compare(
+    results: dict[str, float], baseline: dict[str, float], threshold: float
+) -> list[str]:
+    """Keys whose throughput fell more than 'threshold' below the baseline"""
+    print(f"\n{'case':>32}{'baseline':>14}{'current':>14}{'ratio':>10}")
+
+    regressions = []
+    for key, throughput in results.items():
+        if key not in baseline:
+            print(f"{key:>32}{'-':>14}{throughput:>14.3e}{'new':>10}")
+            continue
+
+        ratio = throughput / baseline[key]
+        flag = "  REGRESSION" if ratio < 1.0 - threshold else ""
+        print(f"{key:>32}{baseline[key]:>14.3e}{throughput:>14.3e}{ratio:>10.2f}{flag}")
+        if flag:
+            regressions.append(key)
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--update", action="store_true", help="rewrite the baseline")
+    parser.add_argument("--max-size", type=int, default=SIZES[-1])
+    parser.add_argument("--only", help="run the cases whose name contains this")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    results = run(args.max_size, args.only)
+
+    if args.update:
+        # Merged so that a partial run (--only, --max-size) keeps the other entries
+        stored = json.loads(BASELINE_PATH.read_text()) if BASELINE_PATH.exists() else {}
+        stored = {"machine": _machine(), "results": stored.get("results", {}) | results}
+        BASELINE_PATH.write_text(json.dumps(stored, indent=2, sort_keys=True) + "\n")
+        print(f"\nBaseline written to {BASELINE_PATH}")
+        return 0
+
+    if not BASELINE_PATH.exists():
+        print(f"\nNo baseline at {BASELINE_PATH}, create it with '--update'")
+        return 1
+
+    stored = json.loads(BASELINE_PATH.read_text())
+    if stored["machine"] != _machine():
+        print(f"\nWarning: baseline was recorded on {stored['machine']}")
+
+    regressions = compare(results, stored["results"], args.threshold)
+    if regressions:
+        print(
+            f"\n{len(regressions)} case(s) regressed by more than {args.threshold:.0%}"
+        )
+    return int(bool(regressions))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
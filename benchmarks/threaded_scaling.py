@@ -0,0 +1,45 @@
+"""
+Thread scaling of pricing and analytical Greeks from 1 to all cores
+
+Run with: uv run python -m benchmarks.threaded_scaling [max_workers]
+"""
+
+import sys
+from functools import partial
+
+from benchmarks.timing import best_time, random_market
+from bspx.greeks import calculate_greeks_threaded
+from bspx.pricing import black_scholes_price_threaded
+from bspx.pricing.parallel import default_workers
+
+SIZES: tuple[int, ...] = (100_000, 1_000_000, 10_000_000)
+
+
+def main() -> None:
+    max_workers = int(sys.argv[1]) if len(sys.argv) > 1 else default_workers()
+    print(
+        f"{'n':>10}{'workers':>9}{'price (s)':>14}{'speedup':>9}"
+        f"{'greeks (s)':>14}{'speedup':>9}"
+    )
+
+    for n in SIZES:
+        market = random_market(n)
+        price_base = greeks_base = 0.0
+
+        for workers in range(1, max_workers + 1):
+            price = best_time(
+                partial(black_scholes_price_threaded, *market, workers=workers)
+            )
+            greeks = best_time(
+                partial(calculate_greeks_threaded, *market, workers=workers)
+            )
+            price_base = price_base or price
+            greeks_base = greeks_base or greeks
+            print(
+                f"{n:>10,d}{workers:>9d}{price:>14.3e}{price_base / price:>8.2f}x"
+                f"{greeks:>14.3e}{greeks_base / greeks:>8.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+import timeit
+from collections.abc import Callable
+
+import numpy as np
+
+from bspx.types import _F64
+
+SIZES: tuple[int, ...] = (1, 10, 100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+_REPEATS: int = 5
+
+
+def random_market(n: int, seed: int = 0) -> tuple[_F64, _F64, _F64, _F64, _F64]:
+    """Random (S, K, T, r, vol) batch of size n inside realistic market bounds"""
+    rng = np.random.default_rng(seed)
+    return (
+        rng.uniform(10.0, 200.0, n),
+        rng.uniform(10.0, 200.0, n),
+        rng.uniform(1 / 365, 3.0, n),
+        rng.uniform(-0.05, 0.20, n),
+        rng.uniform(0.01, 2.0, n),
+    )
+
+
+def best_time(func: Callable[[], object]) -> float:
+    """Best per-call wall time (in seconds) over several timed batches"""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=_REPEATS, number=number)) / number
+
+
+def format_row(n: int, *cols: float) -> str:
+    return f"{n:>10,d}" + "".join(f"{c:>14.3e}" for c in cols)
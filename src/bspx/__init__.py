@@ -1,16 +1,25 @@
-from bspx.paths import DATA_DIR, RAW_DIR
-from bspx.types import (
-    DayCount,
-    DiffMethod,
-    GreeksBackend,
-    OptionType,
-    PricingFunction,
-    PricingModel,
-)
+from typing import TYPE_CHECKING
+
+from bspx._lazy import attach
+
+if TYPE_CHECKING:
+    from bspx.paths import DATA_DIR, RAW_DIR
+    from bspx.types import (
+        BatchedGreeksBackend,
+        CallPutBackend,
+        DayCount,
+        DiffMethod,
+        GreeksBackend,
+        OptionType,
+        PricingFunction,
+        PricingModel,
+    )
 
 __all__ = [
     "DATA_DIR",
     "RAW_DIR",
+    "BatchedGreeksBackend",
+    "CallPutBackend",
     "DayCount",
     "DiffMethod",
     "GreeksBackend",
@@ -18,3 +27,22 @@ __all__ = [
     "PricingFunction",
     "PricingModel",
 ]
+
+# Note: Subpackages and their dependencies (scipy, pandas, numba, ...) are only
+# imported when one of their names is first used, see 'bspx._lazy'
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "paths": ("DATA_DIR", "RAW_DIR"),
+        "types": (
+            "BatchedGreeksBackend",
+            "CallPutBackend",
+            "DayCount",
+            "DiffMethod",
+            "GreeksBackend",
+            "OptionType",
+            "PricingFunction",
+            "PricingModel",
+        ),
+    },
+)
@@ -1,6 +1,4 @@
-from bspx.market_data import get_stock_data
 from bspx.paths import RAW_DIR
-from bspx.visualizations import candlestick_chart
 
 
 def ensure_data_dirs() -> None:
@@ -9,6 +7,10 @@ def ensure_data_dirs() -> None:
 
 
 def main():
+    # Imported here since yfinance and plotly are slow to load
+    from bspx.market_data import get_stock_data
+    from bspx.visualizations import candlestick_chart
+
     ensure_data_dirs()
 
     tickers = ["AAPL", "GOOG", "MSFT"]
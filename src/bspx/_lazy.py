@@ -0,0 +1,30 @@
+import importlib
+import sys
+from collections.abc import Callable, Mapping
+from typing import Any
+
+
+def attach(
+    package: str, submodules: Mapping[str, tuple[str, ...]]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Module '__getattr__' and '__dir__' (PEP 562) exporting names of submodules lazily
+
+    'submodules' maps each submodule of 'package' to the names it exports. A submodule
+    is only imported when one of its names is first accessed, the value is then stored
+    on the package so later lookups skip '__getattr__' entirely.
+    """
+    owners = {name: module for module, names in submodules.items() for name in names}
+
+    def getattr_(name: str) -> Any:
+        if name not in owners:
+            raise AttributeError(f"module '{package}' has no attribute '{name}'")
+
+        value = getattr(importlib.import_module(f"{package}.{owners[name]}"), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def dir_() -> list[str]:
+        return sorted(set(vars(sys.modules[package])) | owners.keys())
+
+    return getattr_, dir_
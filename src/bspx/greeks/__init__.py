@@ -1,19 +1,62 @@
-from bspx.greeks.analytical import AnalyticalBackend
-from bspx.greeks.numerical import NumericalBackend
-from bspx.instruments import Greeks
-from bspx.types import _F64, DayCount, GreeksBackend, OptionType
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from bspx._lazy import attach
+from bspx.instruments import CallPutResult, Greeks, OptionPrice
+from bspx.metrics import METRICS
+from bspx.types import (
+    _F64,
+    BatchedGreeksBackend,
+    CallPutBackend,
+    DayCount,
+    GreeksBackend,
+    OptionType,
+    PricingModel,
+)
+
+if TYPE_CHECKING:
+    from bspx.greeks.analytical import AnalyticalBackend
+    from bspx.greeks.automatic import AutomaticBackend
+    from bspx.greeks.compiled import CompiledBackend
+    from bspx.greeks.complex_step import ComplexStepBackend
+    from bspx.greeks.numerical import NumericalBackend
+    from bspx.greeks.parallel import calculate_greeks_chunked, calculate_greeks_threaded
+    from bspx.greeks.tables import calculate_greeks_table
 
 __all__ = [
     "AnalyticalBackend",
+    "AutomaticBackend",
+    "CompiledBackend",
+    "ComplexStepBackend",
     "NumericalBackend",
     "delta",
     "gamma",
     "rho",
     "theta",
     "vega",
+    "calculate_call_put",
     "calculate_greeks",
+    "calculate_greeks_chunked",
+    "calculate_greeks_table",
+    "calculate_greeks_threaded",
 ]
 
+# Note: The backends pull in scipy (and numba for 'CompiledBackend'), so they are
+# imported when first used; the generic functions below only need NumPy
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "analytical": ("AnalyticalBackend",),
+        "automatic": ("AutomaticBackend",),
+        "compiled": ("CompiledBackend",),
+        "complex_step": ("ComplexStepBackend",),
+        "numerical": ("NumericalBackend",),
+        "parallel": ("calculate_greeks_chunked", "calculate_greeks_threaded"),
+        "tables": ("calculate_greeks_table",),
+    },
+)
+
 
 def delta(backend: GreeksBackend, option_type: OptionType = "call") -> _F64:
     return backend.delta(option_type)
@@ -43,11 +86,54 @@ def calculate_greeks(
     backend: GreeksBackend,
     option_type: OptionType = "call",
     day_count: DayCount = DayCount.CALENDAR,
+    out: Greeks | None = None,
 ) -> Greeks:
-    return Greeks(
-        delta=delta(backend, option_type),
-        theta=theta(backend, option_type, day_count),
-        gamma=gamma(backend),
-        vega=vega(backend),
-        rho=rho(backend, option_type),
+    """
+    All five Greeks from any backend
+
+    With 'out' (e.g. 'Greeks.from_records') each result is copied into its buffer, so
+    the Greeks land in one caller-owned layout without restacking. Backends that
+    implement 'BatchedGreeksBackend' compute all five in their own single pass.
+    """
+    start = METRICS.start()
+    if isinstance(backend, BatchedGreeksBackend):
+        greeks = backend.calculate_greeks(option_type, day_count)
+    else:
+        greeks = Greeks(
+            delta=delta(backend, option_type),
+            theta=theta(backend, option_type, day_count),
+            gamma=gamma(backend),
+            vega=vega(backend),
+            rho=rho(backend, option_type),
+        )
+    METRICS.stop(f"greeks.{backend.method}", start, np.size(greeks.delta))
+    if out is None:
+        return greeks
+
+    for name in ("delta", "theta", "gamma", "vega", "rho"):
+        np.copyto(getattr(out, name), getattr(greeks, name))
+    return out
+
+
+def calculate_call_put(
+    backend: GreeksBackend, day_count: DayCount = DayCount.CALENDAR
+) -> CallPutResult:
+    """
+    Prices and Greeks of both sides from any backend that can also price
+
+    Backends that implement 'CallPutBackend' (e.g. 'AnalyticalBackend') share the
+    terms common to both sides and derive the put Greeks from the call's by put-call
+    parity. Others must implement 'PricingModel' and are evaluated once per side.
+    """
+    if isinstance(backend, CallPutBackend):
+        return backend.calculate_call_put(day_count)
+    if not isinstance(backend, PricingModel):
+        raise TypeError(
+            "Error: 'backend' must implement CallPutBackend or PricingModel\n"
+            f" Got: {type(backend).__name__}"
+        )
+    return CallPutResult(
+        price=OptionPrice(call=backend.call_price(), put=backend.put_price()),
+        call=calculate_greeks(backend, "call", day_count),
+        put=calculate_greeks(backend, "put", day_count),
     )
@@ -1,4 +1,5 @@
 from bspx.greeks.formulas import analytical
+from bspx.instruments import CallPutResult, ExtendedGreeks
 from bspx.pricing import BlackScholesState
 from bspx.types import _F64, DayCount, DiffMethod, OptionType
 
@@ -9,19 +10,60 @@ class AnalyticalBackend:
     def __init__(self, state: BlackScholesState) -> None:
         self._state = state
 
-    def delta(self, option_type: OptionType = "call") -> _F64:
-        return analytical.delta(self._state, option_type)
+    def delta(self, option_type: OptionType = "call", out: _F64 | None = None) -> _F64:
+        return analytical.delta(self._state, option_type, out)
 
     def theta(
-        self, option_type: OptionType = "call", day_count: DayCount = DayCount.CALENDAR
+        self,
+        option_type: OptionType = "call",
+        day_count: DayCount = DayCount.CALENDAR,
+        out: _F64 | None = None,
     ) -> _F64:
-        return analytical.theta(self._state, option_type, day_count)
+        return analytical.theta(self._state, option_type, day_count, out)
 
-    def gamma(self) -> _F64:
-        return analytical.gamma(self._state)
+    def gamma(self, out: _F64 | None = None) -> _F64:
+        return analytical.gamma(self._state, out)
 
-    def vega(self) -> _F64:
-        return analytical.vega(self._state)
+    def vega(self, out: _F64 | None = None) -> _F64:
+        return analytical.vega(self._state, out)
 
-    def rho(self, option_type: OptionType = "call") -> _F64:
-        return analytical.rho(self._state, option_type)
+    def rho(self, option_type: OptionType = "call", out: _F64 | None = None) -> _F64:
+        return analytical.rho(self._state, option_type, out)
+
+    def calculate_call_put(
+        self,
+        day_count: DayCount = DayCount.CALENDAR,
+        out: CallPutResult | None = None,
+    ) -> CallPutResult:
+        """Call and put prices and Greeks together, see 'calculate_call_put'"""
+        return analytical.calculate_call_put(self._state, day_count, out)
+
+    def vanna(self, out: _F64 | None = None) -> _F64:
+        return analytical.vanna(self._state, out)
+
+    def volga(self, out: _F64 | None = None) -> _F64:
+        return analytical.volga(self._state, out)
+
+    def charm(
+        self, day_count: DayCount = DayCount.CALENDAR, out: _F64 | None = None
+    ) -> _F64:
+        return analytical.charm(self._state, day_count, out)
+
+    def speed(self, out: _F64 | None = None) -> _F64:
+        return analytical.speed(self._state, out)
+
+    def color(
+        self, day_count: DayCount = DayCount.CALENDAR, out: _F64 | None = None
+    ) -> _F64:
+        return analytical.color(self._state, day_count, out)
+
+    def zomma(self, out: _F64 | None = None) -> _F64:
+        return analytical.zomma(self._state, out)
+
+    def extended_greeks(
+        self,
+        day_count: DayCount = DayCount.CALENDAR,
+        out: ExtendedGreeks | None = None,
+    ) -> ExtendedGreeks:
+        """Second-order and cross Greeks from one shared pass, see 'extended_greeks'"""
+        return analytical.extended_greeks(self._state, day_count, out)
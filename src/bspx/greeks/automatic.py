@@ -0,0 +1,97 @@
+import numpy as np
+from numpy.typing import ArrayLike
+
+from bspx.greeks.formulas import automatic
+from bspx.instruments import Greeks
+from bspx.types import _F64, DayCount, DiffMethod, OptionType
+
+
+class AutomaticBackend:
+    """
+    Greeks by forward-mode automatic differentiation of any pricing function
+
+    'pricing_func' is evaluated once per option type on 'Dual' inputs, which carries
+    the exact derivatives along S, T, r and vol (and the second one along S) through
+    every operation, so all five Greeks come from a single vectorized pass without
+    bump-size error. It must be written with operators and NumPy ufuncs that support
+    Dual numbers, e.g. 'automatic.black_scholes_formula'. Expired contracts (T == 0)
+    settle to their payoff, with the analytical Greeks at expiry. Implements both
+    'PricingModel' and 'GreeksBackend'.
+    """
+
+    method = DiffMethod.AUTOMATIC
+
+    def __init__(
+        self,
+        pricing_func: automatic.DualPricingFunction,
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        vol: ArrayLike,
+    ) -> None:
+        self._pricing_func = pricing_func
+        self._S = S
+        self._K = K
+        self._T = T
+        self._r = r
+        self._vol = vol
+        self._prices: dict[OptionType, automatic.Dual] = {}
+
+    def _price(self, option_type: OptionType) -> automatic.Dual:
+        if option_type not in self._prices:
+            self._prices[option_type] = automatic.price_dual(
+                self._pricing_func,
+                self._S,
+                self._K,
+                self._T,
+                self._r,
+                self._vol,
+                option_type,
+            )
+        return self._prices[option_type]
+
+    def _any_price(self) -> automatic.Dual:
+        """Either side, for the Greeks both share by put-call parity"""
+        if not self._prices:
+            return self._price("call")
+        return next(iter(self._prices.values()))
+
+    def _read(self, x: _F64 | float, shape: tuple[int, ...]) -> _F64:
+        return np.broadcast_to(x, shape).copy()
+
+    def call_price(self) -> _F64:
+        price = self._price("call")
+        return self._read(price.value, price.shape)
+
+    def put_price(self) -> _F64:
+        price = self._price("put")
+        return self._read(price.value, price.shape)
+
+    def delta(self, option_type: OptionType = "call") -> _F64:
+        price = self._price(option_type)
+        return self._read(price.grad[automatic.SPOT], price.shape)
+
+    def theta(
+        self, option_type: OptionType = "call", day_count: DayCount = DayCount.CALENDAR
+    ) -> _F64:
+        price = self._price(option_type)
+        return -self._read(price.grad[automatic.TIME], price.shape) / day_count
+
+    def gamma(self) -> _F64:
+        price = self._any_price()
+        return self._read(price.curv, price.shape)
+
+    def vega(self) -> _F64:
+        price = self._any_price()
+        return self._read(price.grad[automatic.VOL], price.shape)
+
+    def rho(self, option_type: OptionType = "call") -> _F64:
+        price = self._price(option_type)
+        return self._read(price.grad[automatic.RATE], price.shape)
+
+    def calculate_greeks(
+        self, option_type: OptionType = "call", day_count: DayCount = DayCount.CALENDAR
+    ) -> Greeks:
+        """All five Greeks from the one evaluation of 'option_type'"""
+        return automatic.calculate_greeks(self._price(option_type), day_count)
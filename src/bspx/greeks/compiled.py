@@ -0,0 +1,86 @@
+from functools import cached_property
+
+from numpy.typing import ArrayLike
+
+from bspx.greeks.formulas import compiled
+from bspx.numeric_utils import to_f64
+from bspx.pricing.black_scholes_model import _apply_validation, _mask_invalid
+from bspx.types import _F64, DayCount, DiffMethod, OptionType, Validation
+
+
+class CompiledBackend:
+    """
+    Closed-form prices and Greeks from a single fused loop
+
+    The first request runs one kernel that fills the prices and Greeks of both option
+    sides, every later one is a lookup. The kernel is compiled with numba when it is
+    installed (and cached on disk across processes), otherwise the NumPy formulas are
+    used. Inputs are validated per 'validation' before either kernel runs. Implements
+    both 'PricingModel' and 'GreeksBackend'.
+    """
+
+    method = DiffMethod.ANALYTICAL
+
+    def __init__(
+        self,
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        vol: ArrayLike,
+        use_jit: bool | None = None,
+        validation: Validation = Validation.RAISE,
+    ) -> None:
+        # Validated here rather than on the first request, so bad inputs raise at
+        # construction like 'BlackScholesState.build'
+        self._S, self._K, self._T, self._vol, self._valid = _apply_validation(
+            to_f64(S), to_f64(K), to_f64(T), to_f64(vol), validation
+        )
+        self._r = to_f64(r)
+        self._use_jit = use_jit
+
+    @cached_property
+    def _block(self) -> _F64:
+        block = compiled.price_and_greeks(
+            self._S,
+            self._K,
+            self._T,
+            self._r,
+            self._vol,
+            self._use_jit,
+            Validation.TRUSTED,
+        )
+        return _mask_invalid(block, self._valid)
+
+    def _select(self, option_type: OptionType, call_row: int, put_row: int) -> _F64:
+        match option_type:
+            case "call":
+                return self._block[call_row]
+            case "put":
+                return self._block[put_row]
+
+    def call_price(self) -> _F64:
+        return self._block[compiled.CALL]
+
+    def put_price(self) -> _F64:
+        return self._block[compiled.PUT]
+
+    def delta(self, option_type: OptionType = "call") -> _F64:
+        return self._select(option_type, compiled.DELTA_CALL, compiled.DELTA_PUT)
+
+    def theta(
+        self, option_type: OptionType = "call", day_count: DayCount = DayCount.CALENDAR
+    ) -> _F64:
+        return (
+            self._select(option_type, compiled.THETA_CALL, compiled.THETA_PUT)
+            / day_count
+        )
+
+    def gamma(self) -> _F64:
+        return self._block[compiled.GAMMA]
+
+    def vega(self) -> _F64:
+        return self._block[compiled.VEGA]
+
+    def rho(self, option_type: OptionType = "call") -> _F64:
+        return self._select(option_type, compiled.RHO_CALL, compiled.RHO_PUT)
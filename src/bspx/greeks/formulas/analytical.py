@@ -1,62 +1,326 @@
 import numpy as np
 
-from bspx.instruments import Greeks
+from bspx.instruments import CallPutResult, ExtendedGreeks, Greeks, OptionPrice
+from bspx.metrics import METRICS
 from bspx.pricing import BlackScholesState
-from bspx.types import _F64, DayCount, OptionType
+from bspx.pricing.workspace import check_out
+from bspx.types import _F64, DayCount, OptionType, Validation
 
+# Note: Every formula accepts an optional 'out' buffer of the state's broadcast shape.
+# Results are evaluated in place there and intermediate terms go to the state's
+# scratch buffers, so a state built on a 'PricingWorkspace' allocates nothing.
 
-def delta(state: BlackScholesState, option_type: OptionType = "call") -> _F64:
+
+def _output(state: BlackScholesState, out: _F64 | None) -> _F64:
+    if out is None:
+        return np.empty(state.shape, dtype=state.precision.dtype)
+    return check_out(out, state.shape, state.precision.dtype)
+
+
+def _zero_expired(state: BlackScholesState, result: _F64) -> _F64:
+    """Sets the Greeks of expired contracts, whose formulas divide by T, to zero"""
+    if not state.live.all():
+        np.copyto(result, 0.0, where=~state.live)
+    return result
+
+
+def delta(
+    state: BlackScholesState, option_type: OptionType = "call", out: _F64 | None = None
+) -> _F64:
     match option_type:
         case "call":
-            return state.cdf_d1
+            if out is None:
+                return state.cdf_d1
+            np.copyto(_output(state, out), state.cdf_d1)
+            return out
         case "put":
-            return -state.cdf_nd1
+            return np.negative(state.cdf_nd1, out=_output(state, out))
 
 
 def theta(
     state: BlackScholesState,
     option_type: OptionType = "call",
     day_count: DayCount = DayCount.CALENDAR,
+    out: _F64 | None = None,
 ) -> _F64:
-    decay = np.where(
-        state.T > 0, (-state.S * state.pdf_d1 * state.vol) / (2 * state.sqrt_t), 0.0
-    )
-    discount = state.K * state.discount
+    # decay = -S * f(d1) * vol / (2 * sqrt(T)), zero for expired contracts
+    decay = np.multiply(state.S, state.pdf_d1, out=_output(state, out))
+    decay *= state.vol
+    decay *= -0.5
+    np.divide(decay, state.sqrt_t, out=decay, where=state.live)
+    if not state.live.all():
+        np.copyto(decay, 0.0, where=~state.live)
+
+    carry = np.multiply(state.r, state.strike_pv, out=state.scratch("greek_scratch"))
 
     match option_type:
         case "call":
-            return (decay - state.r * discount * state.cdf_d2) / day_count
+            carry *= state.cdf_d2
+            decay -= carry
         case "put":
-            return (decay + state.r * discount * state.cdf_nd2) / day_count
+            carry *= state.cdf_nd2
+            decay += carry
+
+    decay /= day_count
+    return decay
 
 
-def gamma(state: BlackScholesState) -> _F64:
-    return state.pdf_d1 / (state.S * state.vol_sqrt_t)
+def gamma(state: BlackScholesState, out: _F64 | None = None) -> _F64:
+    result = np.multiply(state.S, state.vol_sqrt_t, out=_output(state, out))
+    return np.divide(state.pdf_d1, result, out=result)
 
 
-def vega(state: BlackScholesState) -> _F64:
-    return state.S * state.sqrt_t * state.pdf_d1
+def vega(state: BlackScholesState, out: _F64 | None = None) -> _F64:
+    result = np.multiply(state.S, state.sqrt_t, out=_output(state, out))
+    result *= state.pdf_d1
+    return result
 
 
-def rho(state: BlackScholesState, option_type: OptionType = "call") -> _F64:
-    scale = state.K * state.T * state.discount
+def rho(
+    state: BlackScholesState, option_type: OptionType = "call", out: _F64 | None = None
+) -> _F64:
+    result = np.multiply(state.T, state.strike_pv, out=_output(state, out))
 
     match option_type:
         case "call":
-            return scale * state.cdf_d2
+            result *= state.cdf_d2
         case "put":
-            return -scale * state.cdf_nd2
+            result *= state.cdf_nd2
+            np.negative(result, out=result)
+    return result
 
 
 def calculate_greeks(
     state: BlackScholesState,
     option_type: OptionType,
     day_count: DayCount = DayCount.CALENDAR,
+    out: Greeks | None = None,
 ) -> Greeks:
+    start = METRICS.start()
+    greeks = Greeks(
+        delta=delta(state, option_type, None if out is None else out.delta),
+        theta=theta(state, option_type, day_count, None if out is None else out.theta),
+        gamma=gamma(state, None if out is None else out.gamma),
+        vega=vega(state, None if out is None else out.vega),
+        rho=rho(state, option_type, None if out is None else out.rho),
+    )
+    METRICS.stop("greeks.analytical", start, greeks.delta.size)
+    return greeks
+
+
+def greeks_at_expiry(
+    S: _F64,
+    K: _F64,
+    r: _F64,
+    vol: _F64,
+    option_type: OptionType,
+    day_count: DayCount = DayCount.CALENDAR,
+) -> Greeks:
+    """
+    Greeks of expired contracts (T = 0), for the backends that cannot evaluate there
+
+    Read from a state at T = 0 like the analytical Greeks, except gamma, which is zero
+    there like the second-order Greeks below
+    """
+    state = BlackScholesState.build(S, K, 0.0, r, vol, validation=Validation.TRUSTED)
     return Greeks(
-        delta=delta(state, option_type),
+        delta=delta(state, option_type, _output(state, None)),
         theta=theta(state, option_type, day_count),
-        gamma=gamma(state),
+        gamma=np.zeros(state.shape),
         vega=vega(state),
         rho=rho(state, option_type),
     )
+
+
+def calculate_call_put(
+    state: BlackScholesState,
+    day_count: DayCount = DayCount.CALENDAR,
+    out: CallPutResult | None = None,
+) -> CallPutResult:
+    """
+    Prices and Greeks of the call and the put in one pass over the state
+
+    The call side is evaluated as usual. The put price, delta and rho read the tails
+    N(-d1) and N(-d2) that the state evaluates once, since a parity shift from the
+    call cancels to rounding noise for deep out of the money puts. Theta is shifted
+    from the call's by put-call parity:
+
+        theta:  theta_call + r * K * exp{-rT} / day_count
+
+    Gamma and vega are the same for both sides and are copied into the put's arrays,
+    so the two sides never share a buffer.
+    """
+    start = METRICS.start()
+    call_price = state.call_price(None if out is None else out.price.call)
+    call = calculate_greeks(state, "call", day_count, None if out is None else out.call)
+
+    def buffer(name: str) -> _F64:
+        return _output(state, None if out is None else getattr(out.put, name))
+
+    put_price = state.put_price(None if out is None else out.price.put)
+    put_delta = delta(state, "put", buffer("delta"))
+    put_rho = rho(state, "put", buffer("rho"))
+
+    carry = np.multiply(state.r, state.strike_pv, out=state.scratch("greek_scratch"))
+    carry /= day_count
+    put_theta = np.add(call.theta, carry, out=buffer("theta"))
+
+    put_gamma, put_vega = buffer("gamma"), buffer("vega")
+    np.copyto(put_gamma, call.gamma)
+    np.copyto(put_vega, call.vega)
+
+    METRICS.stop("greeks.call_put", start, put_price.size)
+    return CallPutResult(
+        price=OptionPrice(call=call_price, put=put_price),
+        call=call,
+        put=Greeks(
+            delta=put_delta,
+            theta=put_theta,
+            gamma=put_gamma,
+            vega=put_vega,
+            rho=put_rho,
+        ),
+    )
+
+
+# Note: The second-order Greeks below are zero for expired contracts (T = 0), where
+# their closed forms divide by T or sqrt(T). Charm and color, like theta, measure the
+# change as time passes, so they are -d/dT scaled to 'day_count'.
+
+
+def vanna(state: BlackScholesState, out: _F64 | None = None) -> _F64:
+    # vanna = -f(d1) * d2 / vol
+    result = np.multiply(state.pdf_d1, state.d2, out=_output(state, out))
+    np.divide(result, state.vol, out=result)
+    np.negative(result, out=result)
+    return _zero_expired(state, result)
+
+
+def volga(state: BlackScholesState, out: _F64 | None = None) -> _F64:
+    # volga = vega * d1 * d2 / vol
+    result = vega(state, out)
+    result *= state.d1
+    result *= state.d2
+    np.divide(result, state.vol, out=result)
+    return _zero_expired(state, result)
+
+
+def _time_drift(state: BlackScholesState, out: _F64) -> _F64:
+    """r / (vol * sqrt(T)) - d2 / (2 * T), the rate at which d1 moves as time passes"""
+    half_d2_over_t = np.multiply(state.d2, 0.5, out=state.scratch("greek_scratch"))
+    np.divide(half_d2_over_t, state.T, out=half_d2_over_t, where=state.live)
+    np.divide(state.r, state.vol_sqrt_t, out=out, where=state.live)
+    out -= half_d2_over_t
+    return out
+
+
+def charm(
+    state: BlackScholesState,
+    day_count: DayCount = DayCount.CALENDAR,
+    out: _F64 | None = None,
+) -> _F64:
+    # charm = -f(d1) * (r / (vol * sqrt(T)) - d2 / (2 * T)), the same for both sides
+    # since the put delta is the call delta minus one
+    result = _time_drift(state, _output(state, out))
+    result *= state.pdf_d1
+    result /= -day_count
+    return _zero_expired(state, result)
+
+
+def _gamma_live(state: BlackScholesState, out: _F64 | None = None) -> _F64:
+    """Gamma evaluated for live contracts only, left for '_zero_expired' elsewhere"""
+    result = np.multiply(state.S, state.vol_sqrt_t, out=_output(state, out))
+    return np.divide(state.pdf_d1, result, out=result, where=state.live)
+
+
+def speed(state: BlackScholesState, out: _F64 | None = None) -> _F64:
+    # speed = -gamma / S * (d1 / (vol * sqrt(T)) + 1)
+    result = np.divide(
+        state.d1, state.vol_sqrt_t, out=_output(state, out), where=state.live
+    )
+    result += 1.0
+    result *= _gamma_live(state, state.scratch("greek_scratch"))
+    np.divide(result, state.S, out=result)
+    np.negative(result, out=result)
+    return _zero_expired(state, result)
+
+
+def color(
+    state: BlackScholesState,
+    day_count: DayCount = DayCount.CALENDAR,
+    out: _F64 | None = None,
+) -> _F64:
+    # color = gamma * (1 / (2 * T) + d1 * (r / (vol * sqrt(T)) - d2 / (2 * T)))
+    result = _time_drift(state, _output(state, out))
+    result *= state.d1
+    inv_2t = np.divide(
+        0.5, state.T, out=state.scratch("greek_scratch"), where=state.live
+    )
+    result += inv_2t
+    result *= _gamma_live(state, inv_2t)
+    result /= day_count
+    return _zero_expired(state, result)
+
+
+def zomma(state: BlackScholesState, out: _F64 | None = None) -> _F64:
+    # zomma = gamma * (d1 * d2 - 1) / vol
+    result = np.multiply(state.d1, state.d2, out=_output(state, out))
+    result -= 1.0
+    result *= _gamma_live(state, state.scratch("greek_scratch"))
+    np.divide(result, state.vol, out=result)
+    return _zero_expired(state, result)
+
+
+def extended_greeks(
+    state: BlackScholesState,
+    day_count: DayCount = DayCount.CALENDAR,
+    out: ExtendedGreeks | None = None,
+) -> ExtendedGreeks:
+    """
+    Vanna, volga, charm, speed, color and zomma in one pass over the state
+
+    Gamma, d1 * d2 and the time drift of d1 are evaluated once and shared, where the
+    separate formulas would each rebuild them.
+    """
+    start = METRICS.start()
+    gamma_ = _gamma_live(state, state.scratch("extended_gamma"))
+    d1_d2 = np.multiply(state.d1, state.d2, out=state.scratch("extended_d1_d2"))
+    drift = _time_drift(state, state.scratch("extended_drift"))
+
+    def buffer(name: str) -> _F64:
+        return _output(state, None if out is None else getattr(out, name))
+
+    vanna_ = np.multiply(state.pdf_d1, state.d2, out=buffer("vanna"))
+    np.divide(vanna_, state.vol, out=vanna_)
+    np.negative(vanna_, out=vanna_)
+
+    # volga = vega * d1 * d2 / vol = -vanna * S * sqrt(T) * d1
+    volga_ = np.multiply(state.S, state.sqrt_t, out=buffer("volga"))
+    volga_ *= state.d1
+    volga_ *= vanna_
+    np.negative(volga_, out=volga_)
+
+    charm_ = np.multiply(drift, state.pdf_d1, out=buffer("charm"))
+    charm_ /= -day_count
+
+    speed_ = np.divide(
+        state.d1, state.vol_sqrt_t, out=buffer("speed"), where=state.live
+    )
+    speed_ += 1.0
+    speed_ *= gamma_
+    np.divide(speed_, state.S, out=speed_)
+    np.negative(speed_, out=speed_)
+
+    color_ = np.multiply(drift, state.d1, out=buffer("color"))
+    color_ += np.divide(0.5, state.T, out=drift, where=state.live)
+    color_ *= gamma_
+    color_ /= day_count
+
+    zomma_ = np.subtract(d1_d2, 1.0, out=buffer("zomma"))
+    zomma_ *= gamma_
+    np.divide(zomma_, state.vol, out=zomma_)
+
+    for greek in (vanna_, volga_, charm_, speed_, color_, zomma_):
+        _zero_expired(state, greek)
+    METRICS.stop("greeks.extended", start, vanna_.size)
+    return ExtendedGreeks(vanna_, volga_, charm_, speed_, color_, zomma_)
@@ -0,0 +1,277 @@
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+from numpy.lib.mixins import NDArrayOperatorsMixin
+from numpy.typing import ArrayLike, NDArray
+
+from bspx.instruments import Greeks
+from bspx.numeric_utils import norm_cdf, norm_pdf, to_f64
+from bspx.types import _F64, DayCount, OptionType, Validation
+
+# Seed directions of the inputs, the rows of 'Dual.grad'. Spot comes first since
+# 'Dual.curv' follows the second derivative along the first direction only.
+SPOT, TIME, RATE, VOL = range(4)
+N_DIRECTIONS = 4
+
+# Unary rules as (f, f', f'') of the input value 'a' and the result 'v' = f(a)
+type _Rule = tuple[
+    Callable[[_F64], _F64],
+    Callable[[_F64, _F64], _F64 | float],
+    Callable[[_F64, _F64], _F64 | float],
+]
+
+_UNARY: dict[str, _Rule] = {
+    "negative": (np.negative, lambda a, v: -1.0, lambda a, v: 0.0),
+    "positive": (np.positive, lambda a, v: 1.0, lambda a, v: 0.0),
+    "exp": (np.exp, lambda a, v: v, lambda a, v: v),
+    "log": (np.log, lambda a, v: 1.0 / a, lambda a, v: -1.0 / np.square(a)),
+    "sqrt": (np.sqrt, lambda a, v: 0.5 / v, lambda a, v: -0.25 / (v * a)),
+    "square": (np.square, lambda a, v: 2.0 * a, lambda a, v: 2.0),
+    "reciprocal": (
+        np.reciprocal,
+        lambda a, v: -np.square(v),
+        lambda a, v: 2.0 * v * np.square(v),
+    ),
+    "ndtr": (norm_cdf, lambda a, v: norm_pdf(a), lambda a, v: -a * norm_pdf(a)),
+}
+
+
+# Time to expiry that expired contracts are evaluated at before they are settled
+_EXPIRED_PLACEHOLDER_T: float = 1.0
+
+_UNSUPPORTED_FUNC: str = (
+    "Error: 'pricing_func' must compute its price from the inputs with operators and "
+    "ufuncs that support Dual numbers"
+)
+
+
+class Dual(NDArrayOperatorsMixin):
+    """
+    Forward-mode dual number over a NumPy array
+
+    Parameters:
+
+        value:  Function value, of the batch shape
+        grad:   First derivatives along each seed direction, (N_DIRECTIONS, *shape)
+        curv:   Second derivative along the first seed direction (spot), for gamma
+
+    Arithmetic operators and the ufuncs in '_UNARY' (plus 'add', 'subtract',
+    'multiply', 'divide' and 'power' with a constant exponent) propagate the
+    derivatives exactly, so any function written with them can be differentiated by
+    evaluating it once on Dual inputs. Other ufuncs raise a TypeError.
+    """
+
+    __slots__ = ("curv", "grad", "value")
+
+    def __init__(self, value: _F64, grad: _F64, curv: _F64 | float = 0.0) -> None:
+        self.value = value
+        self.grad = grad
+        self.curv = curv
+
+    @classmethod
+    def seed(cls, x: ArrayLike, direction: int, shape: tuple[int, ...]) -> "Dual":
+        """Independent variable 'x', broadcast to 'shape', along seed 'direction'"""
+        grad = np.zeros((N_DIRECTIONS, *shape), dtype=np.float64)
+        grad[direction] = 1.0
+        return cls(np.broadcast_to(to_f64(x), shape), grad)
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return np.shape(self.value)
+
+    @property
+    def size(self) -> int:
+        return np.size(self.value)
+
+    def __repr__(self) -> str:
+        return f"Dual(value={self.value}, grad={self.grad}, curv={self.curv})"
+
+    def _unary(self, rule: _Rule) -> "Dual":
+        f, df, d2f = rule
+        value = f(self.value)
+        d1, d2 = df(self.value, value), d2f(self.value, value)
+        return Dual(
+            value,
+            d1 * self.grad,
+            d2 * np.square(self.grad[SPOT]) + d1 * self.curv,
+        )
+
+    def _scale(self, c: Any, value: _F64) -> "Dual":
+        return Dual(value, c * self.grad, c * self.curv)
+
+    def __array_ufunc__(
+        self, ufunc: np.ufunc, method: str, *inputs: Any, **kwargs: Any
+    ) -> Any:
+        if method != "__call__" or kwargs.get("out") is not None:
+            return NotImplemented
+        name = ufunc.__name__
+
+        if name in _UNARY:
+            return self._unary(_UNARY[name])
+
+        a, b = inputs
+        a_dual, b_dual = isinstance(a, Dual), isinstance(b, Dual)
+        match name:
+            case "add":
+                return _add(a, b, a_dual, b_dual, 1.0)
+            case "subtract":
+                return _add(a, b, a_dual, b_dual, -1.0)
+            case "multiply":
+                return _multiply(a, b, a_dual, b_dual)
+            case "divide":
+                if not b_dual:
+                    return a._scale(1.0 / b, a.value / b)
+                return _multiply(a, b._unary(_UNARY["reciprocal"]), a_dual, True)
+            case "power" if a_dual and not b_dual:
+                p = b
+                return a._unary(
+                    (
+                        lambda x: np.power(x, p),
+                        lambda x, v: p * np.power(x, p - 1),
+                        lambda x, v: p * (p - 1) * np.power(x, p - 2),
+                    )
+                )
+        return NotImplemented
+
+
+def _add(a: Any, b: Any, a_dual: bool, b_dual: bool, sign: float) -> Dual:
+    """a + sign * b"""
+    if not b_dual:
+        return Dual(a.value + sign * b, a.grad, a.curv)
+    if not a_dual:
+        return b._scale(sign, a + sign * b.value)
+    return Dual(
+        a.value + sign * b.value, a.grad + sign * b.grad, a.curv + sign * b.curv
+    )
+
+
+def _multiply(a: Any, b: Any, a_dual: bool, b_dual: bool) -> Dual:
+    if not b_dual:
+        return a._scale(b, a.value * b)
+    if not a_dual:
+        return b._scale(a, a * b.value)
+    return Dual(
+        a.value * b.value,
+        a.grad * b.value + a.value * b.grad,
+        a.curv * b.value + 2.0 * a.grad[SPOT] * b.grad[SPOT] + a.value * b.curv,
+    )
+
+
+# Pricing function that 'price_dual' evaluates: S, T, r and vol are seeded Duals, K
+# stays a float64 array
+type DualPricingFunction = Callable[[Dual, _F64, Dual, Dual, Dual, OptionType], Any]
+
+
+def black_scholes_formula(
+    S: Any, K: Any, T: Any, r: Any, vol: Any, option_type: OptionType = "call"
+) -> Any:
+    """
+    Black-Scholes price written with plain operators and ufuncs only
+
+    Accepts arrays and 'Dual' numbers alike, for contracts with T > 0: at T == 0 it
+    divides by zero, 'price_dual' settles those contracts separately. The fused
+    'black_scholes_price' is faster on floats but writes into float64 buffers, which
+    a Dual cannot flow through.
+    """
+    vol_sqrt_t = vol * np.sqrt(T)
+    d1 = (np.log(S / K) + (r + 0.5 * np.square(vol)) * T) / vol_sqrt_t
+    d2 = d1 - vol_sqrt_t
+    strike_pv = K * np.exp(-r * T)
+
+    match option_type:
+        case "call":
+            return S * norm_cdf(d1) - strike_pv * norm_cdf(d2)
+        case "put":
+            return strike_pv * norm_cdf(-d2) - S * norm_cdf(-d1)
+
+
+def _settle_expired(
+    price: Dual,
+    inputs: tuple[_F64, _F64, _F64, _F64],
+    expired: NDArray[np.bool_],
+    option_type: OptionType,
+) -> Dual:
+    """
+    Expired contracts priced at their payoff, with the Greeks the analytical formulas
+    give at T == 0 and a zero second derivative
+    """
+    # Imported here since bspx.pricing is only needed once a contract has expired
+    from bspx.greeks.formulas.analytical import greeks_at_expiry
+    from bspx.pricing import black_scholes_price
+
+    shape = price.shape
+    expired = np.broadcast_to(expired, shape)
+    S, K, r, vol = (np.broadcast_to(x, shape)[expired] for x in inputs)
+
+    value = np.array(np.broadcast_to(price.value, shape))
+    value[expired] = black_scholes_price(
+        S, K, 0.0, r, vol, option_type, validation=Validation.TRUSTED
+    )
+
+    at_expiry = greeks_at_expiry(S, K, r, vol, option_type, DayCount.CALENDAR)
+    grad = np.array(np.broadcast_to(price.grad, (N_DIRECTIONS, *shape)))
+    grad[SPOT, expired] = at_expiry.delta
+    # The analytical theta is per day, the derivative along T is per year and opposite
+    grad[TIME, expired] = np.multiply(at_expiry.theta, -DayCount.CALENDAR)
+    grad[RATE, expired] = at_expiry.rho
+    grad[VOL, expired] = at_expiry.vega
+
+    curv = np.array(np.broadcast_to(price.curv, shape))
+    curv[expired] = at_expiry.gamma
+    return Dual(value, grad, curv)
+
+
+def price_dual(
+    pricing_func: DualPricingFunction,
+    S: ArrayLike,
+    K: ArrayLike,
+    T: ArrayLike,
+    r: ArrayLike,
+    vol: ArrayLike,
+    option_type: OptionType = "call",
+) -> Dual:
+    """
+    Price with its derivatives along S, T, r and vol, from one evaluation
+
+    A Dual formula cannot branch on T, so expired contracts (T == 0) are evaluated at
+    a placeholder and then settled to their payoff, with the analytical Greeks at
+    expiry
+    """
+    S_, K_, T_, r_, vol_ = (to_f64(x) for x in (S, K, T, r, vol))
+    shape = np.broadcast_shapes(S_.shape, K_.shape, T_.shape, r_.shape, vol_.shape)
+    expired = np.equal(T_, 0.0)
+    if expired.any():
+        T_ = np.where(expired, _EXPIRED_PLACEHOLDER_T, T_)
+
+    # Seeds share the batch shape, so the direction axis of every gradient lines up
+    try:
+        price = pricing_func(
+            Dual.seed(S_, SPOT, shape),
+            K_,
+            Dual.seed(T_, TIME, shape),
+            Dual.seed(r_, RATE, shape),
+            Dual.seed(vol_, VOL, shape),
+            option_type,
+        )
+    except TypeError as error:
+        # e.g. 'black_scholes_price', whose float64 conversion rejects a Dual
+        raise TypeError(f"{_UNSUPPORTED_FUNC}\n Got: {error}") from error
+
+    if not isinstance(price, Dual):
+        raise TypeError(f"{_UNSUPPORTED_FUNC}\n Got: {type(price)}")
+    if expired.any():
+        return _settle_expired(price, (S_, K_, r_, vol_), expired, option_type)
+    return price
+
+
+def calculate_greeks(price: Dual, day_count: DayCount = DayCount.CALENDAR) -> Greeks:
+    """All five Greeks read from the derivatives of a priced Dual"""
+    shape = price.shape
+    return Greeks(
+        delta=np.broadcast_to(price.grad[SPOT], shape).copy(),
+        theta=-np.broadcast_to(price.grad[TIME], shape) / day_count,
+        gamma=np.broadcast_to(price.curv, shape).copy(),
+        vega=np.broadcast_to(price.grad[VOL], shape).copy(),
+        rho=np.broadcast_to(price.grad[RATE], shape).copy(),
+    )
@@ -0,0 +1,142 @@
+import importlib.util
+import math
+from collections.abc import Callable
+from functools import cache
+
+import numpy as np
+
+from bspx.greeks.formulas import analytical
+from bspx.pricing import BlackScholesState
+from bspx.pricing.black_scholes_model import _apply_validation, _mask_invalid
+from bspx.types import _F64, DayCount, Validation
+
+# Only looked up here, numba itself is imported when the kernel is first compiled
+NUMBA_AVAILABLE: bool = importlib.util.find_spec("numba") is not None
+
+# Rows of the block returned by 'price_and_greeks', theta is per year
+(
+    CALL,
+    PUT,
+    DELTA_CALL,
+    DELTA_PUT,
+    GAMMA,
+    VEGA,
+    THETA_CALL,
+    THETA_PUT,
+    RHO_CALL,
+    RHO_PUT,
+) = range(10)
+N_OUTPUTS: int = 10
+
+_INV_SQRT_2: float = 1.0 / math.sqrt(2.0)
+_INV_SQRT_2PI: float = 1.0 / math.sqrt(2.0 * math.pi)
+
+
+def _kernel(
+    S: _F64, K: _F64, T: _F64, r: _F64, vol: _F64, out: _F64
+) -> None:  # pragma: no cover - compiled by numba
+    """
+    Prices and Greeks of both sides in one pass over the contracts
+
+    Mirrors 'BlackScholesState' and 'formulas.analytical' exactly, including the d1
+    placeholders for expired contracts
+    """
+    for i in range(S.shape[0]):
+        s, k, t, rate, v = S[i], K[i], T[i], r[i], vol[i]
+        sqrt_t = math.sqrt(t)
+        vol_sqrt_t = v * sqrt_t
+        discount = math.exp(-rate * t)
+        strike_pv = k * discount
+
+        if t > 0:
+            d1 = (math.log(s / k) + (rate + 0.5 * v * v) * t) / vol_sqrt_t
+        else:
+            d1 = 1e10 if s >= k else 1e-10
+        d2 = d1 - vol_sqrt_t
+
+        cdf_d1 = 0.5 * math.erfc(-d1 * _INV_SQRT_2)
+        cdf_d2 = 0.5 * math.erfc(-d2 * _INV_SQRT_2)
+        cdf_nd1 = 1.0 - cdf_d1
+        cdf_nd2 = 1.0 - cdf_d2
+        pdf_d1 = _INV_SQRT_2PI * math.exp(-0.5 * d1 * d1)
+
+        if t > 0:
+            out[CALL, i] = s * cdf_d1 - strike_pv * cdf_d2
+            out[PUT, i] = strike_pv * cdf_nd2 - s * cdf_nd1
+            decay = -s * pdf_d1 * v / (2.0 * sqrt_t)
+        else:
+            out[CALL, i] = max(s - strike_pv, 0.0)
+            out[PUT, i] = max(strike_pv - s, 0.0)
+            decay = 0.0
+
+        out[DELTA_CALL, i] = cdf_d1
+        out[DELTA_PUT, i] = -cdf_nd1
+        out[GAMMA, i] = pdf_d1 / (s * vol_sqrt_t)
+        out[VEGA, i] = s * sqrt_t * pdf_d1
+        out[THETA_CALL, i] = decay - rate * strike_pv * cdf_d2
+        out[THETA_PUT, i] = decay + rate * strike_pv * cdf_nd2
+        out[RHO_CALL, i] = strike_pv * t * cdf_d2
+        out[RHO_PUT, i] = -strike_pv * t * cdf_nd2
+
+
+@cache
+def _compiled_kernel() -> Callable[..., None]:
+    import numba
+
+    # cache=True writes the machine code next to this module (or to NUMBA_CACHE_DIR),
+    # so new processes load it instead of recompiling
+    return numba.njit(cache=True, error_model="numpy", nogil=True)(_kernel)
+
+
+def _numpy_kernel(S: _F64, K: _F64, T: _F64, r: _F64, vol: _F64, out: _F64) -> None:
+    # The inputs were validated by 'price_and_greeks'
+    state = BlackScholesState.build(S, K, T, r, vol, validation=Validation.TRUSTED)
+    state.call_price(out=out[CALL, ...])
+    state.put_price(out=out[PUT, ...])
+    analytical.delta(state, "call", out=out[DELTA_CALL, ...])
+    analytical.delta(state, "put", out=out[DELTA_PUT, ...])
+    analytical.gamma(state, out=out[GAMMA, ...])
+    analytical.vega(state, out=out[VEGA, ...])
+    analytical.theta(state, "call", DayCount.CALENDAR, out=out[THETA_CALL, ...])
+    analytical.theta(state, "put", DayCount.CALENDAR, out=out[THETA_PUT, ...])
+    # The block holds theta per year, 'analytical.theta' returns it per day
+    out[THETA_CALL : THETA_PUT + 1, ...] *= DayCount.CALENDAR
+    analytical.rho(state, "call", out=out[RHO_CALL, ...])
+    analytical.rho(state, "put", out=out[RHO_PUT, ...])
+
+
+def price_and_greeks(
+    S: _F64,
+    K: _F64,
+    T: _F64,
+    r: _F64,
+    vol: _F64,
+    use_jit: bool | None = None,
+    validation: Validation = Validation.RAISE,
+) -> _F64:
+    """
+    (N_OUTPUTS, *shape) block with the prices and Greeks of both option sides
+
+    'use_jit' defaults to the compiled kernel when numba is installed and to the
+    NumPy formulas otherwise. The inputs are validated once, before either kernel,
+    so both paths raise on (or under MASK, return NaN for) the same contracts.
+    """
+    use_jit = NUMBA_AVAILABLE if use_jit is None else use_jit
+    if use_jit and not NUMBA_AVAILABLE:
+        raise ImportError("Error: 'use_jit=True' requires numba to be installed")
+
+    shape = np.broadcast_shapes(S.shape, K.shape, T.shape, r.shape, vol.shape)
+    out = np.empty((N_OUTPUTS, *shape), dtype=np.float64)
+    S, K, T, vol, valid = _apply_validation(S, K, T, vol, validation)
+
+    if not use_jit:
+        _numpy_kernel(S, K, T, r, vol, out)
+        return _mask_invalid(out, valid)
+
+    # The compiled loop runs over flat, equally sized, contiguous inputs
+    flat = [
+        np.ascontiguousarray(np.broadcast_to(x, shape)).ravel()
+        for x in (S, K, T, r, vol)
+    ]
+    _compiled_kernel()(*flat, out.reshape(N_OUTPUTS, -1))
+    return _mask_invalid(out, valid)
@@ -0,0 +1,280 @@
+from dataclasses import fields
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from bspx.greeks.formulas.analytical import greeks_at_expiry
+from bspx.instruments import Greeks
+from bspx.numeric_utils import norm_cdf, to_f64
+from bspx.pricing.chunked import block_inputs, block_slices
+from bspx.types import _F64, DayCount, OptionType, PricingFunction
+
+# Note: The imaginary step never meets a subtraction, so it can be made far smaller
+# than any finite difference bump without cancellation error: Im f(x + ih) / h is
+# f'(x) to machine precision once h^2 is negligible against x^2
+STEP = 1e-20
+
+# Gamma has no subtraction-free complex step formula. It is read from the two points
+# x +/- h * e^(i * pi / 4), whose sum has imaginary part f''(x) * h^2 + O(h^6): only
+# the f'(x) * h terms cancel, so at the relative step of central differences gamma is
+# accurate to about 1e-9 instead of 1e-4
+GAMMA_STEP = 1e-4
+MIN_GAMMA_STEP = 1e-6
+_DIAGONAL: complex = np.exp(0.25j * np.pi)
+
+CALL_OPTION = "call"
+
+# Time to expiry that expired contracts are evaluated at before they are settled
+_EXPIRED_PLACEHOLDER_T: float = 1.0
+
+
+def to_c128(x: ArrayLike) -> NDArray[np.complex128]:
+    """'x' as a complex128 array, real inputs are converted like 'to_f64'"""
+    if np.iscomplexobj(x):
+        return np.asarray(x, dtype=np.complex128)
+    return to_f64(x).astype(np.complex128)
+
+
+def black_scholes_complex(
+    S: ArrayLike,
+    K: ArrayLike,
+    T: ArrayLike,
+    r: ArrayLike,
+    vol: ArrayLike,
+    option_type: OptionType = "call",
+) -> NDArray[np.complex128]:
+    """
+    Black-Scholes price of complex inputs, for complex step differentiation
+
+    Every step is analytic in the inputs: the CDF is the complex 'ndtr' loop (an erfc
+    of complex argument). Expired contracts (T == 0) are evaluated at a placeholder
+    and then settled to their payoff, whose Greeks the complex steps cannot read, so
+    the Greek functions below take them from 'greeks_at_expiry'. The d1/d2 buffers
+    are reused in place as in the real pricing kernel.
+    """
+    S_, K_, T_, r_, vol_ = (to_c128(x) for x in (S, K, T, r, vol))
+    shape = np.broadcast_shapes(S_.shape, K_.shape, T_.shape, r_.shape, vol_.shape)
+    expired = np.equal(T_.real, 0.0)
+    if expired.any():
+        T_ = np.where(expired, _EXPIRED_PLACEHOLDER_T, T_)
+
+    vol_sqrt_t = vol_ * np.sqrt(T_)
+    d1 = np.empty(shape, dtype=np.complex128)
+    np.divide(S_, K_, out=d1)
+    np.log(d1, out=d1)
+    d1 += (r_ + 0.5 * np.square(vol_)) * T_
+    d1 /= vol_sqrt_t
+    d2 = np.subtract(d1, vol_sqrt_t, out=np.empty_like(d1))
+    strike_pv = K_ * np.exp(-r_ * T_)
+
+    match option_type:
+        case "call":
+            norm_cdf(d1, out=d1)
+            norm_cdf(d2, out=d2)
+            d1 *= S_
+            d2 *= strike_pv
+            price = np.subtract(d1, d2, out=d1)
+            payoff = np.subtract(S_, K_)
+        case "put":
+            np.negative(d1, out=d1)
+            np.negative(d2, out=d2)
+            norm_cdf(d1, out=d1)
+            norm_cdf(d2, out=d2)
+            d1 *= S_
+            d2 *= strike_pv
+            price = np.subtract(d2, d1, out=d1)
+            payoff = np.subtract(K_, S_)
+
+    if expired.any():
+        payoff = np.where(payoff.real > 0.0, payoff, 0.0)
+        np.copyto(price, np.broadcast_to(payoff, shape), where=expired)
+    return price
+
+
+def _settle_expired(
+    result: _F64,
+    name: str,
+    S: ArrayLike,
+    K: ArrayLike,
+    T: ArrayLike,
+    r: ArrayLike,
+    vol: ArrayLike,
+    option_type: OptionType = CALL_OPTION,
+    day_count: DayCount = DayCount.CALENDAR,
+) -> _F64:
+    """Greek 'name' of expired contracts (T == 0) set to its analytical value there"""
+    expired = np.broadcast_to(np.equal(to_f64(T), 0.0), result.shape)
+    if expired.any():
+        result = np.asarray(result)
+        S_, K_, r_, vol_ = (
+            np.broadcast_to(to_f64(x), result.shape)[expired] for x in (S, K, r, vol)
+        )
+        at_expiry = greeks_at_expiry(S_, K_, r_, vol_, option_type, day_count)
+        result[expired] = getattr(at_expiry, name)
+    return result
+
+
+def _gamma_step(S: _F64) -> _F64:
+    return np.maximum(np.abs(S) * GAMMA_STEP, MIN_GAMMA_STEP)
+
+
+def delta_cs(
+    pricing_func: PricingFunction,
+    S: ArrayLike,
+    K: ArrayLike,
+    T: ArrayLike,
+    r: ArrayLike,
+    vol: ArrayLike,
+    option_type: OptionType = "call",
+) -> _F64:
+    price = pricing_func(to_f64(S) + 1j * STEP, K, T, r, vol, option_type)
+    return _settle_expired(np.imag(price) / STEP, "delta", S, K, T, r, vol, option_type)
+
+
+def theta_cs(
+    pricing_func: PricingFunction,
+    S: ArrayLike,
+    K: ArrayLike,
+    T: ArrayLike,
+    r: ArrayLike,
+    vol: ArrayLike,
+    option_type: OptionType = "call",
+    day_count: DayCount = DayCount.CALENDAR,
+) -> _F64:
+    price = pricing_func(S, K, to_f64(T) + 1j * STEP, r, vol, option_type)
+    theta = -np.imag(price) / (STEP * day_count)
+    return _settle_expired(theta, "theta", S, K, T, r, vol, option_type, day_count)
+
+
+def gamma_cs(
+    pricing_func: PricingFunction,
+    S: ArrayLike,
+    K: ArrayLike,
+    T: ArrayLike,
+    r: ArrayLike,
+    vol: ArrayLike,
+) -> _F64:
+    S_ = to_f64(S)
+    h = _gamma_step(S_)
+
+    # Note: Gamma is identical for call and put options due to Put-Call parity
+    price_up = pricing_func(S_ + h * _DIAGONAL, K, T, r, vol, CALL_OPTION)
+    price_down = pricing_func(S_ - h * _DIAGONAL, K, T, r, vol, CALL_OPTION)
+    gamma = np.imag(price_up + price_down) / np.square(h)
+    return _settle_expired(gamma, "gamma", S_, K, T, r, vol)
+
+
+def vega_cs(
+    pricing_func: PricingFunction,
+    S: ArrayLike,
+    K: ArrayLike,
+    T: ArrayLike,
+    r: ArrayLike,
+    vol: ArrayLike,
+) -> _F64:
+    # Note: Vega is identical for call and put options due to Put-Call parity
+    price = pricing_func(S, K, T, r, to_f64(vol) + 1j * STEP, CALL_OPTION)
+    return _settle_expired(np.imag(price) / STEP, "vega", S, K, T, r, vol)
+
+
+def rho_cs(
+    pricing_func: PricingFunction,
+    S: ArrayLike,
+    K: ArrayLike,
+    T: ArrayLike,
+    r: ArrayLike,
+    vol: ArrayLike,
+    option_type: OptionType = "call",
+) -> _F64:
+    price = pricing_func(S, K, T, to_f64(r) + 1j * STEP, vol, option_type)
+    return _settle_expired(np.imag(price) / STEP, "rho", S, K, T, r, vol, option_type)
+
+
+# Rows of the scenario axis priced by 'calculate_greeks': one imaginary step per
+# first-order Greek, then the two diagonal points of gamma
+SPOT, TIME, RATE, VOL, GAMMA_UP, GAMMA_DOWN = range(6)
+N_SCENARIOS = 6
+
+# Bytes held per contract while a block is priced: for every scenario the four stacked
+# inputs and about eight complex temporaries of 'black_scholes_complex'
+_BYTES_PER_CONTRACT: int = N_SCENARIOS * (4 + 8) * np.dtype(np.complex128).itemsize
+
+
+def _scenarios(
+    x: _F64, shape: tuple[int, ...], step: int, h: _F64 | None = None
+) -> NDArray[np.complex128]:
+    """(N_SCENARIOS, *shape) copies of 'x' with the imaginary step in row 'step'"""
+    stacked = np.empty((N_SCENARIOS, *shape), dtype=np.complex128)
+    stacked[...] = x
+    stacked[step] += 1j * STEP
+    if h is not None:
+        stacked[GAMMA_UP] += h * _DIAGONAL
+        stacked[GAMMA_DOWN] -= h * _DIAGONAL
+    return stacked
+
+
+def calculate_greeks(
+    pricing_func: PricingFunction,
+    S: ArrayLike,
+    K: ArrayLike,
+    T: ArrayLike,
+    r: ArrayLike,
+    vol: ArrayLike,
+    option_type: OptionType = "call",
+    day_count: DayCount = DayCount.CALENDAR,
+    memory_budget: int = 4 * 2**20,
+) -> Greeks:
+    """
+    All five Greeks by complex steps from batched calls of 'pricing_func'
+
+    The four imaginary steps (S, T, r and vol) and the two diagonal gamma points are
+    stacked along a new leading axis and priced together, six complex evaluations
+    instead of the nine real ones of central differences. 'pricing_func' must accept
+    complex inputs and broadcast them like 'black_scholes_complex'.
+
+    Contracts are taken in blocks whose stacked scenarios fit in 'memory_budget' (in
+    bytes), a batch smaller than that is priced in a single call.
+    """
+    S_, K_, T_, r_, vol_ = (to_f64(x) for x in (S, K, T, r, vol))
+    shape = np.broadcast_shapes(S_.shape, K_.shape, T_.shape, r_.shape, vol_.shape)
+
+    greeks = Greeks.empty(shape)
+    inputs = [S_, K_, T_, r_, vol_, _gamma_step(S_)]
+    max_contracts = max(1, memory_budget // _BYTES_PER_CONTRACT)
+
+    for index in block_slices(shape, max_contracts):
+        S_b, K_b, T_b, r_b, vol_b, h_b = block_inputs(inputs, index, shape)
+        block_shape = greeks.delta[index].shape
+
+        # Gamma and vega are the same for both sides by put-call parity, so every
+        # scenario is priced with the requested option type
+        prices = np.imag(
+            pricing_func(
+                _scenarios(S_b, block_shape, SPOT, h_b),
+                K_b,
+                _scenarios(T_b, block_shape, TIME),
+                _scenarios(r_b, block_shape, RATE),
+                _scenarios(vol_b, block_shape, VOL),
+                option_type,
+            )
+        )
+
+        greeks.delta[index] = prices[SPOT] / STEP
+        greeks.gamma[index] = (prices[GAMMA_UP] + prices[GAMMA_DOWN]) / np.square(h_b)
+        greeks.theta[index] = -prices[TIME] / (STEP * day_count)
+        greeks.vega[index] = prices[VOL] / STEP
+        greeks.rho[index] = prices[RATE] / STEP
+
+    for f in fields(greeks):
+        _settle_expired(
+            getattr(greeks, f.name),
+            f.name,
+            S_,
+            K_,
+            T_,
+            r_,
+            vol_,
+            option_type,
+            day_count,
+        )
+    return greeks
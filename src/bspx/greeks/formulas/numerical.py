@@ -1,11 +1,13 @@
 import numpy as np
 from numpy.typing import ArrayLike
 
+from bspx.instruments import Greeks
 from bspx.numeric_utils import to_f64
+from bspx.pricing.chunked import block_inputs, block_slices
 from bspx.types import _F64, DayCount, OptionType, PricingFunction
 
-# TODO: Add Automatic Differentiation (AD) via PyTorch or JAX for increased performance
-# on Greeks computation.
+# Note: Exact derivatives without bumping are available by forward-mode automatic
+# differentiation, see 'bspx.greeks.formulas.automatic'
 
 BUMP = 1e-4
 MIN_BUMP = 1e-6
@@ -94,3 +96,96 @@ def rho_fd(
     price_up = pricing_func(S, K, T, r_ + h, vol, option_type)
     price_down = pricing_func(S, K, T, r_ - h, vol, option_type)
     return (price_up - price_down) / (2 * h)
+
+
+# Rows of the scenario axis priced by 'calculate_greeks', every bumped input moves up
+# then down by its step while the others stay at their base value
+(
+    BASE,
+    SPOT_UP,
+    SPOT_DOWN,
+    TIME_UP,
+    TIME_DOWN,
+    RATE_UP,
+    RATE_DOWN,
+    VOL_UP,
+    VOL_DOWN,
+) = range(9)
+N_SCENARIOS = 9
+
+# Bytes held per contract while a block is priced: for every scenario the four stacked
+# inputs, the pricing temporaries (see 'bspx.pricing.chunked') and the price
+_BYTES_PER_CONTRACT: int = N_SCENARIOS * (4 + 7 + 1) * np.dtype(np.float64).itemsize
+
+
+def _scenarios(x: _F64, h: _F64, shape: tuple[int, ...], up: int) -> _F64:
+    """(N_SCENARIOS, *shape) copies of 'x', bumped by +h in row 'up' and -h below it"""
+    stacked = np.empty((N_SCENARIOS, *shape), dtype=np.float64)
+    stacked[...] = x
+    stacked[up] += h
+    stacked[up + 1] -= h
+    return stacked
+
+
+def calculate_greeks(
+    pricing_func: PricingFunction,
+    S: ArrayLike,
+    K: ArrayLike,
+    T: ArrayLike,
+    r: ArrayLike,
+    vol: ArrayLike,
+    option_type: OptionType = "call",
+    day_count: DayCount = DayCount.CALENDAR,
+    memory_budget: int = 4 * 2**20,
+) -> Greeks:
+    """
+    All five Greeks by central differences from batched calls of 'pricing_func'
+
+    The base point and the eight bumped points (S, T, r and vol, each up and down) are
+    stacked along a new leading axis and priced together, so 'pricing_func' converts
+    its inputs and builds its state once per block instead of 11 times. Delta and
+    gamma share the S +/- h prices and gamma reuses the base price.
+
+    Contracts are taken in blocks whose stacked scenarios fit in 'memory_budget' (in
+    bytes), a batch smaller than that is priced in a single call. 'pricing_func' must
+    broadcast its inputs like 'black_scholes_price'.
+    """
+    S_, h_S = _to_f64_with_step(S)
+    T_, h_T = _to_f64_with_step(T)
+    r_, h_r = _to_f64_with_step(r)
+    vol_, h_vol = _to_f64_with_step(vol)
+    K_ = to_f64(K)
+    shape = np.broadcast_shapes(S_.shape, K_.shape, T_.shape, r_.shape, vol_.shape)
+
+    greeks = Greeks.empty(shape)
+    inputs = [S_, K_, T_, r_, vol_, h_S, h_T, h_r, h_vol]
+    max_contracts = max(1, memory_budget // _BYTES_PER_CONTRACT)
+
+    for index in block_slices(shape, max_contracts):
+        S_b, K_b, T_b, r_b, vol_b, h_S_b, h_T_b, h_r_b, h_vol_b = block_inputs(
+            inputs, index, shape
+        )
+        block_shape = greeks.delta[index].shape
+
+        # Gamma and vega are the same for both sides by put-call parity, so every
+        # scenario is priced with the requested option type
+        prices = pricing_func(
+            _scenarios(S_b, h_S_b, block_shape, SPOT_UP),
+            K_b,
+            _scenarios(T_b, h_T_b, block_shape, TIME_UP),
+            _scenarios(r_b, h_r_b, block_shape, RATE_UP),
+            _scenarios(vol_b, h_vol_b, block_shape, VOL_UP),
+            option_type,
+        )
+
+        greeks.delta[index] = (prices[SPOT_UP] - prices[SPOT_DOWN]) / (2 * h_S_b)
+        greeks.gamma[index] = (
+            prices[SPOT_UP] + prices[SPOT_DOWN] - 2 * prices[BASE]
+        ) / np.square(h_S_b)
+        greeks.theta[index] = -(prices[TIME_UP] - prices[TIME_DOWN]) / (
+            2 * h_T_b * day_count
+        )
+        greeks.vega[index] = (prices[VOL_UP] - prices[VOL_DOWN]) / (2 * h_vol_b)
+        greeks.rho[index] = (prices[RATE_UP] - prices[RATE_DOWN]) / (2 * h_r_b)
+
+    return greeks
@@ -1,6 +1,7 @@
 from numpy.typing import ArrayLike
 
 from bspx.greeks.formulas import numerical
+from bspx.instruments import Greeks
 from bspx.types import _F64, DayCount, DiffMethod, OptionType, PricingFunction
 
 
@@ -78,3 +79,18 @@ class NumericalBackend:
             self._vol,
             option_type,
         )
+
+    def calculate_greeks(
+        self, option_type: OptionType = "call", day_count: DayCount = DayCount.CALENDAR
+    ) -> Greeks:
+        """All five Greeks from one batched repricing, see 'numerical.calculate_greeks'"""
+        return numerical.calculate_greeks(
+            self._pricing_func,
+            self._S,
+            self._K,
+            self._T,
+            self._r,
+            self._vol,
+            option_type,
+            day_count,
+        )
@@ -0,0 +1,102 @@
+from dataclasses import fields
+
+import numpy as np
+from numpy.typing import ArrayLike, DTypeLike
+
+from bspx.greeks.formulas import analytical
+from bspx.instruments import Greeks
+from bspx.pricing import BlackScholesState, PricingWorkspace
+from bspx.pricing.chunked import (
+    DEFAULT_MEMORY_BUDGET,
+    BlockIndex,
+    block_inputs,
+    block_slices,
+    broadcast_inputs,
+)
+from bspx.pricing.parallel import run_threaded
+from bspx.pricing.workspace import check_out
+from bspx.types import DayCount, OptionType, Precision, Validation
+
+# Batch-sized buffers held while a block of analytical Greeks is evaluated:
+# the state's derived fields, its scratch buffer and the five outputs
+_GREEKS_BUFFERS: int = 20
+
+
+def _output(out: Greeks | None, shape: tuple[int, ...], dtype: DTypeLike) -> Greeks:
+    if out is None:
+        return Greeks.empty(shape, dtype)
+    for f in fields(out):
+        check_out(getattr(out, f.name), shape, dtype)
+    return out
+
+
+def calculate_greeks_chunked(
+    S: ArrayLike,
+    K: ArrayLike,
+    T: ArrayLike,
+    r: ArrayLike,
+    vol: ArrayLike,
+    option_type: OptionType = "call",
+    day_count: DayCount = DayCount.CALENDAR,
+    memory_budget: int = DEFAULT_MEMORY_BUDGET,
+    out: Greeks | None = None,
+    validation: Validation = Validation.RAISE,
+    precision: Precision = Precision.EXACT,
+) -> Greeks:
+    """
+    Analytical Greeks of a large grid, evaluated in cache-sized blocks
+
+    Every block reuses one workspace bounded by 'memory_budget' (in bytes) and is
+    written straight into 'out' (allocated once when not given)
+    """
+    shape, inputs = broadcast_inputs(S, K, T, r, vol, precision)
+    out = _output(out, shape, precision.dtype)
+    workspace = PricingWorkspace()
+    itemsize = np.dtype(precision.dtype).itemsize
+    max_elements = max(1, memory_budget // (_GREEKS_BUFFERS * itemsize))
+
+    for index in block_slices(shape, max_elements):
+        state = BlackScholesState.build(
+            *block_inputs(inputs, index, shape),
+            workspace=workspace,
+            precision=precision,
+            validation=validation,
+        )
+        analytical.calculate_greeks(state, option_type, day_count, out=out[index])
+    return out
+
+
+def calculate_greeks_threaded(
+    S: ArrayLike,
+    K: ArrayLike,
+    T: ArrayLike,
+    r: ArrayLike,
+    vol: ArrayLike,
+    option_type: OptionType = "call",
+    day_count: DayCount = DayCount.CALENDAR,
+    workers: int | None = None,
+    out: Greeks | None = None,
+    memory_budget: int = DEFAULT_MEMORY_BUDGET,
+    validation: Validation = Validation.RAISE,
+    precision: Precision = Precision.EXACT,
+) -> Greeks:
+    """
+    Analytical Greeks evaluated concurrently by 'workers' threads (all cores by
+    default), each writing its slice of shared outputs in cache-sized blocks
+    """
+    shape, inputs = broadcast_inputs(S, K, T, r, vol, precision)
+    out = _output(out, shape, precision.dtype)
+
+    def task(index: BlockIndex) -> None:
+        calculate_greeks_chunked(
+            *block_inputs(inputs, index, shape),
+            option_type,
+            day_count,
+            memory_budget,
+            out=out[index],
+            validation=validation,
+            precision=precision,
+        )
+
+    run_threaded(shape, task, workers)
+    return out
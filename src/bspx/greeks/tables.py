@@ -0,0 +1,31 @@
+from collections.abc import Mapping
+from typing import Any
+
+from numpy.typing import ArrayLike
+
+from bspx.greeks.formulas import analytical
+from bspx.ingest import market_columns
+from bspx.instruments import Greeks
+from bspx.pricing import BlackScholesState
+from bspx.types import DayCount, OptionType, Validation
+
+
+def calculate_greeks_table(
+    table: Any,
+    option_type: OptionType = "call",
+    day_count: DayCount = DayCount.CALENDAR,
+    columns: Mapping[str, str] | None = None,
+    validation: Validation = Validation.RAISE,
+    out: Greeks | None = None,
+    **values: ArrayLike,
+) -> Greeks:
+    """
+    Analytical Greeks of every row of a pandas DataFrame or pyarrow Table
+
+    Columns are located and viewed (or converted once) by 'bspx.ingest.market_columns',
+    see there for 'columns' and keyword overrides such as r=0.03
+    """
+    state = BlackScholesState.build(
+        *market_columns(table, columns, **values), validation=validation
+    )
+    return analytical.calculate_greeks(state, option_type, day_count, out)
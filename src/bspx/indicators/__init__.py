@@ -1,5 +1,19 @@
-from bspx.indicators.bollinger import add_bollinger_bands
-from bspx.indicators.moving_average import add_moving_averages
-from bspx.indicators.rsi import add_rsi
+from typing import TYPE_CHECKING
+
+from bspx._lazy import attach
+
+if TYPE_CHECKING:
+    from bspx.indicators.bollinger import add_bollinger_bands
+    from bspx.indicators.moving_average import add_moving_averages
+    from bspx.indicators.rsi import add_rsi
 
 __all__ = ["add_bollinger_bands", "add_moving_averages", "add_rsi"]
+
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "bollinger": ("add_bollinger_bands",),
+        "moving_average": ("add_moving_averages",),
+        "rsi": ("add_rsi",),
+    },
+)
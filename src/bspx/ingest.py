@@ -0,0 +1,137 @@
+import threading
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from bspx.types import _F64
+
+# Note: Columns from pandas and pyarrow are viewed in place whenever their buffer
+# already holds float64 values without nulls. Anything else (ints, float32, nullable
+# or multi-chunk columns) has to be converted, which is counted in 'CONVERSION_STATS'
+# so that repeated conversions of the same data show up.
+
+
+@dataclass
+class ConversionStats:
+    """
+    Running count of inputs that had to be copied to become float64 arrays
+
+    Only sources that own a buffer (NumPy, pandas and pyarrow) are counted, Python
+    scalars and lists are always materialized and are not.
+    """
+
+    copies: int = 0
+    copied_bytes: int = 0
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def record(self, array: NDArray) -> None:
+        with self._lock:
+            self.copies += 1
+            self.copied_bytes += array.nbytes
+
+    def reset(self) -> None:
+        with self._lock:
+            self.copies = 0
+            self.copied_bytes = 0
+
+
+CONVERSION_STATS = ConversionStats()
+
+
+def from_numpy(x: np.ndarray, dtype: type[np.floating] = np.float64) -> NDArray:
+    """NumPy array 'x' as 'dtype', converted (and counted) only when it is not already"""
+    if x.dtype == dtype:
+        return x
+    array = x.astype(dtype)
+    CONVERSION_STATS.record(array)
+    return array
+
+
+def _from_arrow(x: Any) -> _F64:
+    """pyarrow Array or ChunkedArray, viewed when it is one float64 chunk without nulls"""
+    import pyarrow as pa
+
+    if isinstance(x, pa.ChunkedArray) and x.num_chunks == 1:
+        x = x.chunk(0)
+    if isinstance(x, pa.Array) and x.type == pa.float64() and x.null_count == 0:
+        return x.to_numpy(zero_copy_only=True)
+
+    # Nulls become NaN, which the 'mask' validation mode turns into NaN results
+    array = np.asarray(x.to_numpy(zero_copy_only=False), dtype=np.float64)
+    CONVERSION_STATS.record(array)
+    return array
+
+
+def _from_pandas(x: Any) -> _F64:
+    """pandas Series or Index, unwrapped to its NumPy or Arrow buffer"""
+    import pandas as pd
+
+    if isinstance(x.dtype, np.dtype):
+        return from_numpy(x.to_numpy(copy=False))
+    if isinstance(x.dtype, pd.ArrowDtype):
+        return _from_arrow(x.array.__arrow_array__())
+
+    # Nullable extension dtypes ('Float64', 'Int64', ...) keep a separate mask
+    array = x.to_numpy(dtype=np.float64, na_value=np.nan)
+    CONVERSION_STATS.record(array)
+    return array
+
+
+def to_f64(x: ArrayLike) -> _F64:
+    """
+    'x' as a float64 array, without a copy whenever its buffer allows
+
+    Accepts everything 'np.asarray' does, plus pandas Series / Index and pyarrow
+    (Chunked)Arrays. Forced copies are counted in 'CONVERSION_STATS'.
+    """
+    if type(x) is np.ndarray:
+        return from_numpy(x)
+
+    module = type(x).__module__
+    if module.startswith("pandas"):
+        return _from_pandas(x)
+    if module.startswith("pyarrow"):
+        return _from_arrow(x)
+    if isinstance(x, np.ndarray):
+        return from_numpy(np.asarray(x))
+    return np.asarray(x, dtype=np.float64)
+
+
+_MARKET_FIELDS: tuple[str, ...] = ("S", "K", "T", "r", "vol")
+
+
+def market_columns(
+    table: Any, columns: Mapping[str, str] | None = None, **values: ArrayLike
+) -> tuple[_F64, _F64, _F64, _F64, _F64]:
+    """
+    (S, K, T, r, vol) read from a pandas DataFrame or a pyarrow Table
+
+    Each input is taken from the column of the same name, or the one given for it in
+    'columns' (e.g. {"S": "underlying"}). Inputs passed as keywords (e.g. r=0.03)
+    override the table. Every column is converted once with 'to_f64'.
+    """
+    columns = {} if columns is None else columns
+    # pyarrow Tables list their names in 'column_names', DataFrames in 'columns'
+    names = set(getattr(table, "column_names", None) or table.columns)
+
+    inputs: list[_F64] = []
+    for name in _MARKET_FIELDS:
+        if name in values:
+            inputs.append(to_f64(values[name]))
+            continue
+
+        column = columns.get(name, name)
+        if column not in names:
+            raise ValueError(
+                f"Error: Column '{column}' for input '{name}' not found\n"
+                f" Got: {sorted(names)}"
+            )
+        inputs.append(to_f64(table[column]))
+
+    S, K, T, r, vol = inputs
+    return S, K, T, r, vol
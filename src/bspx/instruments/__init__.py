@@ -1,3 +1,43 @@
-from bspx.instruments.option import Greeks, OptionPrice
+from typing import TYPE_CHECKING
 
-__all__ = ["Greeks", "OptionPrice"]
+from bspx._lazy import attach
+
+if TYPE_CHECKING:
+    from bspx.instruments.chain import CHAIN_RESULT_DTYPE, OptionChain
+    from bspx.instruments.option import (
+        EXTENDED_GREEKS_DTYPE,
+        GREEKS_DTYPE,
+        PRICE_DTYPE,
+        CallPutResult,
+        ExtendedGreeks,
+        Greeks,
+        OptionPrice,
+    )
+
+__all__ = [
+    "CHAIN_RESULT_DTYPE",
+    "EXTENDED_GREEKS_DTYPE",
+    "GREEKS_DTYPE",
+    "PRICE_DTYPE",
+    "CallPutResult",
+    "ExtendedGreeks",
+    "Greeks",
+    "OptionChain",
+    "OptionPrice",
+]
+
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "chain": ("CHAIN_RESULT_DTYPE", "OptionChain"),
+        "option": (
+            "EXTENDED_GREEKS_DTYPE",
+            "GREEKS_DTYPE",
+            "PRICE_DTYPE",
+            "CallPutResult",
+            "ExtendedGreeks",
+            "Greeks",
+            "OptionPrice",
+        ),
+    },
+)
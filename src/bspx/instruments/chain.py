@@ -0,0 +1,170 @@
+from dataclasses import dataclass, replace
+from typing import Literal
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from bspx.instruments.option import GREEK_NAMES, Greeks, _check_records
+from bspx.numeric_utils import to_f64
+from bspx.types import _F64, DayCount, OptionType, Validation
+
+type ChainColumn = Literal["S", "K", "T", "r", "vol", "is_call"]
+
+_COLUMNS: tuple[ChainColumn, ...] = ("S", "K", "T", "r", "vol", "is_call")
+
+# Record layout of 'OptionChain.price_and_greeks' results, one row per contract
+CHAIN_RESULT_DTYPE: np.dtype = np.dtype(
+    [(name, np.float64) for name in ("price", *GREEK_NAMES)]
+)
+
+
+@dataclass(frozen=True)
+class OptionChain:
+    """
+    Struct-of-arrays container for a whole option chain
+
+    Parameters:
+
+        S:          Asset price column
+        K:          Strike price column
+        T:          Time to expiration column (in years)
+        r:          Risk-free rate column (annualized)
+        vol:        Volatility column (annualized)
+        is_call:    True for calls, False for puts
+        rows:       Positions of the rows this chain sees, None for every row in
+                    storage order
+
+    Columns are contiguous 1-D arrays of the same length. 'sort_by' and 'filter' only
+    build a new 'rows' index over the same columns, so views of a chain never copy
+    them; 'column' gathers the values of a view when they are needed.
+    """
+
+    S: _F64
+    K: _F64
+    T: _F64
+    r: _F64
+    vol: _F64
+    is_call: NDArray[np.bool_]
+    rows: NDArray[np.intp] | None = None
+
+    @classmethod
+    def build(
+        cls,
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        vol: ArrayLike,
+        option_type: OptionType | ArrayLike = "call",
+    ) -> "OptionChain":
+        """
+        Chain from scalars or 1-D arrays, broadcast to one length
+
+        'option_type' is either one type for the whole chain or a column of "call" /
+        "put" labels or call flags
+        """
+        is_call = np.asarray(option_type)
+        if is_call.dtype.kind in "US":
+            is_call = is_call == "call"
+
+        columns = [to_f64(x) for x in (S, K, T, r, vol)]
+        shape = np.broadcast_shapes(*(x.shape for x in columns), is_call.shape)
+        if len(shape) != 1:
+            raise ValueError(
+                f"Error: OptionChain columns must be one-dimensional\n Got: {shape}"
+            )
+
+        S_, K_, T_, r_, vol_ = (
+            np.ascontiguousarray(np.broadcast_to(x, shape)) for x in columns
+        )
+        return cls(
+            S=S_,
+            K=K_,
+            T=T_,
+            r=r_,
+            vol=vol_,
+            is_call=np.ascontiguousarray(np.broadcast_to(is_call, shape), dtype=bool),
+        )
+
+    def __len__(self) -> int:
+        return self.S.size if self.rows is None else self.rows.size
+
+    def _positions(self) -> NDArray[np.intp]:
+        return np.arange(self.S.size) if self.rows is None else self.rows
+
+    def column(self, name: ChainColumn) -> NDArray:
+        """Values of one column in the order of this view"""
+        values = getattr(self, name)
+        return values if self.rows is None else values[self.rows]
+
+    def sort_by(self, *names: ChainColumn, descending: bool = False) -> "OptionChain":
+        """View sorted by the given columns, the first one being the primary key"""
+        if not names:
+            raise ValueError("Error: 'sort_by' needs at least one column name")
+
+        # lexsort treats its last key as the primary one
+        order = np.lexsort([self.column(name) for name in reversed(names)])
+        if descending:
+            order = order[::-1]
+        return replace(self, rows=self._positions()[order])
+
+    def filter(self, mask: ArrayLike) -> "OptionChain":
+        """View of the rows where 'mask' (one flag per row of this view) is True"""
+        mask_ = np.asarray(mask, dtype=bool)
+        if mask_.shape != (len(self),):
+            raise ValueError(
+                f"Error: 'mask' must have one flag per row ({len(self)})\n"
+                f" Got: {mask_.shape}"
+            )
+        return replace(self, rows=self._positions()[mask_])
+
+    def price_and_greeks(
+        self,
+        day_count: DayCount = DayCount.CALENDAR,
+        validation: Validation = Validation.RAISE,
+        out: NDArray | None = None,
+    ) -> tuple[_F64, Greeks]:
+        """
+        Prices and analytical Greeks of every row, calls and puts in one pass
+
+        With 'out', a CHAIN_RESULT_DTYPE structured array of one record per row, the
+        results are written into its fields and the returned arrays are views of it
+
+        Everything is evaluated once with the call formulas. The put price, delta and
+        rho are then read on the put rows from the tails N(-d1) and N(-d2) that the
+        state evaluates, since a parity shift from the call cancels to rounding noise
+        for deep out of the money puts. The put theta is shifted in place by put-call
+        parity:
+
+            theta:  theta_call + r * K * exp{-rT} / day_count
+
+        Gamma and vega are the same for both sides.
+        """
+        # Imported here since bspx.pricing itself imports bspx.instruments
+        from bspx.greeks.formulas import analytical
+        from bspx.pricing.black_scholes_model import BlackScholesState
+
+        S, K, T, r, vol = (self.column(name) for name in _COLUMNS[:-1])
+        state = BlackScholesState.build(S, K, T, r, vol, validation=validation)
+        is_put = ~self.column("is_call")
+
+        if out is None:
+            price, greeks = np.empty(len(self)), Greeks.empty((len(self),))
+        else:
+            out = _check_records(out, CHAIN_RESULT_DTYPE)
+            price, greeks = out["price"], Greeks(*(out[name] for name in GREEK_NAMES))
+
+        state.call_price(out=price)
+        analytical.calculate_greeks(state, "call", day_count, out=greeks)
+        if not is_put.any():
+            return price, greeks
+
+        np.copyto(price, state.put_price(), where=is_put)
+        np.copyto(greeks.delta, analytical.delta(state, "put"), where=is_put)
+        np.copyto(greeks.rho, analytical.rho(state, "put"), where=is_put)
+
+        carry = np.multiply(r, state.strike_pv)
+        carry /= day_count
+        np.add(greeks.theta, carry, out=greeks.theta, where=is_put)
+
+        return price, greeks
@@ -1,7 +1,53 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from typing import Any
 
 import numpy as np
-from numpy.typing import NDArray
+from numpy.typing import DTypeLike, NDArray
+
+GREEK_NAMES: tuple[str, ...] = ("delta", "theta", "gamma", "vega", "rho")
+EXTENDED_GREEK_NAMES: tuple[str, ...] = (
+    "vanna",
+    "volga",
+    "charm",
+    "speed",
+    "color",
+    "zomma",
+)
+
+# Record layouts of one contract, every field is float64 so a structured array of
+# either type can also be viewed as an (..., k) float block:
+# 'records.view(np.float64).reshape(*records.shape, k)'
+PRICE_DTYPE: np.dtype = np.dtype([("call", np.float64), ("put", np.float64)])
+GREEKS_DTYPE: np.dtype = np.dtype([(name, np.float64) for name in GREEK_NAMES])
+EXTENDED_GREEKS_DTYPE: np.dtype = np.dtype(
+    [(name, np.float64) for name in EXTENDED_GREEK_NAMES]
+)
+
+
+def _check_records(records: NDArray, dtype: np.dtype) -> NDArray:
+    if records.dtype != dtype:
+        raise ValueError(
+            f"Error: 'records' must have the dtype {dtype}\n Got: {records.dtype}"
+        )
+    return records
+
+
+def _check_block(block: NDArray, width: int) -> NDArray:
+    if block.ndim == 0 or block.shape[-1] != width or block.dtype != np.float64:
+        raise ValueError(
+            f"Error: 'block' must be a float64 array with {width} columns on its last "
+            f"axis\n Got: {block.dtype} array of shape {block.shape}"
+        )
+    return block
+
+
+def _to_records(result: Any, dtype: np.dtype) -> NDArray:
+    columns = {f.name: getattr(result, f.name) for f in fields(result)}
+    shape = np.broadcast_shapes(*(np.shape(c) for c in columns.values()))
+    records = np.empty(shape, dtype=dtype)
+    for name, column in columns.items():
+        records[name] = column
+    return records
 
 
 @dataclass(slots=True, frozen=True)
@@ -9,6 +55,22 @@ class OptionPrice:
     call: NDArray[np.float64]
     put: NDArray[np.float64]
 
+    @classmethod
+    def from_records(cls, records: NDArray) -> "OptionPrice":
+        """Field views of a PRICE_DTYPE structured array, used as 'out' buffers"""
+        records = _check_records(records, PRICE_DTYPE)
+        return cls(call=records["call"], put=records["put"])
+
+    @classmethod
+    def from_block(cls, block: NDArray[np.float64]) -> "OptionPrice":
+        """Column views of an (..., 2) float block ordered (call, put)"""
+        block = _check_block(block, 2)
+        return cls(call=block[..., 0], put=block[..., 1])
+
+    def to_records(self) -> NDArray:
+        """Copy of the prices as one PRICE_DTYPE structured array"""
+        return _to_records(self, PRICE_DTYPE)
+
     def __repr__(self) -> str:
         return f"OptionPrice(call={self.call}, put={self.put})"
 
@@ -21,5 +83,109 @@ class Greeks:
     vega: NDArray[np.float64]
     rho: NDArray[np.float64]
 
+    @classmethod
+    def empty(cls, shape: tuple[int, ...], dtype: DTypeLike = np.float64) -> "Greeks":
+        """Uninitialized Greeks, used as 'out' buffers"""
+        return cls(*(np.empty(shape, dtype=dtype) for _ in fields(cls)))
+
+    @classmethod
+    def from_records(cls, records: NDArray) -> "Greeks":
+        """
+        Field views of a GREEKS_DTYPE structured array
+
+        Passed as 'out', the Greeks of each contract are written next to each other in
+        one contiguous buffer, ready to be saved or sent without restacking
+        """
+        records = _check_records(records, GREEKS_DTYPE)
+        return cls(*(records[f.name] for f in fields(cls)))
+
+    @classmethod
+    def from_block(cls, block: NDArray[np.float64]) -> "Greeks":
+        """Column views of an (..., 5) float block ordered like the fields"""
+        block = _check_block(block, len(fields(cls)))
+        return cls(*(block[..., i] for i in range(len(fields(cls)))))
+
+    def to_records(self) -> NDArray:
+        """Copy of the Greeks as one GREEKS_DTYPE structured array"""
+        return _to_records(self, GREEKS_DTYPE)
+
+    def __getitem__(self, index: Any) -> "Greeks":
+        """Greeks of a subset of contracts, views when 'index' is a basic slice"""
+        return Greeks(*(getattr(self, f.name)[index] for f in fields(self)))
+
     def __repr__(self) -> str:
         return f"Greeks(delta={self.delta},theta={self.theta}, gamma={self.gamma}, vega={self.vega}, rho={self.rho})"
+
+
+@dataclass(slots=True, frozen=True)
+class CallPutResult:
+    """
+    Parameters:
+
+        price:  Call and put prices
+        call:   Greeks of the call
+        put:    Greeks of the put
+    """
+
+    price: OptionPrice
+    call: Greeks
+    put: Greeks
+
+    @classmethod
+    def empty(cls, shape: tuple[int, ...]) -> "CallPutResult":
+        """Uninitialized results, used as 'out' buffers"""
+        return cls(
+            price=OptionPrice(*(np.empty(shape, dtype=np.float64) for _ in range(2))),
+            call=Greeks.empty(shape),
+            put=Greeks.empty(shape),
+        )
+
+    def __repr__(self) -> str:
+        return f"CallPutResult(price={self.price}, call={self.call}, put={self.put})"
+
+
+@dataclass(slots=True, frozen=True)
+class ExtendedGreeks:
+    """
+    Parameters:
+
+        vanna:  d(delta) / d(vol), equally d(vega) / dS
+        volga:  d(vega) / d(vol), also called vomma
+        charm:  Change of delta as time passes, -d(delta) / dT
+        speed:  d(gamma) / dS
+        color:  Change of gamma as time passes, -d(gamma) / dT
+        zomma:  d(gamma) / d(vol)
+    """
+
+    vanna: NDArray[np.float64]
+    volga: NDArray[np.float64]
+    charm: NDArray[np.float64]
+    speed: NDArray[np.float64]
+    color: NDArray[np.float64]
+    zomma: NDArray[np.float64]
+
+    @classmethod
+    def empty(cls, shape: tuple[int, ...]) -> "ExtendedGreeks":
+        """Uninitialized Greeks, used as 'out' buffers"""
+        return cls(*(np.empty(shape, dtype=np.float64) for _ in fields(cls)))
+
+    @classmethod
+    def from_records(cls, records: NDArray) -> "ExtendedGreeks":
+        """Field views of an EXTENDED_GREEKS_DTYPE structured array"""
+        records = _check_records(records, EXTENDED_GREEKS_DTYPE)
+        return cls(*(records[f.name] for f in fields(cls)))
+
+    def to_records(self) -> NDArray:
+        """Copy of the Greeks as one EXTENDED_GREEKS_DTYPE structured array"""
+        return _to_records(self, EXTENDED_GREEKS_DTYPE)
+
+    def __getitem__(self, index: Any) -> "ExtendedGreeks":
+        """Greeks of a subset of contracts, views when 'index' is a basic slice"""
+        return ExtendedGreeks(*(getattr(self, f.name)[index] for f in fields(self)))
+
+    def __repr__(self) -> str:
+        return (
+            f"ExtendedGreeks(vanna={self.vanna}, volga={self.volga}, "
+            f"charm={self.charm}, speed={self.speed}, color={self.color}, "
+            f"zomma={self.zomma})"
+        )
@@ -1,3 +1,10 @@
-from bspx.market_data.fetch import get_stock_data
+from typing import TYPE_CHECKING
+
+from bspx._lazy import attach
+
+if TYPE_CHECKING:
+    from bspx.market_data.fetch import get_stock_data
 
 __all__ = ["get_stock_data"]
+
+__getattr__, __dir__ = attach(__name__, {"fetch": ("get_stock_data",)})
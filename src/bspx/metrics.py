@@ -0,0 +1,117 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+# Note: Instrumentation is off by default. While disabled 'start', 'stop' and
+# 'increment' return after a single attribute check, so an instrumented stage costs
+# about two method calls per batch and allocates nothing. Stages are timed with an
+# explicit start / stop pair rather than a context manager, whose '__enter__' and
+# '__exit__' calls alone would cost several times as much.
+
+
+@dataclass
+class StageStats:
+    """
+    Parameters:
+
+        calls:      Times the stage was entered
+        seconds:    Total wall time spent inside the stage
+        elements:   Total number of contracts (or values) the stage processed
+    """
+
+    calls: int = 0
+    seconds: float = 0.0
+    elements: int = 0
+
+
+class Metrics:
+    """
+    Opt-in wall time, element and event counts of the numeric hot paths
+
+    Stages (e.g. "pricing.price", "state.d1_d2", "cdf", "greeks.analytical",
+    "iv.solve") nest, so the time of an inner stage is also part of the outer one. A
+    stage left by an exception is not recorded.
+
+    Counters track discrete events such as solver iterations ("iv.newton_iterations")
+    and Newton to Brent fallbacks ("iv.brent_fallbacks").
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self._stages: dict[str, StageStats] = {}
+        self._counters: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stages.clear()
+            self._counters.clear()
+
+    def start(self) -> float:
+        """Start time of a stage, passed on to 'stop'"""
+        return time.perf_counter() if self.enabled else 0.0
+
+    def stop(self, name: str, start: float, elements: int = 0) -> None:
+        """Records one pass through the stage 'name' begun at 'start'"""
+        if not self.enabled:
+            return
+        seconds = time.perf_counter() - start
+        with self._lock:
+            stats = self._stages.setdefault(name, StageStats())
+            stats.calls += 1
+            stats.seconds += seconds
+            stats.elements += elements
+
+    def increment(self, name: str, value: int = 1) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def snapshot(self) -> dict[str, Any]:
+        """Copy of everything recorded so far as plain dicts"""
+        with self._lock:
+            return {
+                "stages": {
+                    name: {
+                        "calls": s.calls,
+                        "seconds": s.seconds,
+                        "elements": s.elements,
+                    }
+                    for name, s in sorted(self._stages.items())
+                },
+                "counters": dict(sorted(self._counters.items())),
+            }
+
+    def to_prometheus(self, prefix: str = "bspx") -> str:
+        """Everything recorded so far in the Prometheus text exposition format"""
+        snapshot = self.snapshot()
+        lines: list[str] = []
+
+        for field, help_text in (
+            ("calls", "Times each stage was entered"),
+            ("seconds", "Wall time spent in each stage"),
+            ("elements", "Elements processed by each stage"),
+        ):
+            metric = f"{prefix}_stage_{field}_total"
+            lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} counter"]
+            lines += [
+                f'{metric}{{stage="{name}"}} {stats[field]}'
+                for name, stats in snapshot["stages"].items()
+            ]
+
+        for name, value in snapshot["counters"].items():
+            metric = f"{prefix}_{name.replace('.', '_')}_total"
+            lines += [f"# TYPE {metric} counter", f"{metric} {value}"]
+
+        return "\n".join(lines) + "\n"
+
+
+METRICS = Metrics()
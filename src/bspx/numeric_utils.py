@@ -1,11 +1,147 @@
-from collections.abc import Callable
-from functools import partial
+from functools import cache
 
 import numpy as np
-from numpy.typing import ArrayLike
+from numpy.typing import ArrayLike, NDArray
 
-from bspx.types import _F64
+# Ensures that input of type ArrayLike (float, list, ndarray, pandas or pyarrow
+# columns, etc.) is converted to np.float64 array, see 'bspx.ingest'
+from bspx.ingest import from_numpy, to_f64
+from bspx.metrics import METRICS
+from bspx.types import Precision
 
-# Ensures that input of type ArrayLike (float, list, ndarray, etc.) is converted to
-# np.float64 array
-to_f64: Callable[[ArrayLike], _F64] = partial(np.asarray, dtype=np.float64)
+__all__ = ["describe_invalid", "norm_cdf", "norm_cdf_approx", "norm_pdf", "to_f64"]
+
+_INV_SQRT_2PI: float = 1.0 / np.sqrt(2.0 * np.pi)
+
+# Coefficients of the Abramowitz & Stegun 26.2.17 approximation of N(x)
+_AS_P: float = 0.2316419
+_AS_B: tuple[float, ...] = (
+    0.319381530,
+    -0.356563782,
+    1.781477937,
+    -1.821255978,
+    1.330274429,
+)
+# |x| is clipped here, where f(x) already underflows to zero in float64
+_AS_MAX_ABS_X: float = 40.0
+
+
+@cache
+def _ndtr() -> np.ufunc:
+    """'scipy.special.ndtr', imported on first use since scipy.special is slow to load"""
+    from scipy.special import ndtr
+
+    return ndtr
+
+
+def to_precision(x: ArrayLike, precision: Precision = Precision.EXACT) -> NDArray:
+    """
+    'x' as an array of the floating point type of the precision tier
+
+    NumPy arrays, and pandas columns backed by one, are converted straight to that
+    type, so float32 inputs of the FLOAT32 tier are used as they are. Nullable and
+    Arrow columns are read with 'to_f64' first.
+    """
+    if precision is Precision.EXACT:
+        return to_f64(x)
+
+    if type(x).__module__.startswith(("pandas", "pyarrow")):
+        numpy_backed = isinstance(getattr(x, "dtype", None), np.dtype)
+        x = np.asarray(x) if numpy_backed else to_f64(x)
+    if isinstance(x, np.ndarray):
+        return from_numpy(np.asarray(x), precision.dtype)
+    return np.asarray(x, dtype=precision.dtype)
+
+
+def describe_invalid(x: NDArray, invalid: NDArray[np.bool_]) -> str:
+    """
+    Short description of the invalid elements of 'x' for error messages
+
+    Reports the count and the first offender instead of the array repr, which is slow
+    to build and unreadable for large batches
+    """
+    if x.ndim == 0:
+        return f"{x}"
+    index = tuple(int(i) for i in np.unravel_index(np.argmax(invalid), invalid.shape))
+    first = np.broadcast_to(x, invalid.shape)[index]
+    count = np.count_nonzero(invalid)
+    return f"{count} of {invalid.size} values, first {first} at index {index}"
+
+
+def _float_dtype(x: ArrayLike) -> np.dtype:
+    """dtype of a floating point array, float64 for everything else"""
+    if isinstance(x, np.ndarray) and x.dtype == np.float32:
+        return x.dtype
+    return np.dtype(np.float64)
+
+
+def norm_cdf(
+    x: ArrayLike, out: NDArray | None = None, precision: Precision = Precision.EXACT
+) -> NDArray:
+    """
+    Standard Normal CDF N(x)
+
+    Calls the 'scipy.special.ndtr' ufunc directly, skipping the argument checking and
+    dispatch of 'scipy.stats.norm' which dominates the cost for small batches. The
+    FAST_APPROX tier evaluates a polynomial instead (see 'norm_cdf_approx').
+    """
+    start = METRICS.start()
+    if precision is Precision.FAST_APPROX:
+        result = norm_cdf_approx(x, out=out)
+    else:
+        result = _ndtr()(x, out=out)
+    METRICS.stop("cdf", start, result.size)
+    return result
+
+
+def norm_cdf_approx(x: ArrayLike, out: NDArray | None = None) -> NDArray:
+    """
+    Abramowitz & Stegun 26.2.17 approximation of N(x), |error| < 7.5e-8
+
+    N(x) = 1 - f(x) * (b1 * t + ... + b5 * t^5) with t = 1 / (1 + p * x) for x >= 0,
+    and N(x) = 1 - N(-x) below zero. Only multiplies, adds and one exp, which in float32
+    is cheaper than 'ndtr'. 'out' may be 'x' itself.
+
+    Evaluated in 'out' and a single scratch buffer for t, next to a boolean mask of the
+    signs of x
+    """
+    x = np.asarray(x)
+    if out is None:
+        out = np.empty(x.shape, dtype=_float_dtype(x))
+
+    positive = np.greater_equal(x, 0.0)
+    t = np.abs(x, out=np.empty(x.shape, dtype=out.dtype))
+    np.minimum(t, _AS_MAX_ABS_X, out=t)
+    t *= _AS_P
+    t += 1.0
+    np.reciprocal(t, out=t)
+
+    # Horner evaluation of t * (b1 + t * (b2 + t * (b3 + t * (b4 + t * b5))))
+    b1, b2, b3, b4, b5 = _AS_B
+    np.multiply(t, b5, out=out)
+    for b in (b4, b3, b2, b1):
+        out += b
+        out *= t
+
+    # 1 - N(|x|) = f(x) * poly(t), with |x| = (1 / t - 1) / p read back from t
+    np.reciprocal(t, out=t)
+    t -= 1.0
+    t /= _AS_P
+    out *= norm_pdf(t, out=t)
+    return np.subtract(1.0, out, out=out, where=positive)
+
+
+def norm_pdf(x: ArrayLike, out: NDArray | None = None) -> NDArray:
+    """
+    Standard Normal PDF f(x) = exp(-x^2 / 2) / sqrt(2 * pi)
+
+    When 'out' is given every step is evaluated in place, so no temporaries are created
+    """
+    if out is None:
+        out = np.empty(np.shape(x), dtype=_float_dtype(x))
+
+    np.square(x, out=out)
+    out *= -0.5
+    np.exp(out, out=out)
+    out *= _INV_SQRT_2PI
+    return out
@@ -1,13 +1,62 @@
-from bspx.pricing.black_scholes_model import (
-    BlackScholesState,
-    black_scholes_price,
-    build_black_scholes_state,
-)
-from bspx.pricing.forwards import forward_price
+from typing import TYPE_CHECKING
+
+from bspx._lazy import attach
+
+if TYPE_CHECKING:
+    from bspx.pricing.black_scholes_model import (
+        BlackScholesState,
+        BlackScholesStatics,
+        black_scholes_price,
+        build_black_scholes_state,
+        validity_mask,
+    )
+    from bspx.pricing.cache import CacheStats, PricingCache
+    from bspx.pricing.chunked import black_scholes_price_chunked, iter_price_chunks
+    from bspx.pricing.disk_cache import DiskCache
+    from bspx.pricing.forwards import forward_price
+    from bspx.pricing.parallel import black_scholes_price_threaded
+    from bspx.pricing.sharded import SharedMemoryPool
+    from bspx.pricing.tables import black_scholes_price_table
+    from bspx.pricing.term_structure import TermStructure
+    from bspx.pricing.workspace import PricingWorkspace
 
 __all__ = [
     "BlackScholesState",
+    "BlackScholesStatics",
+    "CacheStats",
+    "DiskCache",
+    "PricingCache",
+    "PricingWorkspace",
+    "SharedMemoryPool",
+    "TermStructure",
     "black_scholes_price",
+    "black_scholes_price_chunked",
+    "black_scholes_price_table",
+    "black_scholes_price_threaded",
     "build_black_scholes_state",
     "forward_price",
+    "iter_price_chunks",
+    "validity_mask",
 ]
+
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "black_scholes_model": (
+            "BlackScholesState",
+            "BlackScholesStatics",
+            "black_scholes_price",
+            "build_black_scholes_state",
+            "validity_mask",
+        ),
+        "cache": ("CacheStats", "PricingCache"),
+        "chunked": ("black_scholes_price_chunked", "iter_price_chunks"),
+        "disk_cache": ("DiskCache",),
+        "forwards": ("forward_price",),
+        "parallel": ("black_scholes_price_threaded",),
+        "sharded": ("SharedMemoryPool",),
+        "tables": ("black_scholes_price_table",),
+        "term_structure": ("TermStructure",),
+        "workspace": ("PricingWorkspace",),
+    },
+)
@@ -1,30 +1,273 @@
-from dataclasses import dataclass
+import math
+from collections.abc import Callable
+from dataclasses import dataclass, field, replace
+from functools import cached_property
 
 import numpy as np
-from numpy.typing import ArrayLike
-from scipy.stats import norm
+from numpy.typing import ArrayLike, NDArray
 
-from bspx.numeric_utils import to_f64
-from bspx.types import _F64, OptionType
+from bspx.metrics import METRICS
+from bspx.numeric_utils import describe_invalid, norm_cdf, norm_pdf, to_precision
+from bspx.pricing.term_structure import TermStructure
+from bspx.pricing.workspace import PricingWorkspace, check_out, workspace_buffer
+from bspx.types import _F64, OptionType, Precision, Validation
 
+# Note: Validation uses min-reductions instead of 'np.any(x <= 0)' so that no
+# temporary mask of the batch size is created. The mask of offending elements is only
+# built once a check has already failed, to describe them in the error message.
 
-def _validate_inputs(
-    S: ArrayLike,
-    K: ArrayLike,
-    T: ArrayLike,
-    vol: ArrayLike,
-) -> None:
-    if np.any(np.asarray(S) <= 0):
-        raise ValueError(f"Error: Asset price 'S' must be positive\n Got: {S}")
-    if np.any(np.asarray(K) <= 0):
-        raise ValueError(f"Error: Strike price 'K' must be positive\n Got: {K}")
-    if np.any(np.asarray(T) < 0):
-        raise ValueError(f"Error: Time to maturity 'T' must be nonnegative\n Got: {T}")
-    if np.any(np.asarray(vol) <= 0):
-        raise ValueError(f"Error: Volatility 'vol' must be positive\n Got: {vol}")
-
-
-@dataclass(slots=True, frozen=True)
+
+def _validate_spot(S: _F64) -> None:
+    if S.size and S.min() <= 0:
+        raise ValueError(
+            "Error: Asset price 'S' must be positive\n"
+            f" Got: {describe_invalid(S, S <= 0)}"
+        )
+
+
+def _validate_contract(K: _F64, T: _F64, vol: _F64) -> None:
+    if K.size and K.min() <= 0:
+        raise ValueError(
+            "Error: Strike price 'K' must be positive\n"
+            f" Got: {describe_invalid(K, K <= 0)}"
+        )
+    if T.size and T.min() < 0:
+        raise ValueError(
+            "Error: Time to maturity 'T' must be nonnegative\n"
+            f" Got: {describe_invalid(T, T < 0)}"
+        )
+    if vol.size and vol.min() <= 0:
+        raise ValueError(
+            "Error: Volatility 'vol' must be positive\n"
+            f" Got: {describe_invalid(vol, vol <= 0)}"
+        )
+
+
+def _validate_inputs(S: _F64, K: _F64, T: _F64, vol: _F64) -> None:
+    _validate_spot(S)
+    _validate_contract(K, T, vol)
+
+
+def validity_mask(
+    S: ArrayLike, K: ArrayLike, T: ArrayLike, vol: ArrayLike
+) -> NDArray[np.bool_]:
+    """
+    Per-contract mask of valid inputs: S > 0, K > 0, T >= 0 and vol > 0
+
+    The four checks are combined in place into one boolean buffer of the broadcast
+    shape. NaN fails every comparison, so missing quotes are flagged as well.
+    """
+    S_, K_, T_, vol_ = map(np.asarray, (S, K, T, vol))
+    shape = np.broadcast_shapes(S_.shape, K_.shape, T_.shape, vol_.shape)
+
+    valid = np.greater(S_, 0.0, out=np.empty(shape, dtype=np.bool_))
+    valid &= np.greater(K_, 0.0)
+    valid &= np.greater_equal(T_, 0.0)
+    valid &= np.greater(vol_, 0.0)
+    return valid
+
+
+# Note: Invalid inputs are swapped for NaN, which every formula propagates without
+# floating point warnings. Only the offending inputs are swapped, so the contract
+# inputs of a masked state still tell which contracts are valid when its spot changes
+_INVALID_INPUT: float = np.nan
+
+
+def _apply_validation(
+    S: _F64, K: _F64, T: _F64, vol: _F64, validation: Validation
+) -> tuple[_F64, _F64, _F64, _F64, NDArray[np.bool_] | None]:
+    """
+    Validates the inputs according to 'validation'
+
+    Under MASK, invalid inputs are swapped for NaN so the kernel runs without floating
+    point warnings, and the returned mask marks the results to be replaced by NaN. The
+    mask is None when every contract is valid.
+    """
+    match validation:
+        case Validation.RAISE:
+            _validate_inputs(S, K, T, vol)
+        case Validation.MASK:
+            valid = validity_mask(S, K, T, vol)
+            if not valid.all():
+                S = np.where(np.greater(S, 0.0), S, _INVALID_INPUT)
+                K = np.where(np.greater(K, 0.0), K, _INVALID_INPUT)
+                T = np.where(np.greater_equal(T, 0.0), T, _INVALID_INPUT)
+                vol = np.where(np.greater(vol, 0.0), vol, _INVALID_INPUT)
+                return S, K, T, vol, valid
+        case Validation.TRUSTED:
+            pass
+    return S, K, T, vol, None
+
+
+def _mask_invalid(result: _F64, valid: NDArray[np.bool_] | None) -> _F64:
+    if valid is not None:
+        np.copyto(result, np.nan, where=~valid)
+    return result
+
+
+# d1 placeholders for expired contracts (T == 0), where the price is the payoff
+_EXPIRED_ITM_D1: float = 1e10
+_EXPIRED_OTM_D1: float = 1e-10
+
+
+def _live(T: _F64, workspace: PricingWorkspace | None) -> NDArray[np.bool_]:
+    """Mask of contracts that have not expired (T > 0)"""
+    live = workspace_buffer(workspace, "live", T.shape, np.bool_)
+    return np.greater(T, 0.0, out=live)
+
+
+def _d1_d2(
+    S: _F64,
+    K: _F64,
+    T: _F64,
+    r: _F64,
+    vol: _F64,
+    vol_sqrt_t: _F64,
+    live: NDArray[np.bool_],
+    workspace: PricingWorkspace | None = None,
+) -> tuple[_F64, _F64]:
+    """
+    Black-Scholes d1 and d2 evaluated into two buffers of the broadcast shape
+
+    d2 doubles as scratch space for the drift term, so no other temporaries are
+    created for live contracts
+    """
+    shape = np.broadcast_shapes(S.shape, K.shape, T.shape, r.shape, vol.shape)
+    d1 = workspace_buffer(workspace, "d1", shape, S.dtype)
+    d2 = workspace_buffer(workspace, "d2", shape, S.dtype)
+
+    np.divide(S, K, out=d1)
+    np.log(d1, out=d1)
+
+    np.square(vol, out=d2)
+    d2 *= 0.5
+    d2 += r
+    d2 *= T
+    d1 += d2
+
+    return _standardize_d1_d2(d1, d2, S, K, vol_sqrt_t, live)
+
+
+def _standardize_d1_d2(
+    d1: _F64, d2: _F64, S: _F64, K: _F64, vol_sqrt_t: _F64, live: NDArray[np.bool_]
+) -> tuple[_F64, _F64]:
+    """
+    Turns d1 = log(S / K) + (r + vol^2 / 2) * T into the final d1 and d2 in place
+
+    d2 is only used as an output buffer, its incoming values are overwritten
+    """
+    np.divide(d1, vol_sqrt_t, out=d1, where=live)
+    if not live.all():
+        expired_d1 = np.where(S >= K, _EXPIRED_ITM_D1, _EXPIRED_OTM_D1)
+        np.copyto(d1, expired_d1, where=~live)
+
+    np.subtract(d1, vol_sqrt_t, out=d2)
+    return d1, d2
+
+
+def _settle_expired(
+    price: _F64, live: NDArray[np.bool_], payoff: Callable[[], _F64]
+) -> _F64:
+    """Replace the model price with the intrinsic payoff wherever T == 0"""
+    if not live.all():
+        np.copyto(price, np.broadcast_to(payoff(), price.shape), where=~live)
+    return price
+
+
+def _time_factors(
+    T: _F64,
+    r: _F64,
+    term_structure: TermStructure | None,
+    workspace: PricingWorkspace | None = None,
+) -> tuple[_F64, _F64]:
+    """sqrt(T) and exp{-rT}, gathered from the term structure buckets when given"""
+    if term_structure is not None:
+        term_structure.check_inputs(T, r)
+        return (
+            term_structure.sqrt_t.astype(T.dtype, copy=False),
+            term_structure.discount.astype(T.dtype, copy=False),
+        )
+
+    sqrt_t = np.sqrt(T, out=workspace_buffer(workspace, "sqrt_t", T.shape, T.dtype))
+    discount = workspace_buffer(
+        workspace, "discount", np.broadcast_shapes(T.shape, r.shape), T.dtype
+    )
+    np.multiply(r, T, out=discount)
+    np.negative(discount, out=discount)
+    np.exp(discount, out=discount)
+    return sqrt_t, discount
+
+
+def _price_kernel(
+    S: _F64,
+    K: _F64,
+    T: _F64,
+    r: _F64,
+    vol: _F64,
+    option_type: OptionType,
+    sqrt_t: _F64,
+    discount: _F64,
+    out: _F64 | None = None,
+    workspace: PricingWorkspace | None = None,
+    precision: Precision = Precision.EXACT,
+) -> _F64:
+    """
+    Fused price evaluation that skips the Greek-only fields of 'BlackScholesState'
+
+    The CDFs are written over the d1/d2 buffers in place. Without 'out' or a workspace
+    the price also reuses the d1 buffer, otherwise it is written to 'out' (or a fresh
+    array) so the result never aliases workspace memory.
+    """
+    live = _live(T, workspace)
+    vol_sqrt_t = np.multiply(
+        vol,
+        sqrt_t,
+        out=workspace_buffer(
+            workspace,
+            "vol_sqrt_t",
+            np.broadcast_shapes(vol.shape, sqrt_t.shape),
+            vol.dtype,
+        ),
+    )
+    d1, d2 = _d1_d2(S, K, T, r, vol, vol_sqrt_t, live, workspace)
+    strike_pv = np.multiply(
+        K,
+        discount,
+        out=workspace_buffer(
+            workspace,
+            "strike_pv",
+            np.broadcast_shapes(K.shape, discount.shape),
+            K.dtype,
+        ),
+    )
+
+    if out is not None:
+        price = check_out(out, d1.shape, d1.dtype)
+    elif workspace is None:
+        price = d1
+    else:
+        price = np.empty(d1.shape, dtype=d1.dtype)
+
+    match option_type:
+        case "call":
+            norm_cdf(d1, out=d1, precision=precision)
+            norm_cdf(d2, out=d2, precision=precision)
+            d1 *= S
+            d2 *= strike_pv
+            np.subtract(d1, d2, out=price)
+            return _settle_expired(price, live, lambda: np.maximum(S - strike_pv, 0.0))
+        case "put":
+            np.negative(d1, out=d1)
+            np.negative(d2, out=d2)
+            norm_cdf(d1, out=d1, precision=precision)
+            norm_cdf(d2, out=d2, precision=precision)
+            d1 *= S
+            d2 *= strike_pv
+            np.subtract(d2, d1, out=price)
+            return _settle_expired(price, live, lambda: np.maximum(strike_pv - S, 0.0))
+
+
+@dataclass(frozen=True)
 class BlackScholesState:
     """
     Parameters:
@@ -34,6 +277,11 @@ class BlackScholesState:
         T:          Time to expiration (in years)
         r:          Risk-free rate (annualized)
         vol:        Volatility (annualized)
+        workspace:  Optional buffers the derived fields are written into
+        precision:  Floating point type and normal CDF of every field
+        valid:      Mask of valid contracts under Validation.MASK, None when all are
+        validation: How the inputs were validated, 'update_spot' checks the new spot
+                    the same way
 
         d1:         Black Scholes d1 component
         d2:         Black-Scholes d2 component
@@ -46,6 +294,11 @@ class BlackScholesState:
         sqrt_t:     sqrt(T) -- Root time
         discount:   exp{-rT} -- Discount factor
         vol_sqrt_t: vol * sqrt(T) -- Total volatility
+        strike_pv:  K * exp{-rT} -- Discounted strike
+        live:       T > 0 -- Contracts that have not expired
+
+    Only the inputs are stored on construction, every derived field is evaluated the
+    first time a price or Greek reads it and is cached on the instance afterwards
     """
 
     S: _F64
@@ -53,64 +306,317 @@ class BlackScholesState:
     T: _F64
     r: _F64
     vol: _F64
+    workspace: PricingWorkspace | None = field(default=None, repr=False, compare=False)
+    precision: Precision = Precision.EXACT
+    valid: NDArray[np.bool_] | None = field(default=None, repr=False, compare=False)
+    validation: Validation = field(default=Validation.RAISE, compare=False)
 
-    d1: _F64
-    d2: _F64
-    cdf_d1: _F64
-    cdf_d2: _F64
-    cdf_nd1: _F64
-    cdf_nd2: _F64
-    pdf_d1: _F64
+    @classmethod
+    def build(
+        cls,
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        vol: ArrayLike,
+        term_structure: TermStructure | None = None,
+        workspace: PricingWorkspace | None = None,
+        precision: Precision = Precision.EXACT,
+        validation: Validation = Validation.RAISE,
+    ) -> "BlackScholesState":
+        """
+        Under Validation.MASK the d1 and d2 of invalid contracts are NaN, so every
+        price and Greek read from the state is NaN for them
+        """
+        start = METRICS.start()
+        S_, K_, T_, r_, vol_ = (to_precision(x, precision) for x in (S, K, T, r, vol))
+        S_, K_, T_valid, vol_, valid = _apply_validation(S_, K_, T_, vol_, validation)
+        state = cls(
+            S=S_,
+            K=K_,
+            T=T_valid,
+            r=r_,
+            vol=vol_,
+            workspace=workspace,
+            precision=precision,
+            valid=valid,
+            validation=validation,
+        )
+
+        if term_structure is not None:
+            # The term structure was built from the inputs as given
+            sqrt_t, discount = _time_factors(T_, r_, term_structure)
+            vars(state).update(sqrt_t=sqrt_t, discount=discount)
+
+        if METRICS.enabled:
+            METRICS.stop("state.build", start, math.prod(state.shape))
+        return state
+
+    def scratch(self, name: str, shape: tuple[int, ...] | None = None) -> _F64:
+        """Named buffer from the state's workspace, or a fresh array without one"""
+        return workspace_buffer(
+            self.workspace,
+            name,
+            self.shape if shape is None else shape,
+            self.precision.dtype,
+        )
+
+    @cached_property
+    def shape(self) -> tuple[int, ...]:
+        return np.broadcast_shapes(
+            self.S.shape, self.K.shape, self.T.shape, self.r.shape, self.vol.shape
+        )
+
+    @cached_property
+    def live(self) -> NDArray[np.bool_]:
+        return _live(self.T, self.workspace)
+
+    @cached_property
+    def sqrt_t(self) -> _F64:
+        return np.sqrt(self.T, out=self.scratch("sqrt_t", self.T.shape))
+
+    @cached_property
+    def vol_sqrt_t(self) -> _F64:
+        shape = np.broadcast_shapes(self.vol.shape, self.T.shape)
+        return np.multiply(self.vol, self.sqrt_t, out=self.scratch("vol_sqrt_t", shape))
+
+    @cached_property
+    def discount(self) -> _F64:
+        return _time_factors(self.T, self.r, None, self.workspace)[1]
+
+    @cached_property
+    def strike_pv(self) -> _F64:
+        shape = np.broadcast_shapes(self.K.shape, self.discount.shape)
+        return np.multiply(self.K, self.discount, out=self.scratch("strike_pv", shape))
+
+    @cached_property
+    def _d1_d2(self) -> tuple[_F64, _F64]:
+        start = METRICS.start()
+        d1, d2 = _d1_d2(
+            self.S,
+            self.K,
+            self.T,
+            self.r,
+            self.vol,
+            self.vol_sqrt_t,
+            self.live,
+            self.workspace,
+        )
+        METRICS.stop("state.d1_d2", start, d1.size)
+        return _mask_invalid(d1, self.valid), _mask_invalid(d2, self.valid)
+
+    @property
+    def d1(self) -> _F64:
+        return self._d1_d2[0]
+
+    @property
+    def d2(self) -> _F64:
+        return self._d1_d2[1]
+
+    @cached_property
+    def cdf_d1(self) -> _F64:
+        return norm_cdf(self.d1, self.scratch("cdf_d1"), self.precision)
+
+    @cached_property
+    def cdf_d2(self) -> _F64:
+        return norm_cdf(self.d2, self.scratch("cdf_d2"), self.precision)
+
+    # Note: The tails are evaluated from -d rather than as 1 - N(d), which cancels to
+    # zero for deep out of the money puts and takes their prices, deltas and rhos with it
+
+    @cached_property
+    def cdf_nd1(self) -> _F64:
+        tail = np.negative(self.d1, out=self.scratch("cdf_nd1"))
+        return norm_cdf(tail, tail, self.precision)
+
+    @cached_property
+    def cdf_nd2(self) -> _F64:
+        tail = np.negative(self.d2, out=self.scratch("cdf_nd2"))
+        return norm_cdf(tail, tail, self.precision)
+
+    @cached_property
+    def pdf_d1(self) -> _F64:
+        return norm_pdf(self.d1, out=self.scratch("pdf_d1"))
+
+    @cached_property
+    def statics(self) -> "BlackScholesStatics":
+        return BlackScholesStatics.from_state(self)
+
+    def update_spot(self, S: ArrayLike) -> "BlackScholesState":
+        """New state at spot S that reuses every field which does not depend on S"""
+        return self.statics.reprice(S, self.workspace)
+
+    def _output(self, out: _F64 | None) -> _F64:
+        if out is None:
+            return np.empty(self.shape, dtype=self.precision.dtype)
+        return check_out(out, self.shape, self.precision.dtype)
+
+    def call_price(self, out: _F64 | None = None) -> _F64:
+        price = np.multiply(self.S, self.cdf_d1, out=self._output(out))
+        price -= np.multiply(
+            self.strike_pv, self.cdf_d2, out=self.scratch("price_scratch")
+        )
+        price = _settle_expired(
+            price, self.live, lambda: np.maximum(self.S - self.strike_pv, 0.0)
+        )
+        # Invalid contracts that have also expired would otherwise get their payoff
+        return _mask_invalid(price, self.valid)
+
+    def put_price(self, out: _F64 | None = None) -> _F64:
+        price = np.multiply(self.strike_pv, self.cdf_nd2, out=self._output(out))
+        price -= np.multiply(self.S, self.cdf_nd1, out=self.scratch("price_scratch"))
+        price = _settle_expired(
+            price, self.live, lambda: np.maximum(self.strike_pv - self.S, 0.0)
+        )
+        return _mask_invalid(price, self.valid)
+
+
+@dataclass(frozen=True)
+class BlackScholesStatics:
+    """
+    Spot independent part of a Black-Scholes state, precomputed once per contract
+
+    Parameters:
+
+        K:          Strike price
+        T:          Time to expiration (in years)
+        r:          Risk-free rate (annualized)
+        vol:        Volatility (annualized)
+
+        sqrt_t:     sqrt(T) -- Root time
+        discount:   exp{-rT} -- Discount factor
+        vol_sqrt_t: vol * sqrt(T) -- Total volatility
+        log_k:      log(K) -- Log strike
+        drift:      (r + vol^2 / 2) * T -- Drift term of d1
+        live:       T > 0 -- Contracts that have not expired
+        precision:  Precision tier of the states it reprices
+        valid:      Mask of the contracts with valid K, T and vol, None when all are
+        validation: How 'reprice' checks the spot, carried over from the state
+
+    'reprice' only evaluates the spot dependent pieces (d1, d2 and what follows from
+    them), which is what a live tick changes while K, T, r and vol stay fixed. Under
+    Validation.MASK the spot part of the mask is recomputed on every tick.
+    """
+
+    K: _F64
+    T: _F64
+    r: _F64
+    vol: _F64
 
     sqrt_t: _F64
     discount: _F64
     vol_sqrt_t: _F64
+    log_k: _F64
+    drift: _F64
+    live: NDArray[np.bool_]
+    precision: Precision = Precision.EXACT
+    valid: NDArray[np.bool_] | None = field(default=None, repr=False, compare=False)
+    validation: Validation = field(default=Validation.RAISE, compare=False)
 
     @classmethod
     def build(
-        cls, S: ArrayLike, K: ArrayLike, T: ArrayLike, r: ArrayLike, vol: ArrayLike
-    ) -> "BlackScholesState":
-        S_, K_, T_, r_, vol_ = map(to_f64, (S, K, T, r, vol))
-        _validate_inputs(S_, K_, T_, vol_)
+        cls,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        vol: ArrayLike,
+        term_structure: TermStructure | None = None,
+        precision: Precision = Precision.EXACT,
+    ) -> "BlackScholesStatics":
+        K_, T_, r_, vol_ = (to_precision(x, precision) for x in (K, T, r, vol))
+        _validate_contract(K_, T_, vol_)
+        sqrt_t, discount = _time_factors(T_, r_, term_structure)
+        return cls._from_inputs(K_, T_, r_, vol_, sqrt_t, discount, precision)
 
-        sqrt_t = np.sqrt(T_)
-        vol_sqrt_t = vol_ * sqrt_t
-        safe_vol_sqrt_t = np.where(T_ > 0, vol_sqrt_t, 1.0)
-
-        d1 = (np.log(S_ / K_) + (r_ + 0.5 * np.square(vol_)) * T_) / safe_vol_sqrt_t
-        d1 = np.where(T_ > 0, d1, np.where(S_ >= K_, 1e10, 1e-10))
-        d2 = d1 - vol_sqrt_t
+    @classmethod
+    def from_state(cls, state: BlackScholesState) -> "BlackScholesStatics":
+        sqrt_t, discount = state.sqrt_t, state.discount
+        if state.workspace is not None:
+            # Workspace buffers are overwritten by the next build, statics must outlive it
+            sqrt_t, discount = sqrt_t.copy(), discount.copy()
+        statics = cls._from_inputs(
+            state.K, state.T, state.r, state.vol, sqrt_t, discount, state.precision
+        )
+        if state.validation is not Validation.MASK:
+            return replace(statics, validation=state.validation)
 
-        cdf_d1 = norm.cdf(d1)
-        cdf_d2 = norm.cdf(d2)
+        # Invalid contract inputs are NaN in a masked state, so they fail the mask again
+        valid = validity_mask(1.0, state.K, state.T, state.vol)
+        return replace(
+            statics, validation=state.validation, valid=None if valid.all() else valid
+        )
 
+    @classmethod
+    def _from_inputs(
+        cls,
+        K: _F64,
+        T: _F64,
+        r: _F64,
+        vol: _F64,
+        sqrt_t: _F64,
+        discount: _F64,
+        precision: Precision = Precision.EXACT,
+    ) -> "BlackScholesStatics":
         return cls(
-            S=S_,
-            K=K_,
-            T=T_,
-            r=r_,
-            vol=vol_,
-            d1=d1,
-            d2=d2,
-            cdf_d1=cdf_d1,
-            cdf_d2=cdf_d2,
-            pdf_d1=norm.pdf(d1),
-            cdf_nd1=1.0 - cdf_d1,
-            cdf_nd2=1.0 - cdf_d2,
+            K=K,
+            T=T,
+            r=r,
+            vol=vol,
             sqrt_t=sqrt_t,
-            discount=np.exp(-r_ * T_),
-            vol_sqrt_t=vol_sqrt_t,
+            discount=discount,
+            vol_sqrt_t=vol * sqrt_t,
+            log_k=np.log(K),
+            drift=(r + 0.5 * np.square(vol)) * T,
+            live=_live(T, None),
+            precision=precision,
         )
 
-    def call_price(self) -> _F64:
-        payoff = np.maximum(self.S - self.K * self.discount, 0.0)
-        price = self.S * self.cdf_d1 - self.K * self.discount * self.cdf_d2
-        return np.where(self.T > 0, price, payoff)
+    def reprice(
+        self, S: ArrayLike, workspace: PricingWorkspace | None = None
+    ) -> BlackScholesState:
+        """State at spot S with the spot independent fields already populated"""
+        S_ = to_precision(S, self.precision)
+        valid = self.valid
+        match self.validation:
+            case Validation.RAISE:
+                _validate_spot(S_)
+            case Validation.MASK:
+                spot_valid = np.greater(S_, 0.0)
+                if not spot_valid.all():
+                    S_ = np.where(spot_valid, S_, _INVALID_INPUT)
+                    valid = spot_valid if valid is None else spot_valid & valid
+            case Validation.TRUSTED:
+                pass
 
-    def put_price(self) -> _F64:
-        payoff = np.maximum(self.K * self.discount - self.S, 0.0)
-        price = self.K * self.discount * self.cdf_nd2 - self.S * self.cdf_nd1
-        return np.where(self.T > 0, price, payoff)
+        shape = np.broadcast_shapes(S_.shape, self.log_k.shape, self.drift.shape)
+        d1 = workspace_buffer(workspace, "d1", shape, S_.dtype)
+        d2 = workspace_buffer(workspace, "d2", shape, S_.dtype)
+        np.log(S_, out=d1)
+        d1 -= self.log_k
+        d1 += self.drift
+
+        state = BlackScholesState(
+            S=S_,
+            K=self.K,
+            T=self.T,
+            r=self.r,
+            vol=self.vol,
+            workspace=workspace,
+            precision=self.precision,
+            valid=valid,
+            validation=self.validation,
+        )
+        d1, d2 = _standardize_d1_d2(d1, d2, S_, self.K, self.vol_sqrt_t, self.live)
+        # Seed the lazy fields directly, 'cached_property' reads them from __dict__
+        vars(state).update(
+            sqrt_t=self.sqrt_t,
+            discount=self.discount,
+            vol_sqrt_t=self.vol_sqrt_t,
+            live=self.live,
+            statics=self,
+            _d1_d2=(_mask_invalid(d1, valid), _mask_invalid(d2, valid)),
+        )
+        return state
 
 
 def build_black_scholes_state(*args, **kwargs) -> BlackScholesState:
@@ -124,11 +630,30 @@ def black_scholes_price(
     r: ArrayLike,
     vol: ArrayLike,
     option_type: OptionType = "call",
+    term_structure: TermStructure | None = None,
+    out: _F64 | None = None,
+    workspace: PricingWorkspace | None = None,
+    precision: Precision = Precision.EXACT,
+    validation: Validation = Validation.RAISE,
 ) -> _F64:
-    state = BlackScholesState.build(S, K, T, r, vol)
-
-    match option_type:
-        case "call":
-            return state.call_price()
-        case "put":
-            return state.put_price()
+    start = METRICS.start()
+    S_, K_, T_, r_, vol_ = (to_precision(x, precision) for x in (S, K, T, r, vol))
+    S_, K_, T_valid, vol_, valid = _apply_validation(S_, K_, T_, vol_, validation)
+    sqrt_t, discount = _time_factors(
+        T_valid if term_structure is None else T_, r_, term_structure, workspace
+    )
+    price = _price_kernel(
+        S_,
+        K_,
+        T_valid,
+        r_,
+        vol_,
+        option_type,
+        sqrt_t,
+        discount,
+        out,
+        workspace,
+        precision,
+    )
+    METRICS.stop("pricing.price", start, price.size)
+    return _mask_invalid(price, valid)
@@ -0,0 +1,204 @@
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass, fields
+from typing import Any
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from bspx.numeric_utils import to_f64
+from bspx.pricing.black_scholes_model import BlackScholesState, black_scholes_price
+from bspx.types import _F64, OptionType
+
+
+@dataclass
+class CacheStats:
+    """
+    Parameters:
+
+        hits:           Lookups answered from the cache
+        misses:         Lookups that had to compute, including near misses
+        near_misses:    Lookups whose rounded key matched an entry with different
+                        exact inputs, the entry is recomputed and replaced
+        evictions:      Entries dropped because the cache was full
+    """
+
+    hits: int = 0
+    misses: int = 0
+    near_misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class _Entry:
+    inputs: tuple[Any, ...]
+    value: Any
+
+
+def _freeze(x: Any) -> Any:
+    if isinstance(x, np.ndarray):
+        x.flags.writeable = False
+    return x
+
+
+# Lazy fields of a state, evaluated before the state is shared
+_STATE_FIELDS: tuple[str, ...] = (
+    "live",
+    "sqrt_t",
+    "vol_sqrt_t",
+    "discount",
+    "strike_pv",
+    "d1",
+    "d2",
+    "cdf_d1",
+    "cdf_d2",
+    "cdf_nd1",
+    "cdf_nd2",
+    "pdf_d1",
+)
+
+
+def _build_state(*inputs: Any) -> BlackScholesState:
+    """
+    State with every lazy field evaluated and frozen up front
+
+    A cached state is shared by every caller and thread that looks it up, so nothing
+    may be written to it afterwards: 'cached_property' would otherwise fill in fields
+    concurrently. The state has no workspace, so the scratch buffers its prices and
+    Greeks ask for are fresh arrays for every call.
+    """
+    state = BlackScholesState.build(*inputs)
+    for name in _STATE_FIELDS:
+        _freeze(getattr(state, name))
+    for statics_field in fields(state.statics):
+        _freeze(getattr(state.statics, statics_field.name))
+    return state
+
+
+def _same_inputs(stored: tuple[Any, ...], given: tuple[Any, ...]) -> bool:
+    return all(
+        np.array_equal(a, b, equal_nan=True) if isinstance(a, np.ndarray) else a == b
+        for a, b in zip(stored, given, strict=True)
+    )
+
+
+class PricingCache:
+    """
+    Opt-in, size-bounded LRU cache for states, prices and implied volatilities
+
+    Entries are keyed on the input values rounded to 'decimals' (None keys on the
+    exact values), but a lookup only hits when the exact inputs match as well. Inputs
+    that differ below the rounding tolerance are recomputed and replace the entry they
+    collide with, so a noisy feed reuses one slot per quote instead of filling the
+    cache with near duplicates, and a stale result is never returned.
+
+    Cached inputs and results are read-only copies, so callers can neither alter an
+    entry nor see it change when they reuse their own input buffers. The cache is safe
+    to share between threads.
+    """
+
+    def __init__(self, maxsize: int = 1024, decimals: int | None = 10) -> None:
+        if maxsize < 1:
+            raise ValueError(f"Error: 'maxsize' must be at least 1\n Got: {maxsize}")
+
+        self.maxsize = maxsize
+        self.decimals = decimals
+        self.stats = CacheStats()
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.stats = CacheStats()
+
+    def build_state(
+        self, S: ArrayLike, K: ArrayLike, T: ArrayLike, r: ArrayLike, vol: ArrayLike
+    ) -> BlackScholesState:
+        """Cached state, read-only with every derived field already evaluated"""
+        return self._lookup("state", (S, K, T, r, vol), _build_state)
+
+    def price(
+        self,
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        vol: ArrayLike,
+        option_type: OptionType = "call",
+    ) -> _F64:
+        return self._lookup(
+            "price", (S, K, T, r, vol, option_type), black_scholes_price
+        )
+
+    def implied_vol(
+        self,
+        market_price: float,
+        S: float,
+        K: float,
+        T: float,
+        r: float,
+        option_type: OptionType = "call",
+    ) -> float:
+        # Imported here since bspx.volatility itself imports bspx.pricing
+        from bspx.volatility import implied_vol
+
+        def solve(*inputs: Any) -> float:
+            *values, side = inputs
+            return implied_vol(*(float(x) for x in values), side)
+
+        return self._lookup(
+            "implied_vol", (market_price, S, K, T, r, option_type), solve
+        )
+
+    def _inputs(self, args: tuple[Any, ...]) -> tuple[Any, ...]:
+        return tuple(a if isinstance(a, str) else to_f64(a) for a in args)
+
+    def _key(self, name: str, inputs: tuple[Any, ...]) -> Hashable:
+        parts: list[Hashable] = [name]
+        for x in inputs:
+            if isinstance(x, str):
+                parts.append(x)
+                continue
+            # Adding 0.0 folds -0.0 into 0.0 so both round to the same bytes
+            rounded = x if self.decimals is None else np.round(x, self.decimals) + 0.0
+            parts.append((x.shape, rounded.tobytes()))
+        return tuple(parts)
+
+    def _lookup(self, name: str, args: tuple[Any, ...], compute: Callable) -> Any:
+        inputs = self._inputs(args)
+        key = self._key(name, inputs)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and _same_inputs(entry.inputs, inputs):
+                self.stats.hits += 1
+                self._entries.move_to_end(key)
+                return entry.value
+
+            self.stats.misses += 1
+            if entry is not None:
+                self.stats.near_misses += 1
+
+        # Computed outside the lock from private copies of the inputs
+        stored = tuple(
+            _freeze(x.copy()) if isinstance(x, np.ndarray) else x for x in inputs
+        )
+        value = _freeze(compute(*stored))
+
+        with self._lock:
+            self._entries[key] = _Entry(stored, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+        return value
@@ -0,0 +1,161 @@
+from collections.abc import Iterator
+from math import prod
+from types import EllipsisType
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from bspx.numeric_utils import to_precision
+from bspx.pricing.black_scholes_model import black_scholes_price
+from bspx.pricing.workspace import PricingWorkspace, check_out
+from bspx.types import _F64, OptionType, Precision, Validation
+
+DEFAULT_MEMORY_BUDGET: int = 2 * 2**20  # 2 MiB, keeps block temporaries cache-resident
+
+# Batch-sized buffers the fused kernel holds at once: d1, d2, sqrt(T), exp{-rT},
+# vol * sqrt(T), K * exp{-rT} and the block of output
+_KERNEL_BUFFERS: int = 7
+
+# Slices over the leading axes followed by an Ellipsis, which keeps 0-d blocks as
+# array views
+type BlockIndex = tuple[slice | EllipsisType, ...]
+
+
+def block_slices(shape: tuple[int, ...], max_elements: int) -> Iterator[BlockIndex]:
+    """
+    Blocks of at most 'max_elements' elements, as slices over the leading axes
+
+    Whole rows (the trailing axes) are grouped along the leading axis while they fit.
+    A row larger than 'max_elements' is split along its own axes, one index of the
+    outer axes at a time, so the budget holds whatever the shape
+    """
+    if not shape:
+        yield (...,)
+        return
+
+    # First axis whose trailing axes fit in one block
+    axis = 0
+    while axis < len(shape) - 1 and prod(shape[axis + 1 :]) > max_elements:
+        axis += 1
+
+    step = max(1, max_elements // max(prod(shape[axis + 1 :]), 1))
+    for outer in np.ndindex(*shape[:axis]):
+        head = tuple(slice(i, i + 1) for i in outer)
+        for start in range(0, shape[axis], step):
+            yield (*head, slice(start, min(start + step, shape[axis])), ...)
+
+
+def broadcast_inputs(
+    S: ArrayLike,
+    K: ArrayLike,
+    T: ArrayLike,
+    r: ArrayLike,
+    vol: ArrayLike,
+    precision: Precision = Precision.EXACT,
+) -> tuple[tuple[int, ...], list[NDArray]]:
+    """Inputs in the floating point type of the precision tier, with their shape"""
+    inputs = [to_precision(x, precision) for x in (S, K, T, r, vol)]
+    return np.broadcast_shapes(*(x.shape for x in inputs)), inputs
+
+
+def block_inputs(
+    inputs: list[NDArray], index: BlockIndex, shape: tuple[int, ...]
+) -> list[NDArray]:
+    """
+    Views of each input for one block
+
+    An input is only sliced along the axes it varies on, the others keep their own
+    (smaller) size, so terms like sqrt(T) stay small when T is a scalar or a row
+    """
+    slices = [s for s in index if isinstance(s, slice)]
+    return [_block_view(x, slices, len(shape)) for x in inputs]
+
+
+def _block_view(x: NDArray, slices: list[slice], ndim: int) -> NDArray:
+    # Inputs are aligned on the trailing axes of the broadcast shape
+    offset = ndim - x.ndim
+    view_index = tuple(
+        slices[offset + axis]
+        if offset + axis < len(slices) and x.shape[axis] != 1
+        else slice(None)
+        for axis in range(x.ndim)
+    )
+    if all(s == slice(None) for s in view_index):
+        return x
+    return x[view_index]
+
+
+def _block_elements(memory_budget: int, precision: Precision) -> int:
+    itemsize = np.dtype(precision.dtype).itemsize
+    return max(1, memory_budget // (_KERNEL_BUFFERS * itemsize))
+
+
+def iter_price_chunks(
+    S: ArrayLike,
+    K: ArrayLike,
+    T: ArrayLike,
+    r: ArrayLike,
+    vol: ArrayLike,
+    option_type: OptionType = "call",
+    memory_budget: int = DEFAULT_MEMORY_BUDGET,
+    validation: Validation = Validation.RAISE,
+    precision: Precision = Precision.EXACT,
+) -> Iterator[tuple[BlockIndex, _F64]]:
+    """
+    Streams Black-Scholes prices block by block as (index, prices) pairs
+
+    Temporaries are held in one workspace sized by 'memory_budget' (in bytes), so peak
+    memory does not grow with the size of the grid. Indexing a full-sized result with
+    'index' places each block.
+    """
+    shape, inputs = broadcast_inputs(S, K, T, r, vol, precision)
+    workspace = PricingWorkspace()
+
+    for index in block_slices(shape, _block_elements(memory_budget, precision)):
+        yield (
+            index,
+            black_scholes_price(
+                *block_inputs(inputs, index, shape),
+                option_type,
+                workspace=workspace,
+                precision=precision,
+                validation=validation,
+            ),
+        )
+
+
+def black_scholes_price_chunked(
+    S: ArrayLike,
+    K: ArrayLike,
+    T: ArrayLike,
+    r: ArrayLike,
+    vol: ArrayLike,
+    option_type: OptionType = "call",
+    memory_budget: int = DEFAULT_MEMORY_BUDGET,
+    out: _F64 | None = None,
+    validation: Validation = Validation.RAISE,
+    precision: Precision = Precision.EXACT,
+) -> _F64:
+    """
+    Black-Scholes prices of a large grid, evaluated in cache-sized blocks
+
+    Each block is written straight into 'out' (allocated once when not given), so the
+    only memory beyond the result is a workspace bounded by 'memory_budget' (in bytes)
+    """
+    shape, inputs = broadcast_inputs(S, K, T, r, vol, precision)
+    if out is None:
+        out = np.empty(shape, dtype=precision.dtype)
+    else:
+        out = check_out(out, shape, precision.dtype)
+    workspace = PricingWorkspace()
+
+    for index in block_slices(shape, _block_elements(memory_budget, precision)):
+        black_scholes_price(
+            *block_inputs(inputs, index, shape),
+            option_type,
+            out=out[index],
+            workspace=workspace,
+            precision=precision,
+            validation=validation,
+        )
+    return out
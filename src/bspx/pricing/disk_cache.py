@@ -0,0 +1,190 @@
+import hashlib
+import os
+import tempfile
+from collections.abc import Callable
+from contextlib import suppress
+from pathlib import Path
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from bspx.instruments import GREEKS_DTYPE, Greeks
+from bspx.numeric_utils import to_f64
+from bspx.paths import DATA_DIR
+from bspx.pricing.black_scholes_model import black_scholes_price
+from bspx.pricing.cache import CacheStats
+from bspx.types import _F64, DayCount, OptionType
+
+DEFAULT_CACHE_DIR: Path = DATA_DIR / "cache"
+DEFAULT_MAX_BYTES: int = 2**30  # 1 GiB
+
+# Bumped whenever a formula changes, so results of older versions are never served
+_FORMAT_VERSION: int = 1
+
+
+class DiskCache:
+    """
+    Persistent, content-addressed cache of batch prices, Greeks and implied vols
+
+    Each result is stored as one '.npy' file named after a hash of the call (its name,
+    parameters and the exact bytes of every input array), so an unchanged book maps to
+    the same files on every run and any changed input maps to new ones. Hits are
+    memory-mapped read-only instead of loaded, a freshly computed result is returned
+    read-only as well. Files are written atomically, so concurrent jobs never read a
+    partial result.
+
+    When the directory grows past 'max_bytes' the least recently used files are
+    deleted, a hit refreshes the modification time that this order is based on.
+    """
+
+    def __init__(
+        self,
+        directory: Path | str = DEFAULT_CACHE_DIR,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        if max_bytes < 1:
+            raise ValueError(
+                f"Error: 'max_bytes' must be at least 1\n Got: {max_bytes}"
+            )
+
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+
+    def price(
+        self,
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        vol: ArrayLike,
+        option_type: OptionType = "call",
+    ) -> _F64:
+        inputs = [to_f64(x) for x in (S, K, T, r, vol)]
+        return self._get_or_compute(
+            "price",
+            inputs,
+            (option_type,),
+            lambda: black_scholes_price(*inputs, option_type),
+        )
+
+    def greeks(
+        self,
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        vol: ArrayLike,
+        option_type: OptionType = "call",
+        day_count: DayCount = DayCount.CALENDAR,
+    ) -> Greeks:
+        """Analytical Greeks, stored as one GREEKS_DTYPE record array"""
+        # Imported here since bspx.greeks itself imports bspx.pricing
+        from bspx.greeks.parallel import calculate_greeks_chunked
+
+        inputs = [to_f64(x) for x in (S, K, T, r, vol)]
+
+        def compute() -> NDArray:
+            shape = np.broadcast_shapes(*(x.shape for x in inputs))
+            records = np.empty(shape, dtype=GREEKS_DTYPE)
+            calculate_greeks_chunked(
+                *inputs, option_type, day_count, out=Greeks.from_records(records)
+            )
+            return records
+
+        records = self._get_or_compute(
+            "greeks", inputs, (option_type, int(day_count)), compute
+        )
+        return Greeks.from_records(records)
+
+    def implied_vol(
+        self,
+        market_price: ArrayLike,
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        option_type: OptionType = "call",
+    ) -> _F64:
+        # Imported here since bspx.volatility itself imports bspx.pricing
+        from bspx.volatility import implied_vol_batch
+
+        inputs = [to_f64(x) for x in (market_price, S, K, T, r)]
+        return self._get_or_compute(
+            "implied_vol",
+            inputs,
+            (option_type,),
+            lambda: implied_vol_batch(*inputs, option_type),
+        )
+
+    @property
+    def nbytes(self) -> int:
+        return sum(path.stat().st_size for path in self._files())
+
+    def clear(self) -> None:
+        for path in self._files():
+            path.unlink(missing_ok=True)
+        self.stats = CacheStats()
+
+    def _files(self) -> list[Path]:
+        if not self.directory.is_dir():
+            return []
+        return list(self.directory.glob("*.npy"))
+
+    def _path(self, name: str, inputs: list[_F64], params: tuple) -> Path:
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(repr((_FORMAT_VERSION, name, params)).encode())
+        for x in inputs:
+            digest.update(repr((x.dtype.str, x.shape)).encode())
+            digest.update(np.ascontiguousarray(x).data)
+        return self.directory / f"{name}-{digest.hexdigest()}.npy"
+
+    def _get_or_compute(
+        self,
+        name: str,
+        inputs: list[_F64],
+        params: tuple,
+        compute: Callable[[], NDArray],
+    ) -> NDArray:
+        path = self._path(name, inputs, params)
+        with suppress(FileNotFoundError):
+            result = np.load(path, mmap_mode="r")
+            os.utime(path)
+            self.stats.hits += 1
+            return result
+
+        self.stats.misses += 1
+        result = compute()
+        self._write(path, result)
+        self._evict(keep=path)
+        # Read-only like a hit, so callers cannot come to rely on writing into it
+        result.flags.writeable = False
+        return result
+
+    def _write(self, path: Path, result: NDArray) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Written next to the target and renamed, readers see all of it or nothing
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                np.save(file, result)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def _evict(self, keep: Path) -> None:
+        files = []
+        for path in self._files():
+            with suppress(FileNotFoundError):
+                files.append((path.stat(), path))
+
+        total = sum(stat.st_size for stat, _ in files)
+        for stat, path in sorted(files, key=lambda item: item[0].st_mtime_ns):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            path.unlink(missing_ok=True)
+            total -= stat.st_size
+            self.stats.evictions += 1
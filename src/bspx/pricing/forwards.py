@@ -2,6 +2,7 @@ import numpy as np
 from numpy.typing import ArrayLike
 
 from bspx.numeric_utils import to_f64
+from bspx.pricing.term_structure import TermStructure
 from bspx.types import _F64
 
 
@@ -10,6 +11,7 @@ def forward_price(
     T: ArrayLike,
     r: ArrayLike,
     q: ArrayLike = 0.0,
+    term_structure: TermStructure | None = None,
 ) -> _F64:
     """
     Risk-neutral forward price of the underlying asset:
@@ -20,6 +22,11 @@ def forward_price(
         T:  Time to expiration (in years)
         r:  Annual risk-free rate
         q:  Dividend yield (defaults to 0 for non-dividend paying assets)
+
+        term_structure: Bucketed curve built from (T, r), reused across calls
     """
     (S_, T_, r_, q_) = map(to_f64, (S, T, r, q))
+    if term_structure is not None:
+        term_structure.check_inputs(T_, r_)
+        return S_ * term_structure.growth(q_)
     return S_ * np.exp((r_ - q_) * T_)
@@ -0,0 +1,104 @@
+import os
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from math import ceil, prod
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from bspx.pricing.chunked import (
+    DEFAULT_MEMORY_BUDGET,
+    BlockIndex,
+    black_scholes_price_chunked,
+    block_inputs,
+    block_slices,
+    broadcast_inputs,
+)
+from bspx.pricing.workspace import check_out
+from bspx.types import _F64, OptionType, Precision, Validation
+
+# Below this many elements per worker the pool hand-off costs more than it saves
+MIN_ELEMENTS_PER_WORKER: int = 16_384
+# Pools kept alive at once, the least recently used worker count is dropped beyond it
+_MAX_THREAD_POOLS: int = 4
+
+
+def default_workers() -> int:
+    return os.cpu_count() or 1
+
+
+@lru_cache(maxsize=_MAX_THREAD_POOLS)
+def _thread_pool(workers: int) -> ThreadPoolExecutor:
+    """
+    One long-lived pool per recent worker count, threads are reused across calls
+
+    An evicted pool is no longer referenced, so its idle threads exit once it is
+    garbage collected
+    """
+    return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bspx")
+
+
+def run_threaded(
+    shape: tuple[int, ...],
+    task: Callable[[BlockIndex], None],
+    workers: int | None = None,
+) -> None:
+    """
+    Runs 'task' over one leading-axis block per worker on a shared thread pool
+
+    The NumPy ufuncs and 'scipy.special' kernels release the GIL, so blocks evaluate
+    concurrently. Small batches run inline on the calling thread.
+    """
+    workers = default_workers() if workers is None else workers
+    if workers < 1:
+        raise ValueError(f"Error: 'workers' must be at least 1\n Got: {workers}")
+
+    size = prod(shape)
+    workers = min(workers, max(1, size // MIN_ELEMENTS_PER_WORKER))
+    blocks = list(block_slices(shape, ceil(size / workers)))
+
+    if workers == 1 or len(blocks) == 1:
+        for index in blocks:
+            task(index)
+        return
+
+    # list() drains the iterator so that worker exceptions propagate here
+    list(_thread_pool(workers).map(task, blocks))
+
+
+def black_scholes_price_threaded(
+    S: ArrayLike,
+    K: ArrayLike,
+    T: ArrayLike,
+    r: ArrayLike,
+    vol: ArrayLike,
+    option_type: OptionType = "call",
+    workers: int | None = None,
+    out: _F64 | None = None,
+    memory_budget: int = DEFAULT_MEMORY_BUDGET,
+    validation: Validation = Validation.RAISE,
+    precision: Precision = Precision.EXACT,
+) -> _F64:
+    """
+    Black-Scholes prices evaluated concurrently by 'workers' threads (all cores by
+    default), each writing its slice of one shared output in cache-sized blocks
+    """
+    shape, inputs = broadcast_inputs(S, K, T, r, vol, precision)
+    if out is None:
+        out = np.empty(shape, dtype=precision.dtype)
+    else:
+        out = check_out(out, shape, precision.dtype)
+
+    def task(index: BlockIndex) -> None:
+        black_scholes_price_chunked(
+            *block_inputs(inputs, index, shape),
+            option_type,
+            memory_budget=memory_budget,
+            out=out[index],
+            validation=validation,
+            precision=precision,
+        )
+
+    run_threaded(shape, task, workers)
+    return out
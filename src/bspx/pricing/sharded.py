@@ -0,0 +1,335 @@
+import multiprocessing as mp
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from contextlib import suppress
+from dataclasses import dataclass
+from math import ceil, prod
+from multiprocessing.shared_memory import SharedMemory
+from threading import Lock
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from bspx.instruments import Greeks
+from bspx.numeric_utils import to_f64
+from bspx.pricing.chunked import (
+    DEFAULT_MEMORY_BUDGET,
+    BlockIndex,
+    black_scholes_price_chunked,
+    block_inputs,
+    block_slices,
+)
+from bspx.pricing.parallel import default_workers
+from bspx.pricing.workspace import check_out
+from bspx.types import _F64, DayCount, OptionType
+
+# Inputs up to this size (scalars, term-structure rows, ...) are sent inline with the
+# task, copying them is cheaper than a shared segment
+_INLINE_ELEMENTS: int = 1024
+
+_GREEK_NAMES: tuple[str, ...] = ("delta", "theta", "gamma", "vega", "rho")
+
+
+@dataclass(frozen=True, slots=True)
+class _SharedRef:
+    """Location of a float64 array inside a named shared memory segment"""
+
+    name: str
+    offset: int
+    shape: tuple[int, ...]
+    strides: tuple[int, ...]
+
+
+type _Operand = _SharedRef | _F64
+
+
+def _open(operand: _Operand, attached: dict[str, SharedMemory]) -> _F64:
+    """Array behind an operand, attaching its segment once per task"""
+    if not isinstance(operand, _SharedRef):
+        return operand
+
+    segment = attached.get(operand.name)
+    if segment is None:
+        segment = attached[operand.name] = SharedMemory(name=operand.name)
+    return np.ndarray(
+        operand.shape,
+        dtype=np.float64,
+        buffer=segment.buf,
+        offset=operand.offset,
+        strides=operand.strides,
+    )
+
+
+def _detach(attached: dict[str, SharedMemory]) -> None:
+    for segment in attached.values():
+        # A traceback may still hold views, the mapping is then released with them
+        with suppress(BufferError):
+            segment.close()
+
+
+def _price_block(
+    attached: dict[str, SharedMemory],
+    operands: list[_Operand],
+    shape: tuple[int, ...],
+    index: BlockIndex,
+    option_type: OptionType,
+    memory_budget: int,
+    out: _SharedRef,
+) -> None:
+    inputs = [_open(x, attached) for x in operands]
+    black_scholes_price_chunked(
+        *block_inputs(inputs, index, shape),
+        option_type,
+        memory_budget=memory_budget,
+        out=_open(out, attached)[index],
+    )
+
+
+def _greeks_block(
+    attached: dict[str, SharedMemory],
+    operands: list[_Operand],
+    shape: tuple[int, ...],
+    index: BlockIndex,
+    option_type: OptionType,
+    day_count: DayCount,
+    memory_budget: int,
+    out: list[_SharedRef],
+) -> None:
+    # Imported here since bspx.greeks itself imports bspx.pricing
+    from bspx.greeks.parallel import calculate_greeks_chunked
+
+    inputs = [_open(x, attached) for x in operands]
+    calculate_greeks_chunked(
+        *block_inputs(inputs, index, shape),
+        option_type,
+        day_count,
+        memory_budget,
+        out=Greeks(*(_open(ref, attached) for ref in out))[index],
+    )
+
+
+def _price_task(*args) -> None:
+    # Views into the segments only live inside '_price_block', so they are gone by
+    # the time the segments are closed
+    attached: dict[str, SharedMemory] = {}
+    try:
+        _price_block(attached, *args)
+    finally:
+        _detach(attached)
+
+
+def _greeks_task(*args) -> None:
+    attached: dict[str, SharedMemory] = {}
+    try:
+        _greeks_block(attached, *args)
+    finally:
+        _detach(attached)
+
+
+class SharedMemoryPool:
+    """
+    Process pool that prices and computes Greeks over arrays in shared memory
+
+    Workers are started once and reused across calls, and each receives only a small
+    description of its slice (segment name, offset, shape), so no array is pickled.
+    Arrays allocated with 'empty' / 'asarray' are read and written in place; any
+    other input is staged into a reused shared segment with one memcpy per call, so
+    calls from several threads run one at a time. Results live in shared memory owned by the pool and stay valid until they are
+    released or the pool is closed.
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        memory_budget: int = DEFAULT_MEMORY_BUDGET,
+        start_method: str = "spawn",
+    ) -> None:
+        self.workers = default_workers() if workers is None else workers
+        if self.workers < 1:
+            raise ValueError(
+                f"Error: 'workers' must be at least 1\n Got: {self.workers}"
+            )
+
+        self.memory_budget = memory_budget
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers, mp_context=mp.get_context(start_method)
+        )
+        self._segments: dict[str, SharedMemory] = {}
+        self._addresses: dict[str, int] = {}
+        self._staging: dict[int, SharedMemory] = {}
+        # Held from staging until the workers are done reading the staged segments
+        self._staging_lock = Lock()
+
+    def __enter__(self) -> "SharedMemoryPool":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def empty(self, shape: tuple[int, ...]) -> _F64:
+        """Uninitialized float64 array in a shared segment owned by the pool"""
+        segment = self._create(prod(shape) * np.dtype(np.float64).itemsize)
+        array = np.ndarray(shape, dtype=np.float64, buffer=segment.buf)
+        self._segments[segment.name] = segment
+        self._addresses[segment.name] = array.__array_interface__["data"][0]
+        return array
+
+    def asarray(self, x: ArrayLike) -> _F64:
+        """'x' as a shared array, without a copy when it already is one"""
+        x_ = to_f64(x)
+        if self._locate(x_) is not None:
+            return x_
+
+        shared = self.empty(x_.shape)
+        np.copyto(shared, x_)
+        return shared
+
+    def release(self, array: _F64) -> None:
+        """Frees the segment behind an array returned by 'empty' or a result"""
+        ref = self._locate(array)
+        if ref is not None:
+            del self._addresses[ref.name]
+            self._free(self._segments.pop(ref.name))
+
+    def close(self) -> None:
+        self._executor.shutdown()
+        for segment in [*self._segments.values(), *self._staging.values()]:
+            self._free(segment)
+        self._segments.clear()
+        self._addresses.clear()
+        self._staging.clear()
+
+    def price(
+        self,
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        vol: ArrayLike,
+        option_type: OptionType = "call",
+        out: _F64 | None = None,
+    ) -> _F64:
+        with self._staging_lock:
+            shape, operands = self._operands(S, K, T, r, vol)
+            if out is None:
+                out = self.empty(shape)
+            out_ref = self._shared_ref(check_out(out, shape, np.float64), "out")
+
+            self._run(
+                shape,
+                lambda index: self._executor.submit(
+                    _price_task,
+                    operands,
+                    shape,
+                    index,
+                    option_type,
+                    self.memory_budget,
+                    out_ref,
+                ),
+            )
+        return out
+
+    def greeks(
+        self,
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        vol: ArrayLike,
+        option_type: OptionType = "call",
+        day_count: DayCount = DayCount.CALENDAR,
+        out: Greeks | None = None,
+    ) -> Greeks:
+        with self._staging_lock:
+            shape, operands = self._operands(S, K, T, r, vol)
+            if out is None:
+                out = Greeks(*(self.empty(shape) for _ in _GREEK_NAMES))
+            out_refs = [
+                self._shared_ref(check_out(getattr(out, name), shape, np.float64), name)
+                for name in _GREEK_NAMES
+            ]
+
+            self._run(
+                shape,
+                lambda index: self._executor.submit(
+                    _greeks_task,
+                    operands,
+                    shape,
+                    index,
+                    option_type,
+                    day_count,
+                    self.memory_budget,
+                    out_refs,
+                ),
+            )
+        return out
+
+    def _run(
+        self, shape: tuple[int, ...], submit: Callable[[BlockIndex], Future[None]]
+    ) -> None:
+        size = prod(shape)
+        blocks = block_slices(shape, ceil(size / self.workers))
+        futures = [submit(index) for index in blocks]
+        try:
+            for future in futures:
+                future.result()
+        except BaseException:
+            # Blocks still running read the staged inputs and write the outputs, so
+            # they finish before either can be reused
+            for future in futures:
+                future.cancel()
+            wait(futures)
+            raise
+
+    def _operands(
+        self, S: ArrayLike, K: ArrayLike, T: ArrayLike, r: ArrayLike, vol: ArrayLike
+    ) -> tuple[tuple[int, ...], list[_Operand]]:
+        inputs = [to_f64(x) for x in (S, K, T, r, vol)]
+        shape = np.broadcast_shapes(*(x.shape for x in inputs))
+
+        operands: list[_Operand] = []
+        for slot, x in enumerate(inputs):
+            if x.size <= _INLINE_ELEMENTS:
+                operands.append(x)
+            else:
+                operands.append(self._locate(x) or self._stage(slot, x))
+        return shape, operands
+
+    def _stage(self, slot: int, x: _F64) -> _SharedRef:
+        """Copies a caller-owned input into the staging segment reused for its slot"""
+        segment = self._staging.get(slot)
+        if segment is None or segment.size < x.nbytes:
+            if segment is not None:
+                self._free(segment)
+            segment = self._staging[slot] = self._create(x.nbytes)
+
+        staged = np.ndarray(x.shape, dtype=np.float64, buffer=segment.buf)
+        np.copyto(staged, x)
+        return _SharedRef(segment.name, 0, staged.shape, staged.strides)
+
+    def _shared_ref(self, array: _F64, name: str) -> _SharedRef:
+        ref = self._locate(array)
+        if ref is None:
+            raise ValueError(
+                f"Error: '{name}' must be allocated with SharedMemoryPool.empty"
+            )
+        return ref
+
+    def _locate(self, array: _F64) -> _SharedRef | None:
+        """Reference to 'array' when its memory lies inside one of the pool segments"""
+        address = array.__array_interface__["data"][0]
+        for name, start in self._addresses.items():
+            if start <= address < start + self._segments[name].size:
+                return _SharedRef(name, address - start, array.shape, array.strides)
+        return None
+
+    @staticmethod
+    def _create(nbytes: int) -> SharedMemory:
+        return SharedMemory(create=True, size=max(nbytes, 1))
+
+    @staticmethod
+    def _free(segment: SharedMemory) -> None:
+        segment.unlink()
+        # Arrays handed out may still view the segment, it is then unmapped with them
+        with suppress(BufferError):
+            segment.close()
@@ -0,0 +1,26 @@
+from collections.abc import Mapping
+from typing import Any
+
+from numpy.typing import ArrayLike
+
+from bspx.ingest import market_columns
+from bspx.pricing.black_scholes_model import black_scholes_price
+from bspx.types import _F64, OptionType, Validation
+
+
+def black_scholes_price_table(
+    table: Any,
+    option_type: OptionType = "call",
+    columns: Mapping[str, str] | None = None,
+    validation: Validation = Validation.RAISE,
+    **values: ArrayLike,
+) -> _F64:
+    """
+    Black-Scholes prices of every row of a pandas DataFrame or pyarrow Table
+
+    Columns are located and viewed (or converted once) by 'bspx.ingest.market_columns',
+    see there for 'columns' and keyword overrides such as r=0.03
+    """
+    return black_scholes_price(
+        *market_columns(table, columns, **values), option_type, validation=validation
+    )
@@ -0,0 +1,119 @@
+from dataclasses import dataclass
+from functools import cached_property
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from bspx.numeric_utils import describe_invalid, to_f64
+from bspx.types import _F64
+
+
+def _frozen_copy(x: _F64) -> _F64:
+    copy = x.copy()
+    copy.flags.writeable = False
+    return copy
+
+
+def _same_input(x: _F64, reference: _F64) -> bool:
+    # Compared in the caller's dtype, so inputs rounded to a lower precision tier still
+    # match the float64 copy taken at build
+    if x.shape != reference.shape:
+        return False
+    return bool(
+        np.array_equal(x, reference.astype(x.dtype, copy=False), equal_nan=True)
+    )
+
+
+@dataclass(frozen=True)
+class TermStructure:
+    """
+    Discount curve bucketed by unique (T, r) pair
+
+    Parameters:
+
+        T:          Time to expiration (in years) per contract, read-only copy
+        r:          Risk-free rate (annualized) per contract, read-only copy
+        index:      Bucket of every contract, same shape as broadcast(T, r)
+
+        bucket_t:   Unique expiries
+        bucket_r:   Rate paired with each unique expiry
+
+    A book of 10^5 options usually has a few dozen expiries, so root times and
+    discount factors are evaluated once per bucket and gathered back through 'index'.
+    Build it once per pricing cycle and pass it to every call that shares T and r.
+    """
+
+    T: _F64
+    r: _F64
+    index: NDArray[np.intp]
+
+    bucket_t: _F64
+    bucket_r: _F64
+
+    @classmethod
+    def build(cls, T: ArrayLike, r: ArrayLike) -> "TermStructure":
+        T_, r_ = map(to_f64, (T, r))
+        if T_.size and T_.min() < 0:
+            raise ValueError(
+                "Error: Time to maturity 'T' must be nonnegative\n"
+                f" Got: {describe_invalid(T_, T_ < 0)}"
+            )
+
+        shape = np.broadcast_shapes(T_.shape, r_.shape)
+        pairs = np.column_stack(
+            [np.broadcast_to(T_, shape).ravel(), np.broadcast_to(r_, shape).ravel()]
+        )
+        buckets, inverse = np.unique(pairs, axis=0, return_inverse=True)
+
+        return cls(
+            T=_frozen_copy(T_),
+            r=_frozen_copy(r_),
+            index=inverse.reshape(shape),
+            bucket_t=buckets[:, 0],
+            bucket_r=buckets[:, 1],
+        )
+
+    @property
+    def n_buckets(self) -> int:
+        return self.bucket_t.size
+
+    def check_inputs(self, T: _F64, r: _F64) -> None:
+        """
+        Raises if (T, r) are not the inputs this term structure was built from
+
+        Compared value by value against the copies taken at build, so arrays mutated in
+        place since then are rejected rather than discounted with stale factors
+        """
+        if not (_same_input(T, self.T) and _same_input(r, self.r)):
+            raise ValueError(
+                "Error: 'term_structure' was built from a different (T, r)"
+            )
+
+    @cached_property
+    def bucket_sqrt_t(self) -> _F64:
+        return np.sqrt(self.bucket_t)
+
+    @cached_property
+    def bucket_discount(self) -> _F64:
+        return np.exp(-self.bucket_r * self.bucket_t)
+
+    @cached_property
+    def sqrt_t(self) -> _F64:
+        """sqrt(T) per contract"""
+        return self.bucket_sqrt_t[self.index]
+
+    @cached_property
+    def discount(self) -> _F64:
+        """exp{-rT} per contract"""
+        return self.bucket_discount[self.index]
+
+    def growth(self, q: ArrayLike = 0.0) -> _F64:
+        """
+        Forward growth factor exp{(r - q)T} per contract
+
+        Bucketed when the dividend yield q is a scalar, evaluated per contract otherwise
+        """
+        q_ = to_f64(q)
+        if q_.ndim == 0:
+            return np.exp((self.bucket_r - q_) * self.bucket_t)[self.index]
+        return np.exp((self.r - q_) * self.T)
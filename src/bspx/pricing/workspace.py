@@ -0,0 +1,59 @@
+import numpy as np
+from numpy.typing import DTypeLike, NDArray
+
+
+class PricingWorkspace:
+    """
+    Reusable scratch buffers for the pricing kernel and the analytical Greeks
+
+    Buffers are keyed by name and only reallocated when a batch of a different shape
+    asks for them, so a steady loop over same-shaped batches allocates nothing after
+    the first cycle. Arrays read from a state built on a workspace are views into these
+    buffers: they are overwritten by the next build that shares the workspace, and a
+    workspace must not be shared between threads.
+    """
+
+    __slots__ = ("_buffers",)
+
+    def __init__(self) -> None:
+        self._buffers: dict[str, NDArray] = {}
+
+    def get(
+        self, name: str, shape: tuple[int, ...], dtype: DTypeLike = np.float64
+    ) -> NDArray:
+        buffer = self._buffers.get(name)
+        if buffer is None or buffer.shape != shape or buffer.dtype != dtype:
+            buffer = np.empty(shape, dtype=dtype)
+            self._buffers[name] = buffer
+        return buffer
+
+    @property
+    def nbytes(self) -> int:
+        return sum(buffer.nbytes for buffer in self._buffers.values())
+
+    def clear(self) -> None:
+        self._buffers.clear()
+
+
+def workspace_buffer(
+    workspace: PricingWorkspace | None,
+    name: str,
+    shape: tuple[int, ...],
+    dtype: DTypeLike = np.float64,
+) -> NDArray:
+    """Named buffer from the workspace, or a fresh array when there is none"""
+    if workspace is None:
+        return np.empty(shape, dtype=dtype)
+    return workspace.get(name, shape, dtype)
+
+
+def check_out(out: NDArray, shape: tuple[int, ...], dtype: DTypeLike) -> NDArray:
+    if out.shape != shape:
+        raise ValueError(
+            f"Error: 'out' must have the broadcast shape {shape}\n Got: {out.shape}"
+        )
+    if out.dtype != dtype:
+        raise ValueError(
+            f"Error: 'out' must have the dtype {np.dtype(dtype)}\n Got: {out.dtype}"
+        )
+    return out
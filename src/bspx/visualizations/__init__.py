@@ -1,3 +1,10 @@
-from bspx.visualizations.charts import candlestick_chart
+from typing import TYPE_CHECKING
+
+from bspx._lazy import attach
+
+if TYPE_CHECKING:
+    from bspx.visualizations.charts import candlestick_chart
 
 __all__ = ["candlestick_chart"]
+
+__getattr__, __dir__ = attach(__name__, {"charts": ("candlestick_chart",)})
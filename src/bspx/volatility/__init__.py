@@ -1,17 +1,39 @@
-from bspx.volatility.historical_volatility import (
-    add_volatility_columns,
-    realized_volatility,
-)
-from bspx.volatility.implied_volatility import (
-    implied_vol,
-    implied_vol_brent,
-    implied_vol_newton,
-)
+from typing import TYPE_CHECKING
+
+from bspx._lazy import attach
+
+if TYPE_CHECKING:
+    from bspx.volatility.historical_volatility import (
+        add_volatility_columns,
+        realized_volatility,
+    )
+    from bspx.volatility.implied_volatility import (
+        implied_vol,
+        implied_vol_batch,
+        implied_vol_brent,
+        implied_vol_newton,
+    )
 
 __all__ = [
     "add_volatility_columns",
     "realized_volatility",
     "implied_vol",
+    "implied_vol_batch",
     "implied_vol_brent",
     "implied_vol_newton",
 ]
+
+# Note: Only 'historical_volatility' needs pandas, the implied volatility solvers
+# can be used without importing it
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "historical_volatility": ("add_volatility_columns", "realized_volatility"),
+        "implied_volatility": (
+            "implied_vol",
+            "implied_vol_batch",
+            "implied_vol_brent",
+            "implied_vol_newton",
+        ),
+    },
+)
@@ -1,11 +1,11 @@
-from typing import cast
-
 import numpy as np
-from scipy.optimize import brentq, newton
+from numpy.typing import ArrayLike
 
 from bspx.greeks import AnalyticalBackend
+from bspx.metrics import METRICS
+from bspx.numeric_utils import to_f64
 from bspx.pricing import build_black_scholes_state, forward_price
-from bspx.types import OptionType
+from bspx.types import _F64, OptionType
 
 _MIN_VOL: float = 1e-8
 
@@ -84,20 +84,24 @@ def implied_vol_newton(
     - Manaster-Koehler result ensures the initial volatility lies in a well behaved region of the Black-Scholes pricing function
     - Raises ValueError if convergence fails, use 'implied_vol_brent' as fallback
     """
+    # Imported here since scipy.optimize is slow to load, see 'bspx._lazy'
+    from scipy.optimize import newton
+
     _check_no_arbitrage(market_price, S, K, T, r, option_type)
 
     vol_0 = _manaster_koehler(S, K, T, r)
-    root = newton(
+    root, result = newton(
         func=_objective_func,
         x0=vol_0,
         fprime=_vega_scalar,
         args=(market_price, S, K, T, r, option_type),
         tol=tol,
         maxiter=max_iter,
-        full_output=False,
+        full_output=True,
     )
 
-    return cast(float, root)
+    METRICS.increment("iv.newton_iterations", result.iterations)
+    return float(root)
 
 
 def implied_vol_brent(
@@ -117,18 +121,22 @@ def implied_vol_brent(
     - Guaranteed to converge on interval [vol_lo, vol_hi]
     - Slower than Newton-Raphson but is able to handle cases where vega tends to zero
     """
+    # Imported here since scipy.optimize is slow to load, see 'bspx._lazy'
+    from scipy.optimize import brentq
+
     _check_no_arbitrage(market_price, S, K, T, r, option_type)
 
-    root = brentq(
+    root, result = brentq(
         f=_objective_func,
         a=vol_lo,
         b=vol_hi,
         args=(market_price, S, K, T, r, option_type),
         xtol=tol,
-        full_output=False,
+        full_output=True,
     )
 
-    return cast(float, root)
+    METRICS.increment("iv.brent_iterations", result.iterations)
+    return float(root)
 
 
 def implied_vol(
@@ -139,7 +147,34 @@ def implied_vol(
     r: float,
     option_type: OptionType = "call",
 ) -> float:
+    start = METRICS.start()
     try:
-        return implied_vol_newton(market_price, S, K, T, r, option_type)
+        vol = implied_vol_newton(market_price, S, K, T, r, option_type)
     except RuntimeError:
-        return implied_vol_brent(market_price, S, K, T, r, option_type)
+        METRICS.increment("iv.brent_fallbacks")
+        vol = implied_vol_brent(market_price, S, K, T, r, option_type)
+    METRICS.stop("iv.solve", start, 1)
+    return vol
+
+
+def implied_vol_batch(
+    market_price: ArrayLike,
+    S: ArrayLike,
+    K: ArrayLike,
+    T: ArrayLike,
+    r: ArrayLike,
+    option_type: OptionType = "call",
+) -> _F64:
+    """
+    'implied_vol' of every contract of a batch, NaN where the price violates the
+    no-arbitrage bounds and the implied volatility is undefined
+    """
+    inputs = np.broadcast_arrays(*(to_f64(x) for x in (market_price, S, K, T, r)))
+    result = np.empty(inputs[0].shape, dtype=np.float64)
+
+    for index in np.ndindex(result.shape):
+        try:
+            result[index] = implied_vol(*(float(x[index]) for x in inputs), option_type)
+        except ValueError:
+            result[index] = np.nan
+    return result
@@ -11,4 +11,12 @@ THETA_IDENT_ATOL: Final[float] = 1e-6           # For Theta only as it gives mor
 IMPLIED_VOL_REL: Final[float] = 1e-4            #IV solver convergence tolerance
 IMPLIED_VOL_RECOVERY_REL: Final[float] = 1e-2   # Looser tolerance for vol recovery -> Deep OTM prices have flat price surfaces
 IMPLIED_VOL_PUT_CALL_REL: Final[float] = 1e-2   # Call and put IV consistency since Hull uses prices with rounding error
+
+PRECISION_PRICE_SCALE: Final[dict[str, float]] = {  # Documented price error of each Precision tier, relative to max(S, K)
+    "exact": 1e-12,
+    "float32": 5e-7,
+    "fast-approx": 1e-6,
+}
+PRECISION_GREEK_REL: Final[float] = 1e-5        # Analytical Greeks in the float32 tiers
+NORM_CDF_APPROX_ATOL: Final[float] = 7.5e-8     # Abramowitz & Stegun 26.2.17 error bound
 # fmt: on
@@ -18,6 +18,8 @@ from tests.hypothesis_strategies import gen_black_scholes_parameters
 
 from bspx.greeks import (
     AnalyticalBackend,
+    AutomaticBackend,
+    calculate_call_put,
     calculate_greeks,
     delta,
     gamma,
@@ -25,9 +27,19 @@ from bspx.greeks import (
     theta,
     vega,
 )
-from bspx.instruments import Greeks
-from bspx.pricing import build_black_scholes_state
-from bspx.types import DayCount
+from bspx.greeks.formulas.automatic import black_scholes_formula
+from bspx.instruments import (
+    EXTENDED_GREEKS_DTYPE,
+    CallPutResult,
+    ExtendedGreeks,
+    Greeks,
+)
+from bspx.pricing import (
+    BlackScholesState,
+    black_scholes_price,
+    build_black_scholes_state,
+)
+from bspx.types import CallPutBackend, DayCount
 
 
 def test_delta_call(hull_19_delta: DeltaTestCase):
@@ -145,3 +157,154 @@ def test_calculate_greeks_returns_correct_type(hull_19_delta: DeltaTestCase):
     backend = hull_19_delta.market.analytical_backend()
     result = calculate_greeks(backend)
     assert isinstance(result, Greeks)
+
+
+# Central differences of the first-order analytical Greeks, bumped by 1e-5 relative
+EXTENDED_FD_REL = 1e-6
+_MARKET = {
+    "S": np.linspace(30.0, 70.0, 9),
+    "K": 50.0,
+    "T": np.linspace(0.1, 2.0, 5)[:, None],
+    "r": 0.05,
+    "vol": 0.25,
+}
+
+
+def _bumped_fd(greek, name: str) -> np.ndarray:
+    x = np.asarray(_MARKET[name], dtype=np.float64)
+    h = x * 1e-5
+    up = AnalyticalBackend(BlackScholesState.build(**(_MARKET | {name: x + h})))
+    down = AnalyticalBackend(BlackScholesState.build(**(_MARKET | {name: x - h})))
+    return (greek(up) - greek(down)) / (2 * h)
+
+
+@pytest.mark.parametrize(
+    ("name", "greek", "bumped", "sign"),
+    [
+        ("vanna", lambda b: b.delta(), "vol", 1.0),
+        ("volga", lambda b: b.vega(), "vol", 1.0),
+        ("charm", lambda b: b.delta("put"), "T", -1.0),
+        ("speed", lambda b: b.gamma(), "S", 1.0),
+        ("color", lambda b: b.gamma(), "T", -1.0),
+        ("zomma", lambda b: b.gamma(), "vol", 1.0),
+    ],
+)
+def test_extended_greek_matches_derivative_of_first_order(name, greek, bumped, sign):
+    backend = AnalyticalBackend(BlackScholesState.build(**_MARKET))
+    expected = sign * _bumped_fd(greek, bumped)
+    if name in ("charm", "color"):
+        expected = expected / DayCount.TRADING
+        actual = getattr(backend, name)(DayCount.TRADING)
+    else:
+        actual = getattr(backend, name)()
+    np.testing.assert_allclose(actual, expected, rtol=EXTENDED_FD_REL, atol=1e-9)
+
+
+def test_extended_greeks_match_separate_formulas():
+    backend = AnalyticalBackend(BlackScholesState.build(**_MARKET))
+    extended = backend.extended_greeks(DayCount.TRADING)
+
+    assert isinstance(extended, ExtendedGreeks)
+    np.testing.assert_allclose(extended.vanna, backend.vanna())
+    np.testing.assert_allclose(extended.volga, backend.volga())
+    np.testing.assert_allclose(extended.charm, backend.charm(DayCount.TRADING))
+    np.testing.assert_allclose(extended.speed, backend.speed())
+    np.testing.assert_allclose(extended.color, backend.color(DayCount.TRADING))
+    np.testing.assert_allclose(extended.zomma, backend.zomma())
+
+
+def test_extended_greeks_into_records():
+    backend = AnalyticalBackend(BlackScholesState.build(**_MARKET))
+    records = np.empty((5, 9), dtype=EXTENDED_GREEKS_DTYPE)
+    result = backend.extended_greeks(out=ExtendedGreeks.from_records(records))
+
+    assert np.shares_memory(result.zomma, records)
+    np.testing.assert_allclose(records["speed"], backend.speed())
+
+
+def test_extended_greeks_zero_for_expired():
+    state = BlackScholesState.build(
+        [40.0, 40.0, 40.0], [50.0, 30.0, 40.0], 0.0, 0.05, 0.2
+    )
+    extended = AnalyticalBackend(state).extended_greeks()
+    for name in ("vanna", "volga", "charm", "speed", "color", "zomma"):
+        np.testing.assert_array_equal(getattr(extended, name), 0.0)
+
+
+def test_call_put_matches_each_side():
+    state = BlackScholesState.build(**_MARKET)
+    backend = AnalyticalBackend(state)
+    result = calculate_call_put(backend, DayCount.TRADING)
+
+    assert isinstance(backend, CallPutBackend)
+    np.testing.assert_allclose(result.price.call, state.call_price())
+    np.testing.assert_allclose(
+        result.price.put, state.put_price(), atol=GREEK_IDENT_ATOL
+    )
+    for option_type, greeks in (("call", result.call), ("put", result.put)):
+        expected = calculate_greeks(backend, option_type, DayCount.TRADING)
+        for name in ("delta", "theta", "gamma", "vega", "rho"):
+            np.testing.assert_allclose(
+                getattr(greeks, name),
+                getattr(expected, name),
+                rtol=1e-12,
+                atol=GREEK_IDENT_ATOL,
+            )
+
+
+def test_call_put_sides_do_not_share_buffers():
+    result = AnalyticalBackend(BlackScholesState.build(**_MARKET)).calculate_call_put()
+    for name in ("delta", "theta", "gamma", "vega", "rho"):
+        call, put = getattr(result.call, name), getattr(result.put, name)
+        assert not np.shares_memory(call, put)
+    np.testing.assert_array_equal(result.put.gamma, result.call.gamma)
+    np.testing.assert_array_equal(result.put.vega, result.call.vega)
+
+
+def test_call_put_deep_otm_put_price():
+    S, K, T, r, vol = [200.0, 300.0], 50.0, 0.25, 0.03, 0.2
+    result = AnalyticalBackend(
+        BlackScholesState.build(S, K, T, r, vol)
+    ).calculate_call_put()
+    expected = black_scholes_price(S, K, T, r, vol, "put")
+
+    assert (expected > 0.0).all()
+    assert (result.price.put >= 0.0).all()
+    np.testing.assert_allclose(result.price.put, expected, rtol=1e-12, atol=0.0)
+    assert (result.put.delta < 0.0).all()
+    assert (result.put.rho < 0.0).all()
+
+
+def test_call_put_into_out_buffers():
+    state = BlackScholesState.build(**_MARKET)
+    out = CallPutResult.empty(state.shape)
+    result = AnalyticalBackend(state).calculate_call_put(out=out)
+
+    assert result.put.rho is out.put.rho
+    np.testing.assert_array_equal(out.put.gamma, out.call.gamma)
+    np.testing.assert_allclose(out.price.put, state.put_price(), atol=GREEK_IDENT_ATOL)
+
+
+# Gamma of an expired contract divides by zero, only the prices are checked here
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+def test_call_put_expired_contracts():
+    state = BlackScholesState.build([40.0, 40.0], [50.0, 30.0], 0.0, 0.05, 0.2)
+    result = AnalyticalBackend(state).calculate_call_put()
+    np.testing.assert_allclose(result.price.call, [0.0, 10.0])
+    np.testing.assert_allclose(result.price.put, [10.0, 0.0], atol=GREEK_IDENT_ATOL)
+
+
+def test_call_put_falls_back_to_pricing_model():
+    market = {name: _MARKET[name] for name in ("S", "K", "T", "r", "vol")}
+    automatic = calculate_call_put(AutomaticBackend(black_scholes_formula, **market))
+    expected = calculate_call_put(AnalyticalBackend(BlackScholesState.build(**_MARKET)))
+    np.testing.assert_allclose(automatic.price.put, expected.price.put, atol=1e-12)
+    np.testing.assert_allclose(automatic.put.theta, expected.put.theta, atol=1e-12)
+
+
+def test_call_put_rejects_backend_without_prices():
+    class GreeksOnly:
+        method = "analytical"
+
+    with pytest.raises(TypeError, match="CallPutBackend"):
+        calculate_call_put(GreeksOnly())
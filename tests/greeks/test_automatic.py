@@ -0,0 +1,161 @@
+import numpy as np
+import pytest
+from tests.cases import DeltaTestCase
+from tests.constants import (
+    GREEK_ACC_REL,
+    GREEK_IDENT_ATOL,
+    HULL_ABS,
+    THETA_IDENT_ATOL,
+)
+
+from bspx.greeks import (
+    AnalyticalBackend,
+    AutomaticBackend,
+    NumericalBackend,
+    calculate_greeks,
+)
+from bspx.greeks.formulas.automatic import black_scholes_formula
+from bspx.numeric_utils import norm_cdf
+from bspx.pricing import BlackScholesState, black_scholes_price
+from bspx.types import BatchedGreeksBackend, DayCount, OptionType, PricingModel
+
+GREEK_NAMES = ("delta", "theta", "gamma", "vega", "rho")
+
+
+def _market(n: int = 500) -> tuple[np.ndarray, ...]:
+    rng = np.random.default_rng(4)
+    return (
+        rng.uniform(20.0, 80.0, n),
+        rng.uniform(20.0, 80.0, n),
+        rng.uniform(0.05, 2.0, n),
+        rng.uniform(-0.02, 0.1, n),
+        rng.uniform(0.1, 0.6, n),
+    )
+
+
+def _bachelier(S, K, T, r, vol, option_type: OptionType = "call"):
+    """Normal-model price with vol quoted relative to S, no closed-form Greeks here"""
+    normal_vol = vol * S * np.sqrt(T)
+    d = (S - K) / normal_vol
+    # 'norm_pdf' evaluates in place, which a Dual cannot flow through
+    density = np.exp(-0.5 * np.square(d)) / np.sqrt(2.0 * np.pi)
+    call = np.exp(-r * T) * ((S - K) * norm_cdf(d) + normal_vol * density)
+    return call if option_type == "call" else call - np.exp(-r * T) * (S - K)
+
+
+def test_backend_implements_protocols():
+    backend = AutomaticBackend(black_scholes_formula, 49, 50, 0.3846, 0.05, 0.2)
+    assert isinstance(backend, BatchedGreeksBackend)
+    assert isinstance(backend, PricingModel)
+
+
+def test_delta_matches_hull(hull_19_delta: DeltaTestCase):
+    m = hull_19_delta.market
+    backend = AutomaticBackend(black_scholes_formula, m.S, m.K, m.T, m.r, m.vol)
+    assert backend.delta("call") == pytest.approx(
+        hull_19_delta.expected_call, abs=HULL_ABS
+    )
+    assert backend.delta("put") == pytest.approx(
+        hull_19_delta.expected_put, abs=HULL_ABS
+    )
+    assert backend.delta().shape == ()
+
+
+@pytest.mark.parametrize("option_type", ["call", "put"])
+def test_greeks_match_analytical_to_machine_precision(option_type: OptionType):
+    market = _market()
+    automatic = calculate_greeks(
+        AutomaticBackend(black_scholes_formula, *market), option_type, DayCount.TRADING
+    )
+    expected = calculate_greeks(
+        AnalyticalBackend(BlackScholesState.build(*market)),
+        option_type,
+        DayCount.TRADING,
+    )
+    for name in GREEK_NAMES:
+        np.testing.assert_allclose(
+            getattr(automatic, name),
+            getattr(expected, name),
+            rtol=1e-10,
+            atol=GREEK_IDENT_ATOL,
+        )
+
+
+def test_prices_match_black_scholes_price():
+    market = _market()
+    backend = AutomaticBackend(black_scholes_formula, *market)
+    np.testing.assert_allclose(backend.call_price(), black_scholes_price(*market))
+    np.testing.assert_allclose(backend.put_price(), black_scholes_price(*market, "put"))
+
+
+def test_one_evaluation_per_option_type():
+    calls: list[OptionType] = []
+
+    def pricing_func(*args):
+        calls.append(args[-1])
+        return black_scholes_formula(*args)
+
+    backend = AutomaticBackend(pricing_func, *_market(10))
+    calculate_greeks(backend, "put")
+    backend.gamma(), backend.vega(), backend.delta("put")
+    backend.delta("call")
+    assert calls == ["put", "call"]
+
+
+def test_model_without_closed_form_matches_finite_differences():
+    market = _market(50)
+    automatic = calculate_greeks(AutomaticBackend(_bachelier, *market), "put")
+    numerical = calculate_greeks(NumericalBackend(_bachelier, *market), "put")
+    for name in GREEK_NAMES:
+        np.testing.assert_allclose(
+            getattr(automatic, name),
+            getattr(numerical, name),
+            rtol=GREEK_ACC_REL,
+            atol=THETA_IDENT_ATOL,
+        )
+
+
+def test_unsupported_operation_raises():
+    def clipped(S, K, T, r, vol, option_type):
+        return np.maximum(S - K, 0.0)
+
+    with pytest.raises(TypeError):
+        AutomaticBackend(clipped, 42.0, 40.0, 0.5, 0.1, 0.2).delta()
+
+
+def test_price_independent_of_inputs_raises():
+    with pytest.raises(TypeError, match="Dual"):
+        AutomaticBackend(lambda *args: 1.0, 42.0, 40.0, 0.5, 0.1, 0.2).vega()
+
+
+def test_float_only_pricing_function_raises_helpful_error():
+    backend = AutomaticBackend(black_scholes_price, 42.0, 40.0, 0.5, 0.1, 0.2)
+    with pytest.raises(TypeError, match="operators and ufuncs that support Dual"):
+        backend.delta()
+
+
+@pytest.mark.filterwarnings("error")
+@pytest.mark.parametrize("option_type", ["call", "put"])
+def test_expired_contracts_settle_like_analytical(option_type: OptionType):
+    S, K, T, r, vol = _market(50)
+    T[::5] = 0.0
+    expired = T == 0.0
+
+    backend = AutomaticBackend(black_scholes_formula, S, K, T, r, vol)
+    greeks = calculate_greeks(backend, option_type)
+    state = BlackScholesState.build(S, K, T, r, vol)
+    # The analytical gamma has a zero denominator on the expired contracts
+    with np.errstate(divide="ignore", invalid="ignore"):
+        expected = calculate_greeks(AnalyticalBackend(state), option_type)
+
+    price = backend.call_price() if option_type == "call" else backend.put_price()
+    payoff = np.maximum(S - K, 0.0) if option_type == "call" else np.maximum(K - S, 0.0)
+    np.testing.assert_array_equal(price[expired], payoff[expired])
+    np.testing.assert_array_equal(greeks.gamma[expired], 0.0)
+    for name in GREEK_NAMES:
+        value, reference = getattr(greeks, name), getattr(expected, name)
+        if name != "gamma":
+            np.testing.assert_array_equal(value[expired], reference[expired])
+        np.testing.assert_allclose(
+            value[~expired], reference[~expired], rtol=1e-10, atol=GREEK_IDENT_ATOL
+        )
@@ -0,0 +1,125 @@
+import numpy as np
+import pytest
+from tests.cases import DeltaTestCase, ThetaTestCase
+from tests.constants import GREEK_IDENT_ATOL, HULL_ABS
+
+from bspx.greeks import AnalyticalBackend, CompiledBackend, calculate_greeks, delta
+from bspx.greeks.formulas import compiled
+from bspx.pricing import build_black_scholes_state
+from bspx.types import DayCount, GreeksBackend, OptionType, PricingModel, Validation
+
+_USE_JIT = [
+    False,
+    pytest.param(
+        True,
+        marks=pytest.mark.skipif(
+            not compiled.NUMBA_AVAILABLE, reason="numba is not installed"
+        ),
+    ),
+]
+
+
+def _market(n: int = 2_000) -> tuple[np.ndarray, ...]:
+    rng = np.random.default_rng(9)
+    S = rng.uniform(20.0, 80.0, n)
+    K = rng.uniform(20.0, 80.0, n)
+    T = rng.uniform(0.0, 2.0, n)
+    T[::50] = 0.0  # expired contracts take the payoff branch
+    vol = rng.uniform(0.1, 0.6, n)
+    return S, K, T, np.full(n, 0.03), vol
+
+
+def test_backend_implements_protocols():
+    backend = CompiledBackend(49, 50, 0.3846, 0.05, 0.2)
+    assert isinstance(backend, GreeksBackend)
+    assert isinstance(backend, PricingModel)
+
+
+@pytest.mark.parametrize("use_jit", _USE_JIT)
+def test_delta_matches_hull(hull_19_delta: DeltaTestCase, use_jit: bool):
+    m = hull_19_delta.market
+    backend = CompiledBackend(m.S, m.K, m.T, m.r, m.vol, use_jit=use_jit)
+    assert delta(backend, "call") == pytest.approx(
+        hull_19_delta.expected_call, abs=HULL_ABS
+    )
+    assert delta(backend, "put") == pytest.approx(
+        hull_19_delta.expected_put, abs=HULL_ABS
+    )
+
+
+@pytest.mark.parametrize("use_jit", _USE_JIT)
+def test_theta_matches_hull(hull_19_theta: ThetaTestCase, use_jit: bool):
+    m = hull_19_theta.market
+    backend = CompiledBackend(m.S, m.K, m.T, m.r, m.vol, use_jit=use_jit)
+    assert backend.theta("put", DayCount.TRADING) == pytest.approx(
+        hull_19_theta.expected_put_trading, abs=HULL_ABS
+    )
+
+
+@pytest.mark.parametrize("use_jit", _USE_JIT)
+@pytest.mark.parametrize("option_type", ["call", "put"])
+def test_matches_analytical_backend(use_jit: bool, option_type: OptionType):
+    S, K, T, r, vol = _market()
+    state = build_black_scholes_state(S, K, T, r, vol)
+    backend = CompiledBackend(S, K, T, r, vol, use_jit=use_jit)
+
+    # Gamma divides by zero on expired contracts in both implementations
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = calculate_greeks(backend, option_type, DayCount.TRADING)
+        expected = calculate_greeks(
+            AnalyticalBackend(state), option_type, DayCount.TRADING
+        )
+
+    np.testing.assert_allclose(
+        backend.call_price(), state.call_price(), atol=GREEK_IDENT_ATOL
+    )
+    np.testing.assert_allclose(
+        backend.put_price(), state.put_price(), atol=GREEK_IDENT_ATOL
+    )
+    for name in ("delta", "theta", "gamma", "vega", "rho"):
+        np.testing.assert_allclose(
+            getattr(result, name),
+            getattr(expected, name),
+            atol=GREEK_IDENT_ATOL,
+            equal_nan=True,
+        )
+
+
+@pytest.mark.parametrize("use_jit", _USE_JIT)
+def test_broadcast_shape(use_jit: bool):
+    S = np.linspace(30.0, 70.0, 5)[:, None]
+    T = np.array([0.25, 0.5, 1.0])
+    backend = CompiledBackend(S, 50.0, T, 0.03, 0.2, use_jit=use_jit)
+    assert backend.call_price().shape == (5, 3)
+    assert backend.rho("put").shape == (5, 3)
+
+
+def test_use_jit_requires_numba(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(compiled, "NUMBA_AVAILABLE", False)
+    with pytest.raises(ImportError, match="numba"):
+        CompiledBackend(49, 50, 0.3846, 0.05, 0.2, use_jit=True).call_price()
+
+
+@pytest.mark.parametrize("use_jit", _USE_JIT)
+def test_invalid_inputs_raise_on_both_paths(use_jit: bool):
+    with pytest.raises(ValueError, match="Asset price 'S' must be positive"):
+        CompiledBackend(-42.0, 50.0, 0.5, 0.03, 0.2, use_jit=use_jit)
+
+    S, K, T, vol = (np.array([x]) for x in (-42.0, 50.0, 0.5, 0.2))
+    with pytest.raises(ValueError, match="Asset price 'S' must be positive"):
+        compiled.price_and_greeks(S, K, T, np.array([0.03]), vol, use_jit=use_jit)
+
+
+@pytest.mark.parametrize("use_jit", _USE_JIT)
+def test_mask_marks_invalid_contracts_on_both_paths(use_jit: bool):
+    S = np.array([49.0, -42.0, 49.0])
+    vol = np.array([0.2, 0.2, 0.0])
+    backend = CompiledBackend(
+        S, 50.0, 0.3846, 0.05, vol, use_jit=use_jit, validation=Validation.MASK
+    )
+    reference = CompiledBackend(49.0, 50.0, 0.3846, 0.05, 0.2, use_jit=use_jit)
+
+    for method in ("call_price", "put_price", "delta", "gamma", "theta"):
+        result = getattr(backend, method)()
+        assert np.isnan(result[1:]).all()
+        assert result[0] == pytest.approx(getattr(reference, method)())
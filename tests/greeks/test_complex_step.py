@@ -0,0 +1,195 @@
+import numpy as np
+import pytest
+from tests.cases import DeltaTestCase, GammaTestCase
+from tests.constants import GREEK_IDENT_ATOL, HULL_ABS
+
+from bspx.greeks import (
+    AnalyticalBackend,
+    ComplexStepBackend,
+    calculate_greeks,
+)
+from bspx.greeks.formulas import complex_step
+from bspx.greeks.formulas.complex_step import black_scholes_complex
+from bspx.pricing import BlackScholesState, black_scholes_price
+from bspx.types import BatchedGreeksBackend, DayCount, OptionType, Validation
+
+GREEK_NAMES = ("delta", "theta", "gamma", "vega", "rho")
+
+# Imaginary steps are exact to rounding, gamma keeps a little cancellation error
+COMPLEX_STEP_REL = 1e-11
+GAMMA_CS_REL = 1e-7
+
+
+def _market(n: int = 500) -> tuple[np.ndarray, ...]:
+    rng = np.random.default_rng(5)
+    return (
+        rng.uniform(20.0, 80.0, n),
+        rng.uniform(20.0, 80.0, n),
+        rng.uniform(0.05, 2.0, n),
+        rng.uniform(-0.02, 0.1, n),
+        rng.uniform(0.1, 0.6, n),
+    )
+
+
+def test_backend_implements_protocols():
+    backend = ComplexStepBackend(black_scholes_complex, 49, 50, 0.3846, 0.05, 0.2)
+    assert isinstance(backend, BatchedGreeksBackend)
+
+
+@pytest.mark.parametrize("option_type", ["call", "put"])
+def test_complex_kernel_matches_black_scholes_price(option_type: OptionType):
+    market = _market()
+    price = black_scholes_complex(*market, option_type)
+    assert price.dtype == np.complex128
+    np.testing.assert_allclose(
+        price.real, black_scholes_price(*market, option_type), atol=GREEK_IDENT_ATOL
+    )
+    np.testing.assert_array_equal(price.imag, 0.0)
+
+
+def test_delta_cs_matches_hull(hull_19_delta: DeltaTestCase):
+    m = hull_19_delta.market
+    backend = ComplexStepBackend(black_scholes_complex, m.S, m.K, m.T, m.r, m.vol)
+    assert backend.delta("call") == pytest.approx(
+        hull_19_delta.expected_call, abs=HULL_ABS
+    )
+    assert backend.delta("put") == pytest.approx(
+        hull_19_delta.expected_put, abs=HULL_ABS
+    )
+
+
+def test_gamma_cs_matches_analytical(hull_19_gamma: GammaTestCase):
+    m = hull_19_gamma.market
+    backend = ComplexStepBackend(black_scholes_complex, m.S, m.K, m.T, m.r, m.vol)
+    assert backend.gamma() == pytest.approx(
+        m.analytical_backend().gamma(), rel=GAMMA_CS_REL
+    )
+
+
+@pytest.mark.parametrize("option_type", ["call", "put"])
+def test_per_greek_cs_matches_analytical(option_type: OptionType):
+    market = _market(50)
+    backend = ComplexStepBackend(black_scholes_complex, *market)
+    expected = AnalyticalBackend(BlackScholesState.build(*market))
+
+    for actual, reference in (
+        (backend.delta(option_type), expected.delta(option_type)),
+        (
+            backend.theta(option_type, DayCount.TRADING),
+            expected.theta(option_type, DayCount.TRADING),
+        ),
+        (backend.vega(), expected.vega()),
+        (backend.rho(option_type), expected.rho(option_type)),
+    ):
+        np.testing.assert_allclose(
+            actual, reference, rtol=COMPLEX_STEP_REL, atol=GREEK_IDENT_ATOL
+        )
+
+
+@pytest.mark.parametrize("option_type", ["call", "put"])
+def test_batched_cs_matches_analytical(option_type: OptionType):
+    market = _market()
+    greeks = calculate_greeks(
+        ComplexStepBackend(black_scholes_complex, *market), option_type
+    )
+    expected = calculate_greeks(
+        AnalyticalBackend(BlackScholesState.build(*market)), option_type
+    )
+    for name in GREEK_NAMES:
+        rtol = GAMMA_CS_REL if name == "gamma" else COMPLEX_STEP_REL
+        np.testing.assert_allclose(
+            getattr(greeks, name),
+            getattr(expected, name),
+            rtol=rtol,
+            atol=GREEK_IDENT_ATOL,
+        )
+
+
+def test_batched_cs_blocks_match_single_call():
+    S, K, T = np.linspace(30.0, 60.0, 40), 40.0, np.linspace(0.1, 2.0, 40)[:, None]
+    single = complex_step.calculate_greeks(black_scholes_complex, S, K, T, 0.05, 0.3)
+
+    calls: list[int] = []
+
+    def pricing_func(*args):
+        calls.append(1)
+        return black_scholes_complex(*args)
+
+    # One block row of 40 contracts at a time
+    blocked = complex_step.calculate_greeks(
+        pricing_func,
+        S,
+        K,
+        T,
+        0.05,
+        0.3,
+        memory_budget=40 * complex_step._BYTES_PER_CONTRACT,
+    )
+    assert len(calls) == 40
+    for name in GREEK_NAMES:
+        np.testing.assert_array_equal(getattr(blocked, name), getattr(single, name))
+
+
+def test_batched_cs_scalar_inputs():
+    greeks = complex_step.calculate_greeks(
+        black_scholes_complex, 49, 50, 0.3846, 0.05, 0.2
+    )
+    assert greeks.delta.shape == ()
+
+
+@pytest.mark.filterwarnings("error")
+@pytest.mark.parametrize("option_type", ["call", "put"])
+def test_expired_contracts_match_analytical(option_type: OptionType):
+    S, K, T, r, vol = _market(50)
+    T[::5] = 0.0
+    expired = T == 0.0
+
+    backend = ComplexStepBackend(black_scholes_complex, S, K, T, r, vol)
+    # The analytical gamma has a zero denominator on the expired contracts
+    with np.errstate(divide="ignore", invalid="ignore"):
+        expected = calculate_greeks(
+            AnalyticalBackend(BlackScholesState.build(S, K, T, r, vol)), option_type
+        )
+
+    price = black_scholes_complex(S, K, T, r, vol, option_type).real
+    np.testing.assert_allclose(
+        price, black_scholes_price(S, K, T, r, vol, option_type), atol=GREEK_IDENT_ATOL
+    )
+    for greeks in (
+        calculate_greeks(backend, option_type),
+        complex_step.calculate_greeks(
+            black_scholes_complex, S, K, T, r, vol, option_type
+        ),
+    ):
+        np.testing.assert_array_equal(greeks.gamma[expired], 0.0)
+        for name in GREEK_NAMES:
+            value, reference = getattr(greeks, name), getattr(expected, name)
+            if name != "gamma":
+                np.testing.assert_allclose(
+                    value[expired], reference[expired], atol=GREEK_IDENT_ATOL
+                )
+            rtol = GAMMA_CS_REL if name == "gamma" else COMPLEX_STEP_REL
+            np.testing.assert_allclose(
+                value[~expired], reference[~expired], rtol=rtol, atol=GREEK_IDENT_ATOL
+            )
+
+
+@pytest.mark.filterwarnings("error")
+def test_backend_validates_inputs():
+    with pytest.raises(ValueError, match="Volatility 'vol' must be positive"):
+        ComplexStepBackend(black_scholes_complex, 42.0, 40.0, 0.5, 0.05, -0.2)
+
+    S, K, T, r, vol = _market(6)
+    vol[1], T[2], T[3] = 0.0, -0.5, 0.0
+    backend = ComplexStepBackend(
+        black_scholes_complex, S, K, T, r, vol, validation=Validation.MASK
+    )
+    valid = np.array([True, False, False, True, True, True])
+    greeks = calculate_greeks(backend, "call")
+    delta = backend.delta("call")
+    assert np.isnan(delta[~valid]).all()
+    assert np.isfinite(delta[valid]).all()
+    for name in GREEK_NAMES:
+        value = getattr(greeks, name)
+        assert np.isnan(value[~valid]).all()
+        assert np.isfinite(value[valid]).all()
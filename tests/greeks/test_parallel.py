@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+from tests.constants import GREEK_IDENT_ATOL
+
+from bspx.greeks import calculate_greeks_chunked, calculate_greeks_threaded
+from bspx.greeks.formulas.analytical import calculate_greeks
+from bspx.instruments import Greeks
+from bspx.pricing import build_black_scholes_state
+from bspx.pricing.parallel import MIN_ELEMENTS_PER_WORKER
+from bspx.types import DayCount, OptionType
+
+_N = 3 * MIN_ELEMENTS_PER_WORKER + 7
+
+
+@pytest.mark.parametrize("option_type", ["call", "put"])
+def test_threaded_greeks_match_serial(option_type: OptionType):
+    rng = np.random.default_rng(5)
+    S = rng.uniform(20.0, 80.0, _N)
+    K = rng.uniform(20.0, 80.0, _N)
+    T = rng.uniform(0.05, 2.0, _N)
+    vol = rng.uniform(0.1, 0.6, _N)
+
+    threaded = calculate_greeks_threaded(
+        S, K, T, 0.03, vol, option_type, DayCount.TRADING, workers=3
+    )
+    serial = calculate_greeks(
+        build_black_scholes_state(S, K, T, 0.03, vol), option_type, DayCount.TRADING
+    )
+    for name in ("delta", "theta", "gamma", "vega", "rho"):
+        np.testing.assert_allclose(
+            getattr(threaded, name), getattr(serial, name), atol=GREEK_IDENT_ATOL
+        )
+
+
+@pytest.mark.parametrize(
+    "greeks", [calculate_greeks_chunked, calculate_greeks_threaded]
+)
+def test_parallel_greeks_check_out(greeks):
+    inputs = (np.full(8, 42.0), 40.0, 0.5, 0.03, 0.2)
+    with pytest.raises(ValueError, match="broadcast shape"):
+        greeks(*inputs, out=Greeks.empty((7,)))
+    with pytest.raises(ValueError, match="dtype"):
+        greeks(*inputs, out=Greeks.empty((8,), np.float32))
@@ -0,0 +1,133 @@
+import numpy as np
+import pandas as pd
+import pytest
+from tests.cases import OptionTestCase
+from tests.constants import GREEK_IDENT_ATOL, HULL_ABS
+
+from bspx.greeks.formulas.analytical import calculate_greeks
+from bspx.ingest import CONVERSION_STATS
+from bspx.instruments import OptionChain
+from bspx.pricing import BlackScholesState, black_scholes_price
+from bspx.types import DayCount
+
+_GREEK_NAMES = ("delta", "theta", "gamma", "vega", "rho")
+
+
+def _chain(n: int = 500) -> OptionChain:
+    rng = np.random.default_rng(12)
+    T = rng.uniform(0.0, 2.0, n)
+    T[::25] = 0.0
+    return OptionChain.build(
+        S=rng.uniform(20.0, 80.0, n),
+        K=rng.uniform(20.0, 80.0, n),
+        T=T,
+        r=0.03,
+        vol=rng.uniform(0.1, 0.6, n),
+        option_type=rng.choice(["call", "put"], n),
+    )
+
+
+def test_price_matches_hull(hull_15: OptionTestCase):
+    m = hull_15.market
+    chain = OptionChain.build(m.S, m.K, m.T, m.r, m.vol, ["call", "put"])
+    price, _ = chain.price_and_greeks()
+    np.testing.assert_allclose(
+        price, [hull_15.expected_call, hull_15.expected_put], atol=HULL_ABS
+    )
+
+
+def test_deep_otm_put_price_is_not_parity_noise():
+    S, K, T, vol = 200.0, 50.0, 0.25, 0.2
+    chain = OptionChain.build([S, S], K, T, 0.03, vol, ["call", "put"])
+    price, greeks = chain.price_and_greeks()
+
+    expected = black_scholes_price(S, K, T, 0.03, vol, "put")
+    assert 0.0 < expected < 1e-40
+    assert price[1] >= 0.0
+    assert price[1] == pytest.approx(expected, rel=1e-12, abs=0.0)
+    assert greeks.delta[1] < 0.0
+    assert greeks.rho[1] < 0.0
+
+
+def test_mixed_chain_matches_per_side_state():
+    chain = _chain()
+    # Gamma has a zero denominator on the expired rows
+    with np.errstate(divide="ignore", invalid="ignore"):
+        price, greeks = chain.price_and_greeks(DayCount.TRADING)
+        state = BlackScholesState.build(chain.S, chain.K, chain.T, chain.r, chain.vol)
+        expected = {
+            side: calculate_greeks(state, side, DayCount.TRADING)
+            for side in ("call", "put")
+        }
+
+    is_call = chain.is_call
+    np.testing.assert_allclose(
+        price,
+        np.where(is_call, state.call_price(), state.put_price()),
+        atol=GREEK_IDENT_ATOL,
+    )
+    for name in _GREEK_NAMES:
+        np.testing.assert_allclose(
+            getattr(greeks, name),
+            np.where(
+                is_call,
+                getattr(expected["call"], name),
+                getattr(expected["put"], name),
+            ),
+            atol=GREEK_IDENT_ATOL,
+            equal_nan=True,
+        )
+
+
+def test_build_converts_columns_through_ingest():
+    S = pd.Series(np.linspace(20.0, 80.0, 50))
+    CONVERSION_STATS.reset()
+    chain = OptionChain.build(S, np.arange(20, 70), 0.5, 0.03, 0.2)
+
+    assert np.shares_memory(chain.S, S.to_numpy(copy=False))
+    assert CONVERSION_STATS.copies == 1
+    assert CONVERSION_STATS.copied_bytes == chain.K.nbytes
+
+
+def test_views_share_columns():
+    chain = _chain()
+    view = chain.sort_by("T", "K").filter(chain.sort_by("T", "K").column("K") > 50.0)
+
+    for name in ("S", "K", "T", "r", "vol", "is_call"):
+        assert getattr(view, name) is getattr(chain, name)
+    assert len(view) == np.count_nonzero(chain.K > 50.0)
+
+
+def test_sort_by_orders_rows():
+    chain = _chain()
+    view = chain.sort_by("T", "K")
+    T, K = view.column("T"), view.column("K")
+    assert np.all(np.diff(T) >= 0.0)
+    same_t = np.diff(T) == 0.0
+    assert np.all(np.diff(K)[same_t] >= 0.0)
+
+    descending = chain.sort_by("vol", descending=True).column("vol")
+    assert np.all(np.diff(descending) <= 0.0)
+
+
+def test_view_prices_match_full_chain():
+    chain = _chain()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        full_price, full_greeks = chain.price_and_greeks()
+        view = chain.filter(chain.K < 40.0).sort_by("S")
+        price, greeks = view.price_and_greeks()
+
+    rows = view.rows
+    assert rows is not None
+    np.testing.assert_array_equal(price, full_price[rows])
+    np.testing.assert_array_equal(greeks.vega, full_greeks.vega[rows])
+
+
+def test_build_rejects_two_dimensional_columns():
+    with pytest.raises(ValueError, match="one-dimensional"):
+        OptionChain.build(np.ones((2, 2)), 50.0, 0.5, 0.03, 0.2)
+
+
+def test_filter_rejects_wrong_mask_length():
+    with pytest.raises(ValueError, match="mask"):
+        _chain().filter([True, False])
@@ -0,0 +1,113 @@
+import numpy as np
+import pytest
+from tests.cases import DeltaTestCase
+
+from bspx.greeks import AnalyticalBackend, NumericalBackend, calculate_greeks
+from bspx.greeks import parallel as greeks_parallel
+from bspx.greeks.formulas import analytical
+from bspx.instruments import (
+    CHAIN_RESULT_DTYPE,
+    GREEKS_DTYPE,
+    PRICE_DTYPE,
+    Greeks,
+    OptionChain,
+    OptionPrice,
+)
+from bspx.pricing import BlackScholesState, black_scholes_price
+
+_GREEK_NAMES = ("delta", "theta", "gamma", "vega", "rho")
+
+
+def _market(n: int = 300) -> tuple[np.ndarray, ...]:
+    rng = np.random.default_rng(4)
+    return (
+        rng.uniform(20.0, 80.0, n),
+        rng.uniform(20.0, 80.0, n),
+        rng.uniform(0.05, 2.0, n),
+        np.full(n, 0.03),
+        rng.uniform(0.1, 0.6, n),
+    )
+
+
+def test_analytical_greeks_written_into_records():
+    state = BlackScholesState.build(*_market())
+    records = np.empty(state.shape, dtype=GREEKS_DTYPE)
+    result = analytical.calculate_greeks(state, "put", out=Greeks.from_records(records))
+
+    expected = analytical.calculate_greeks(state, "put")
+    for name in _GREEK_NAMES:
+        assert np.shares_memory(getattr(result, name), records)
+        np.testing.assert_array_equal(records[name], getattr(expected, name))
+
+
+def test_records_view_as_float_block():
+    state = BlackScholesState.build(*_market())
+    records = np.empty(state.shape, dtype=GREEKS_DTYPE)
+    analytical.calculate_greeks(state, "call", out=Greeks.from_records(records))
+
+    block = records.view(np.float64).reshape(*records.shape, len(_GREEK_NAMES))
+    np.testing.assert_array_equal(block[:, 3], records["vega"])
+    np.testing.assert_array_equal(Greeks.from_block(block).to_records(), records)
+
+
+def test_chunked_greeks_written_into_block():
+    S, K, T, r, vol = _market()
+    block = np.empty((S.size, len(_GREEK_NAMES)))
+    greeks_parallel.calculate_greeks_chunked(
+        S, K, T, r, vol, "call", memory_budget=2048, out=Greeks.from_block(block)
+    )
+    expected = analytical.calculate_greeks(
+        BlackScholesState.build(S, K, T, r, vol), "call"
+    )
+    np.testing.assert_array_equal(block[:, 0], expected.delta)
+    np.testing.assert_array_equal(block[:, 4], expected.rho)
+
+
+def test_prices_written_into_records():
+    S, K, T, r, vol = _market()
+    records = np.empty(S.shape, dtype=PRICE_DTYPE)
+    prices = OptionPrice.from_records(records)
+    black_scholes_price(S, K, T, r, vol, "call", out=prices.call)
+    black_scholes_price(S, K, T, r, vol, "put", out=prices.put)
+
+    np.testing.assert_array_equal(records["call"], black_scholes_price(S, K, T, r, vol))
+    np.testing.assert_array_equal(prices.to_records(), records)
+
+
+def test_generic_calculate_greeks_fills_out(hull_19_delta: DeltaTestCase):
+    m = hull_19_delta.market
+    records = np.empty((), dtype=GREEKS_DTYPE)
+    backend = NumericalBackend(black_scholes_price, m.S, m.K, m.T, m.r, m.vol)
+    result = calculate_greeks(backend, "put", out=Greeks.from_records(records))
+    assert result.delta == records["delta"]
+    assert records["delta"] == pytest.approx(hull_19_delta.expected_put, abs=0.01)
+
+    analytical_records = np.empty((), dtype=GREEKS_DTYPE)
+    calculate_greeks(
+        AnalyticalBackend(m.to_bs_state()),
+        "put",
+        out=Greeks.from_records(analytical_records),
+    )
+    assert analytical_records["delta"] == pytest.approx(records["delta"], rel=1e-3)
+
+
+def test_chain_results_written_into_records():
+    S, K, T, r, vol = _market()
+    chain = OptionChain.build(S, K, T, r, vol, np.arange(S.size) % 2 == 0)
+    records = np.empty(len(chain), dtype=CHAIN_RESULT_DTYPE)
+    price, greeks = chain.price_and_greeks(out=records)
+
+    expected_price, expected_greeks = chain.price_and_greeks()
+    assert np.shares_memory(price, records)
+    np.testing.assert_array_equal(records["price"], expected_price)
+    for name in _GREEK_NAMES:
+        np.testing.assert_array_equal(records[name], getattr(expected_greeks, name))
+
+
+def test_layout_checks():
+    with pytest.raises(ValueError, match="dtype"):
+        Greeks.from_records(np.empty(3, dtype=PRICE_DTYPE))
+    with pytest.raises(ValueError, match="columns"):
+        Greeks.from_block(np.empty((3, 4)))
+    with pytest.raises(ValueError, match="columns"):
+        OptionPrice.from_block(np.empty((3, 2), dtype=np.float32))
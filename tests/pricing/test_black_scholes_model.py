@@ -1,11 +1,17 @@
 import numpy as np
 import pytest
 from hypothesis import given, settings
+from hypothesis import strategies as st
 from tests.cases import OptionTestCase
 from tests.constants import HULL_ABS, PUT_CALL_PARITY_REL
 from tests.hypothesis_strategies import gen_black_scholes_parameters
 
-from bspx.pricing import build_black_scholes_state
+from bspx.pricing import (
+    BlackScholesStatics,
+    black_scholes_price,
+    build_black_scholes_state,
+)
+from bspx.types import OptionType
 
 
 def test_black_scholes_call_hull(hull_15: OptionTestCase):
@@ -30,3 +36,75 @@ def test_black_scholes_put_call_parity(bs_params):
     parity = state.call_price() - state.put_price()
     expected = S - K * np.exp(-r * T)
     assert parity == pytest.approx(expected, rel=PUT_CALL_PARITY_REL)
+
+
+@pytest.mark.parametrize("option_type", ["call", "put"])
+def test_black_scholes_price_matches_state(
+    hull_15: OptionTestCase, option_type: OptionType
+):
+    """Fused pricing kernel agrees with the full BlackScholesState"""
+    market = hull_15.market
+    state = market.to_bs_state()
+    expected = state.call_price() if option_type == "call" else state.put_price()
+    price = black_scholes_price(
+        market.S, market.K, market.T, market.r, market.vol, option_type
+    )
+    assert price == pytest.approx(expected, rel=PUT_CALL_PARITY_REL)
+
+
+def test_black_scholes_price_expired_is_payoff():
+    """Contracts with T == 0 are priced at intrinsic value"""
+    S = np.array([30.0, 40.0, 50.0])
+    call = black_scholes_price(S, 40.0, 0.0, 0.05, 0.2, "call")
+    put = black_scholes_price(S, 40.0, 0.0, 0.05, 0.2, "put")
+    np.testing.assert_allclose(call, [0.0, 0.0, 10.0])
+    np.testing.assert_allclose(put, [10.0, 0.0, 0.0])
+
+
+def test_state_put_tails_do_not_cancel():
+    """Deep out of the money puts keep their tiny price, delta and rho"""
+    S, K, T, r, vol = 200.0, 50.0, 0.25, 0.03, 0.2
+    state = build_black_scholes_state(S, K, T, r, vol)
+    expected = black_scholes_price(S, K, T, r, vol, "put")
+
+    assert 0.0 < expected < 1e-40
+    assert state.put_price() == pytest.approx(expected, rel=1e-12, abs=0.0)
+    assert 0.0 < state.cdf_nd1 < 1e-40
+    assert 0.0 < state.cdf_nd2 < 1e-40
+
+
+def test_black_scholes_state_fields_are_lazy(hull_15: OptionTestCase):
+    """Pricing does not evaluate Greek-only fields, and fields are cached once read"""
+    state = hull_15.market.to_bs_state()
+    state.call_price()
+    assert "pdf_d1" not in vars(state)
+
+    pdf_d1 = state.pdf_d1
+    assert state.pdf_d1 is pdf_d1
+
+
+@pytest.mark.slow
+@given(bs_params=gen_black_scholes_parameters(), spot=st.floats(0.01, 1_000.0))
+def test_statics_reprice_matches_build(bs_params, spot):
+    """Spot-only repricing agrees with a full rebuild at the new spot"""
+    S, K, T, r, vol = bs_params
+    statics = BlackScholesStatics.build(K, T, r, vol)
+    repriced = statics.reprice(spot)
+    rebuilt = build_black_scholes_state(spot, K, T, r, vol)
+    assert repriced.call_price() == pytest.approx(
+        rebuilt.call_price(), rel=PUT_CALL_PARITY_REL, abs=PUT_CALL_PARITY_REL
+    )
+    assert repriced.pdf_d1 == pytest.approx(
+        rebuilt.pdf_d1, rel=PUT_CALL_PARITY_REL, abs=PUT_CALL_PARITY_REL
+    )
+
+
+def test_update_spot_reuses_statics(hull_15: OptionTestCase):
+    state = hull_15.market.to_bs_state()
+    ticked = state.update_spot(43.0).update_spot(44.0)
+    assert ticked.statics is state.statics
+    assert ticked.discount is state.discount
+    assert ticked.call_price() == pytest.approx(
+        build_black_scholes_state(44.0, 40, 0.5, 0.1, 0.2).call_price(),
+        rel=PUT_CALL_PARITY_REL,
+    )
@@ -0,0 +1,139 @@
+import threading
+
+import numpy as np
+import pytest
+from tests.cases import OptionTestCase
+from tests.constants import HULL_ABS, IMPLIED_VOL_REL
+
+from bspx.greeks.formulas.analytical import calculate_greeks, extended_greeks
+from bspx.pricing import BlackScholesState, PricingCache, black_scholes_price
+
+
+def test_repeated_price_hits(hull_15: OptionTestCase):
+    m = hull_15.market
+    cache = PricingCache(maxsize=8)
+    first = cache.price(m.S, m.K, m.T, m.r, m.vol, "put")
+    second = cache.price(m.S, m.K, m.T, m.r, m.vol, "put")
+
+    assert second is first
+    assert first == pytest.approx(hull_15.expected_put, abs=HULL_ABS)
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+    assert cache.stats.hit_rate == 0.5
+
+
+def test_option_type_is_part_of_the_key(hull_15: OptionTestCase):
+    m = hull_15.market
+    cache = PricingCache()
+    call = cache.price(m.S, m.K, m.T, m.r, m.vol, "call")
+    put = cache.price(m.S, m.K, m.T, m.r, m.vol, "put")
+    assert call != put
+    assert cache.stats.misses == 2
+
+
+def test_inputs_below_tolerance_are_not_served_stale():
+    cache = PricingCache(decimals=4)
+    base = cache.price(42.0, 40.0, 0.5, 0.1, 0.2)
+    nudged = cache.price(42.0 + 1e-9, 40.0, 0.5, 0.1, 0.2)
+
+    assert nudged == black_scholes_price(42.0 + 1e-9, 40.0, 0.5, 0.1, 0.2)
+    assert nudged != base
+    assert cache.stats.near_misses == 1
+    # The near duplicate replaced the entry instead of taking another slot
+    assert len(cache) == 1
+
+
+def test_lru_eviction_keeps_recent_entries():
+    cache = PricingCache(maxsize=2)
+    for spot in (40.0, 41.0, 40.0, 42.0):
+        cache.price(spot, 40.0, 0.5, 0.1, 0.2)
+
+    assert cache.stats.evictions == 1
+    cache.price(40.0, 40.0, 0.5, 0.1, 0.2)
+    assert cache.stats.hits == 2
+
+
+def test_entries_are_isolated_from_caller_buffers():
+    S = np.array([40.0, 45.0])
+    cache = PricingCache()
+    price = cache.price(S, 40.0, 0.5, 0.1, 0.2)
+    expected = price.copy()
+
+    S[0] = 60.0
+    with pytest.raises(ValueError, match="read-only"):
+        price[0] = 0.0
+    np.testing.assert_array_equal(
+        cache.price([40.0, 45.0], 40.0, 0.5, 0.1, 0.2), expected
+    )
+    assert cache.stats.hits == 1
+
+
+def test_state_and_implied_vol(hull_15: OptionTestCase):
+    m = hull_15.market
+    cache = PricingCache()
+    state = cache.build_state(m.S, m.K, m.T, m.r, m.vol)
+    assert cache.build_state(m.S, m.K, m.T, m.r, m.vol) is state
+
+    price = float(state.call_price())
+    vol = cache.implied_vol(price, m.S, m.K, m.T, m.r)
+    assert cache.implied_vol(price, m.S, m.K, m.T, m.r) == vol
+    assert vol == pytest.approx(m.vol, rel=IMPLIED_VOL_REL)
+    assert cache.stats.hits == 2
+
+
+def test_concurrent_consumers_share_entries():
+    cache = PricingCache(maxsize=16)
+    spots = np.linspace(30.0, 50.0, 8)
+
+    def consume() -> None:
+        for _ in range(20):
+            for spot in spots:
+                cache.price(spot, 40.0, 0.5, 0.1, 0.2)
+
+    threads = [threading.Thread(target=consume) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(cache) == spots.size
+    assert cache.stats.hits + cache.stats.misses == 4 * 20 * spots.size
+    assert cache.stats.evictions == 0
+
+
+def test_maxsize_must_be_positive():
+    with pytest.raises(ValueError, match="maxsize"):
+        PricingCache(maxsize=0)
+
+
+def test_cached_state_is_evaluated_and_frozen():
+    rng = np.random.default_rng(3)
+    S, K = rng.uniform(30.0, 60.0, (2, 1_000))
+    cache = PricingCache()
+    state = cache.build_state(S, K, 0.5, 0.05, 0.2)
+
+    # 'cached_property' stores evaluated fields in the instance __dict__
+    for name in ("_d1_d2", "cdf_d1", "cdf_nd2", "pdf_d1", "strike_pv", "statics"):
+        assert name in vars(state)
+    with pytest.raises(ValueError, match="read-only"):
+        state.cdf_d1[0] = 0.0
+    with pytest.raises(ValueError, match="read-only"):
+        state.statics.log_k[0] = 0.0
+
+    expected = calculate_greeks(BlackScholesState.build(S, K, 0.5, 0.05, 0.2), "put")
+    results: list = []
+
+    def read() -> None:
+        for _ in range(20):
+            results.append(calculate_greeks(state, "put"))
+            extended_greeks(state)
+
+    threads = [threading.Thread(target=read) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 80
+    for greeks in results:
+        np.testing.assert_array_equal(greeks.delta, expected.delta)
+        np.testing.assert_array_equal(greeks.theta, expected.theta)
@@ -0,0 +1,129 @@
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from bspx.greeks import calculate_greeks_chunked
+from bspx.greeks.formulas.analytical import calculate_greeks
+from bspx.pricing import (
+    BlackScholesState,
+    black_scholes_price,
+    black_scholes_price_chunked,
+    iter_price_chunks,
+)
+from bspx.pricing.chunked import block_inputs, block_slices
+from bspx.types import Precision
+
+# Small enough to force many blocks on the grids below
+_BUDGET = 64 * 1024
+
+
+@pytest.fixture
+def grid() -> tuple[np.ndarray, ...]:
+    """Spot x vol scenario grid, broadcast from a column and a row"""
+    S = np.linspace(20.0, 80.0, 400)[:, None]
+    vol = np.linspace(0.05, 1.0, 250)[None, :]
+    return S, np.asarray(50.0), np.asarray(0.5), np.asarray(0.03), vol
+
+
+@pytest.mark.parametrize("option_type", ["call", "put"])
+def test_chunked_matches_direct(grid, option_type):
+    chunked = black_scholes_price_chunked(*grid, option_type, memory_budget=_BUDGET)
+    np.testing.assert_allclose(chunked, black_scholes_price(*grid, option_type))
+
+
+def test_iter_price_chunks_covers_grid(grid):
+    expected = black_scholes_price(*grid)
+    result = np.full(expected.shape, np.nan)
+    blocks = 0
+    for index, prices in iter_price_chunks(*grid, memory_budget=_BUDGET):
+        result[index] = prices
+        blocks += 1
+
+    assert blocks > 1
+    np.testing.assert_allclose(result, expected)
+
+
+def test_chunked_scalar_inputs():
+    assert black_scholes_price_chunked(42, 40, 0.5, 0.1, 0.2) == pytest.approx(
+        black_scholes_price(42, 40, 0.5, 0.1, 0.2)
+    )
+
+
+def test_block_slices_respect_budget():
+    blocks = list(block_slices((10, 7), max_elements=21))
+    assert [b[0] for b in blocks] == [
+        slice(0, 3),
+        slice(3, 6),
+        slice(6, 9),
+        slice(9, 10),
+    ]
+
+
+def test_block_slices_split_wide_rows():
+    shape = (3, 2, 10)
+    blocks = list(block_slices(shape, max_elements=4))
+    covered = np.zeros(shape, dtype=int)
+    for index in blocks:
+        assert covered[index].size <= 4
+        covered[index] += 1
+    np.testing.assert_array_equal(covered, 1)
+
+
+def test_block_inputs_slice_only_varying_axes():
+    shape = (3, 10)
+    S, vol = np.arange(3.0)[:, None], np.arange(10.0)
+    index = (slice(1, 2), slice(4, 8), ...)
+    S_b, vol_b, r_b = block_inputs([S, vol, np.asarray(0.05)], index, shape)
+    np.testing.assert_array_equal(S_b, [[1.0]])
+    np.testing.assert_array_equal(vol_b, [4.0, 5.0, 6.0, 7.0])
+    assert r_b.shape == ()
+
+
+def test_chunked_wide_row_peak_memory_is_bounded():
+    """A single row far larger than the budget is still evaluated in blocks"""
+    S = np.linspace(20.0, 80.0, 200_000)[None, :]
+    out = np.empty(S.shape)
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        black_scholes_price_chunked(
+            S, 50.0, 0.5, 0.03, 0.2, memory_budget=_BUDGET, out=out
+        )
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert peak - start < 2 * _BUDGET
+    np.testing.assert_allclose(out, black_scholes_price(S, 50.0, 0.5, 0.03, 0.2))
+
+
+@pytest.mark.parametrize("precision", [Precision.FLOAT32, Precision.FAST_APPROX])
+def test_chunked_precision_tiers(grid, precision):
+    chunked = black_scholes_price_chunked(
+        *grid, memory_budget=_BUDGET, precision=precision
+    )
+    assert chunked.dtype == np.float32
+    np.testing.assert_array_equal(
+        chunked, black_scholes_price(*grid, precision=precision)
+    )
+
+    greeks = calculate_greeks_chunked(*grid, memory_budget=_BUDGET, precision=precision)
+    expected = calculate_greeks(
+        BlackScholesState.build(*grid, precision=precision), "call"
+    )
+    np.testing.assert_allclose(greeks.gamma, expected.gamma, rtol=1e-6, atol=1e-30)
+
+
+def test_chunked_peak_memory_is_bounded(grid):
+    """Beyond the result itself, peak memory stays near the budget"""
+    out = np.empty((400, 250))
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        black_scholes_price_chunked(*grid, memory_budget=_BUDGET, out=out)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert peak - start < 2 * _BUDGET
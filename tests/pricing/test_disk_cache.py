@@ -0,0 +1,106 @@
+import os
+
+import numpy as np
+import pytest
+
+from bspx.greeks import AnalyticalBackend, calculate_greeks
+from bspx.pricing import BlackScholesState, DiskCache, black_scholes_price
+from bspx.volatility import implied_vol
+
+GRID = dict(
+    S=np.linspace(30.0, 60.0, 64),
+    K=40.0,
+    T=np.linspace(0.1, 2.0, 64),
+    r=0.05,
+    vol=0.25,
+)
+
+
+def test_hit_is_a_read_only_memmap_of_the_result(tmp_path):
+    cache = DiskCache(tmp_path)
+    first = cache.price(**GRID, option_type="put")
+    second = cache.price(**GRID, option_type="put")
+
+    assert isinstance(second, np.memmap)
+    assert not second.flags.writeable
+    assert not first.flags.writeable
+    np.testing.assert_array_equal(second, first)
+    np.testing.assert_array_equal(first, black_scholes_price(**GRID, option_type="put"))
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+
+def test_results_persist_across_instances(tmp_path):
+    DiskCache(tmp_path).price(**GRID)
+    cache = DiskCache(tmp_path)
+    cache.price(**GRID)
+    assert cache.stats.hits == 1
+
+
+def test_any_changed_input_or_parameter_misses(tmp_path):
+    cache = DiskCache(tmp_path)
+    cache.price(**GRID)
+    cache.price(**{**GRID, "K": np.nextafter(40.0, 41.0)})
+    cache.price(**GRID, option_type="put")
+    assert (cache.stats.hits, cache.stats.misses) == (0, 3)
+    assert len(list(tmp_path.glob("*.npy"))) == 3
+
+
+def test_least_recently_used_files_are_evicted(tmp_path):
+    cache = DiskCache(tmp_path)
+    cache.price(**GRID)
+    entry = cache.nbytes
+    cache.max_bytes = 2 * entry
+
+    cache.price(**{**GRID, "r": 0.01})
+    # Older timestamps make the order independent of the file system resolution
+    for i, path in enumerate(sorted(tmp_path.glob("*.npy"), key=os.path.getmtime)):
+        os.utime(path, ns=(i * 10**9, i * 10**9))
+    cache.price(**GRID)
+    cache.price(**{**GRID, "r": 0.02})
+
+    assert cache.stats.evictions == 1
+    assert cache.nbytes == 2 * entry
+    cache.price(**GRID)
+    assert cache.stats.hits == 2
+
+
+def test_greeks_round_trip(tmp_path):
+    cache = DiskCache(tmp_path)
+    cache.greeks(**GRID, option_type="put")
+    greeks = cache.greeks(**GRID, option_type="put")
+
+    expected = calculate_greeks(
+        AnalyticalBackend(BlackScholesState.build(**GRID)), "put"
+    )
+    for name in ("delta", "theta", "gamma", "vega", "rho"):
+        np.testing.assert_allclose(getattr(greeks, name), getattr(expected, name))
+    assert cache.stats.hits == 1
+
+
+def test_implied_vol_batch(tmp_path):
+    cache = DiskCache(tmp_path)
+    prices = black_scholes_price(**GRID)
+    prices[0] = -1.0
+
+    vols = cache.implied_vol(prices, GRID["S"], 40.0, GRID["T"], 0.05)
+    np.testing.assert_allclose(vols[1:], 0.25, rtol=1e-6)
+    assert np.isnan(vols[0])
+    assert vols[5] == pytest.approx(
+        implied_vol(prices[5], GRID["S"][5], 40.0, GRID["T"][5], 0.05)
+    )
+
+    cache.implied_vol(prices, GRID["S"], 40.0, GRID["T"], 0.05)
+    assert cache.stats.hits == 1
+
+
+def test_clear_removes_every_file(tmp_path):
+    cache = DiskCache(tmp_path)
+    cache.price(**GRID)
+    cache.clear()
+    assert cache.nbytes == 0
+    assert cache.stats.misses == 0
+
+
+def test_max_bytes_must_be_positive(tmp_path):
+    with pytest.raises(ValueError, match="max_bytes"):
+        DiskCache(tmp_path, max_bytes=0)
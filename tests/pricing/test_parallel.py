@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from bspx.pricing import black_scholes_price, black_scholes_price_threaded
+from bspx.pricing.parallel import MIN_ELEMENTS_PER_WORKER, _thread_pool
+
+_N = 4 * MIN_ELEMENTS_PER_WORKER + 123
+
+
+@pytest.fixture
+def batch() -> tuple[np.ndarray, ...]:
+    rng = np.random.default_rng(11)
+    return (
+        rng.uniform(20.0, 80.0, _N),
+        rng.uniform(20.0, 80.0, _N),
+        rng.uniform(0.0, 2.0, _N),
+        np.asarray(0.04),
+        rng.uniform(0.1, 0.6, _N),
+    )
+
+
+@pytest.mark.parametrize("workers", [1, 3, 4])
+@pytest.mark.parametrize("option_type", ["call", "put"])
+def test_threaded_matches_serial(batch, workers, option_type):
+    threaded = black_scholes_price_threaded(*batch, option_type, workers=workers)
+    np.testing.assert_allclose(threaded, black_scholes_price(*batch, option_type))
+
+
+def test_threaded_writes_into_out(batch):
+    out = np.empty(_N)
+    result = black_scholes_price_threaded(*batch, workers=4, out=out)
+    assert result is out
+    np.testing.assert_allclose(out, black_scholes_price(*batch))
+
+
+def test_threaded_small_batch_and_scalars():
+    assert black_scholes_price_threaded(42, 40, 0.5, 0.1, 0.2) == pytest.approx(
+        black_scholes_price(42, 40, 0.5, 0.1, 0.2)
+    )
+
+
+def test_threaded_rejects_zero_workers(batch):
+    with pytest.raises(ValueError, match="workers"):
+        black_scholes_price_threaded(*batch, workers=0)
+
+
+def test_thread_pools_are_bounded():
+    for workers in range(1, 10):
+        _thread_pool(workers)
+    info = _thread_pool.cache_info()
+    assert info.currsize <= info.maxsize
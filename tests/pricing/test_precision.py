@@ -0,0 +1,134 @@
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.special import ndtr
+from tests.cases import (
+    DeltaTestCase,
+    GammaTestCase,
+    OptionTestCase,
+    RhoTestCase,
+    ThetaTestCase,
+    VegaTestCase,
+)
+from tests.constants import (
+    NORM_CDF_APPROX_ATOL,
+    PRECISION_GREEK_REL,
+    PRECISION_PRICE_SCALE,
+)
+
+from bspx.greeks import AnalyticalBackend, calculate_greeks
+from bspx.ingest import CONVERSION_STATS
+from bspx.numeric_utils import norm_cdf_approx, to_precision
+from bspx.pricing import BlackScholesState, black_scholes_price
+from bspx.types import DayCount, Precision
+
+_GREEK_NAMES = ("delta", "theta", "gamma", "vega", "rho")
+
+
+def test_norm_cdf_approx_error_bound():
+    x = np.linspace(-12.0, 12.0, 100_001)
+    assert np.abs(norm_cdf_approx(x) - ndtr(x)).max() < NORM_CDF_APPROX_ATOL
+
+
+def test_norm_cdf_approx_in_place():
+    x = np.linspace(-5.0, 5.0, 101, dtype=np.float32)
+    expected = norm_cdf_approx(x)
+    result = norm_cdf_approx(x, out=x)
+    assert result is x
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_norm_cdf_approx_limits():
+    x = np.array([-np.inf, -50.0, -0.0, 0.0, 50.0, np.inf, np.nan])
+    result = norm_cdf_approx(x)
+    np.testing.assert_allclose(result[:-1], [0.0, 0.0, 0.5, 0.5, 1.0, 1.0], atol=1e-7)
+    assert np.isnan(result[-1])
+
+
+def test_norm_cdf_approx_uses_one_scratch_buffer():
+    x = np.linspace(-6.0, 6.0, 200_000)
+    tracemalloc.start()
+    try:
+        norm_cdf_approx(x, out=x)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert peak < 1.5 * x.nbytes
+
+
+def test_to_precision_converts_directly():
+    CONVERSION_STATS.reset()
+    x32 = np.linspace(1.0, 2.0, 100, dtype=np.float32)
+    assert to_precision(x32, Precision.FLOAT32) is x32
+    series = pd.Series(x32)
+    view = to_precision(series, Precision.FLOAT32)
+    assert np.shares_memory(view, series.to_numpy(copy=False))
+    assert CONVERSION_STATS.copies == 0
+
+    x64 = to_precision(x32.astype(np.float64), Precision.FLOAT32)
+    assert x64.dtype == np.float32
+    assert CONVERSION_STATS.copies == 1
+    assert CONVERSION_STATS.copied_bytes == x64.nbytes
+
+
+@pytest.mark.parametrize("precision", list(Precision))
+@pytest.mark.parametrize("option_type", ["call", "put"])
+def test_price_tier_matches_reference(
+    hull_15: OptionTestCase, precision: Precision, option_type
+):
+    m = hull_15.market
+    reference = black_scholes_price(m.S, m.K, m.T, m.r, m.vol, option_type)
+    result = black_scholes_price(
+        m.S, m.K, m.T, m.r, m.vol, option_type, precision=precision
+    )
+    state = BlackScholesState.build(m.S, m.K, m.T, m.r, m.vol, precision=precision)
+    from_state = state.call_price() if option_type == "call" else state.put_price()
+
+    tolerance = PRECISION_PRICE_SCALE[precision] * max(m.S, m.K)
+    assert result.dtype == precision.dtype
+    assert from_state.dtype == precision.dtype
+    assert result == pytest.approx(reference, abs=tolerance)
+    assert from_state == pytest.approx(reference, abs=tolerance)
+
+
+@pytest.mark.parametrize("precision", list(Precision))
+@pytest.mark.parametrize("option_type", ["call", "put"])
+def test_greeks_tier_matches_reference(
+    hull_19_delta: DeltaTestCase,
+    hull_19_theta: ThetaTestCase,
+    hull_19_gamma: GammaTestCase,
+    hull_19_vega: VegaTestCase,
+    hull_19_rho: RhoTestCase,
+    precision: Precision,
+    option_type,
+):
+    # Every Hull chapter 19 case shares one market
+    m = hull_19_delta.market
+    assert {
+        hull_19_theta.market,
+        hull_19_gamma.market,
+        hull_19_vega.market,
+        hull_19_rho.market,
+    } == {m}
+
+    reference = calculate_greeks(
+        AnalyticalBackend(m.to_bs_state()), option_type, DayCount.TRADING
+    )
+    state = BlackScholesState.build(m.S, m.K, m.T, m.r, m.vol, precision=precision)
+    result = calculate_greeks(AnalyticalBackend(state), option_type, DayCount.TRADING)
+
+    for name in _GREEK_NAMES:
+        value = getattr(result, name)
+        assert value.dtype == precision.dtype
+        assert value == pytest.approx(getattr(reference, name), rel=PRECISION_GREEK_REL)
+
+
+def test_update_spot_keeps_precision():
+    state = BlackScholesState.build(
+        [40.0, 50.0], 45.0, 0.5, 0.03, 0.2, precision=Precision.FAST_APPROX
+    )
+    repriced = state.update_spot([41.0, 51.0])
+    assert repriced.precision is Precision.FAST_APPROX
+    assert repriced.call_price().dtype == np.float32
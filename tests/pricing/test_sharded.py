@@ -0,0 +1,78 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from bspx.greeks import calculate_greeks_chunked
+from bspx.instruments import Greeks
+from bspx.pricing import SharedMemoryPool, black_scholes_price
+
+_N = 50_000
+
+
+@pytest.fixture(scope="module")
+def pool():
+    with SharedMemoryPool(workers=2) as pool:
+        yield pool
+
+
+@pytest.fixture
+def batch() -> tuple[np.ndarray, ...]:
+    rng = np.random.default_rng(13)
+    return (
+        rng.uniform(20.0, 80.0, _N),
+        rng.uniform(20.0, 80.0, _N),
+        rng.uniform(0.0, 2.0, _N),
+        np.asarray(0.03),
+        rng.uniform(0.1, 0.6, _N),
+    )
+
+
+@pytest.mark.parametrize("option_type", ["call", "put"])
+def test_pool_price_matches_serial(pool: SharedMemoryPool, batch, option_type):
+    prices = pool.price(*batch, option_type)
+    np.testing.assert_allclose(prices, black_scholes_price(*batch, option_type))
+    pool.release(prices)
+
+
+def test_pool_greeks_match_serial(pool: SharedMemoryPool, batch):
+    greeks = pool.greeks(*batch, "put")
+    expected = calculate_greeks_chunked(*batch, "put")
+    for name in ("delta", "theta", "gamma", "vega", "rho"):
+        np.testing.assert_allclose(getattr(greeks, name), getattr(expected, name))
+
+
+def test_pool_shared_inputs_and_out_are_used_in_place(pool: SharedMemoryPool, batch):
+    S, K, T, r, vol = batch
+    shared_S = pool.asarray(S)
+    assert pool.asarray(shared_S) is shared_S
+
+    out = pool.empty((_N,))
+    assert pool.price(shared_S, K, T, r, vol, out=out) is out
+    np.testing.assert_allclose(out, black_scholes_price(*batch))
+
+
+def test_pool_rejects_private_out(pool: SharedMemoryPool, batch):
+    with pytest.raises(ValueError, match="SharedMemoryPool.empty"):
+        pool.price(*batch, out=np.empty(_N))
+
+
+def test_pool_propagates_worker_errors(pool: SharedMemoryPool, batch):
+    S, K, T, r, vol = batch
+    with pytest.raises(ValueError, match="Asset price"):
+        pool.price(-S, K, T, r, vol)
+
+
+def test_pool_rejects_greeks_out_of_another_shape(pool: SharedMemoryPool, batch):
+    out = Greeks(*(pool.empty((_N - 1,)) for _ in range(5)))
+    with pytest.raises(ValueError, match="broadcast shape"):
+        pool.greeks(*batch, out=out)
+
+
+def test_pool_staging_is_safe_across_threads(pool: SharedMemoryPool, batch):
+    S, K, T, r, vol = batch
+    spots = [S, S * 1.1, S * 0.9, S * 1.2]
+    with ThreadPoolExecutor(max_workers=len(spots)) as threads:
+        prices = list(threads.map(lambda x: pool.price(x, K, T, r, vol), spots))
+    for x, price in zip(spots, prices, strict=True):
+        np.testing.assert_allclose(price, black_scholes_price(x, K, T, r, vol))
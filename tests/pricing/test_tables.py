@@ -0,0 +1,105 @@
+import numpy as np
+import pytest
+
+from bspx.greeks import calculate_greeks_table
+from bspx.greeks.formulas.analytical import calculate_greeks
+from bspx.ingest import CONVERSION_STATS, market_columns, to_f64
+from bspx.pricing import (
+    BlackScholesState,
+    black_scholes_price,
+    black_scholes_price_chunked,
+    black_scholes_price_table,
+)
+
+pd = pytest.importorskip("pandas")
+pa = pytest.importorskip("pyarrow")
+
+_N = 1_000
+
+
+@pytest.fixture
+def columns() -> dict[str, np.ndarray]:
+    rng = np.random.default_rng(8)
+    return {
+        "S": rng.uniform(20.0, 80.0, _N),
+        "K": rng.uniform(20.0, 80.0, _N),
+        "T": rng.uniform(0.05, 2.0, _N),
+        "r": np.full(_N, 0.03),
+        "vol": rng.uniform(0.1, 0.6, _N),
+    }
+
+
+@pytest.fixture(autouse=True)
+def _reset_stats():
+    CONVERSION_STATS.reset()
+
+
+def test_float64_sources_are_viewed(columns):
+    frame = pd.DataFrame(columns)
+    arrow_frame = frame.astype("double[pyarrow]")
+    table = pa.table(columns)
+
+    for source in (frame["S"], arrow_frame["S"], table["S"], table["S"].chunk(0)):
+        view = to_f64(source)
+        assert view.dtype == np.float64
+        assert np.shares_memory(view, to_f64(source))
+    assert CONVERSION_STATS.copies == 0
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        pytest.param(lambda: np.arange(_N), id="int-array"),
+        pytest.param(lambda: pd.Series(np.arange(_N, dtype=np.float32)), id="float32"),
+        pytest.param(lambda: pd.Series(np.arange(_N), dtype="Float64"), id="nullable"),
+        pytest.param(lambda: pa.array(np.arange(_N)), id="arrow-int"),
+        pytest.param(
+            lambda: pa.chunked_array([np.ones(_N), np.ones(_N)]), id="arrow-chunks"
+        ),
+    ],
+)
+def test_forced_copies_are_counted(source):
+    array = to_f64(source())
+    assert array.dtype == np.float64
+    assert CONVERSION_STATS.copies == 1
+    assert CONVERSION_STATS.copied_bytes == array.nbytes
+
+
+def test_arrow_nulls_become_nan():
+    array = to_f64(pa.array([1.0, None, 3.0]))
+    np.testing.assert_array_equal(np.isnan(array), [False, True, False])
+
+
+def test_python_inputs_are_not_counted():
+    to_f64([1, 2, 3])
+    to_f64(0.5)
+    assert CONVERSION_STATS.copies == 0
+
+
+@pytest.mark.parametrize("kind", ["pandas", "arrow"])
+def test_price_table_matches_arrays(columns, kind):
+    table = pd.DataFrame(columns) if kind == "pandas" else pa.table(columns)
+    expected = black_scholes_price(*columns.values(), "put")
+    np.testing.assert_array_equal(black_scholes_price_table(table, "put"), expected)
+    assert CONVERSION_STATS.copies == 0
+
+
+def test_greeks_table_with_renamed_columns_and_overrides(columns):
+    frame = pd.DataFrame(columns).rename(columns={"S": "underlying"}).drop(columns="r")
+    greeks = calculate_greeks_table(frame, "call", columns={"S": "underlying"}, r=0.03)
+    expected = calculate_greeks(BlackScholesState.build(*columns.values()), "call")
+    np.testing.assert_array_equal(greeks.vega, expected.vega)
+
+
+def test_chunked_entry_point_views_series(columns):
+    frame = pd.DataFrame(columns)
+    prices = black_scholes_price_chunked(
+        *(frame[n] for n in columns), memory_budget=4096
+    )
+    np.testing.assert_array_equal(prices, black_scholes_price(*columns.values()))
+    assert CONVERSION_STATS.copies == 0
+
+
+def test_missing_column_is_reported(columns):
+    with pytest.raises(ValueError, match="'vol'"):
+        market_columns(pa.table({k: v for k, v in columns.items() if k != "vol"}))
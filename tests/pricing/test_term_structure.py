@@ -0,0 +1,104 @@
+import numpy as np
+import pytest
+from tests.constants import PUT_CALL_PARITY_REL
+
+from bspx.pricing import (
+    BlackScholesStatics,
+    TermStructure,
+    black_scholes_price,
+    build_black_scholes_state,
+    forward_price,
+)
+from bspx.types import Precision
+
+_EXPIRIES = np.array([0.25, 0.5, 1.0])
+
+
+@pytest.fixture
+def book() -> tuple[np.ndarray, ...]:
+    rng = np.random.default_rng(7)
+    n = 300
+    S = rng.uniform(20.0, 80.0, n)
+    K = rng.uniform(20.0, 80.0, n)
+    T = rng.choice(_EXPIRIES, n)
+    vol = rng.uniform(0.1, 0.6, n)
+    return S, K, T, np.asarray(0.05), vol
+
+
+def test_term_structure_buckets_unique_expiries(book):
+    _, _, T, r, _ = book
+    term_structure = TermStructure.build(T, r)
+    assert term_structure.n_buckets == _EXPIRIES.size
+    np.testing.assert_allclose(term_structure.discount, np.exp(-r * T))
+    np.testing.assert_allclose(term_structure.sqrt_t, np.sqrt(T))
+
+
+def test_term_structure_pricing_matches_unbucketed(book):
+    S, K, T, r, vol = book
+    term_structure = TermStructure.build(T, r)
+    for option_type in ("call", "put"):
+        bucketed = black_scholes_price(S, K, T, r, vol, option_type, term_structure)
+        expected = black_scholes_price(S, K, T, r, vol, option_type)
+        np.testing.assert_allclose(bucketed, expected, rtol=PUT_CALL_PARITY_REL)
+
+    state = build_black_scholes_state(S, K, T, r, vol, term_structure=term_structure)
+    np.testing.assert_allclose(
+        state.call_price(),
+        black_scholes_price(S, K, T, r, vol),
+        rtol=PUT_CALL_PARITY_REL,
+    )
+    statics = BlackScholesStatics.build(K, T, r, vol, term_structure=term_structure)
+    np.testing.assert_allclose(
+        statics.reprice(S).put_price(),
+        black_scholes_price(S, K, T, r, vol, "put"),
+        rtol=PUT_CALL_PARITY_REL,
+    )
+
+
+def test_term_structure_forward_price(book):
+    S, _, T, r, _ = book
+    term_structure = TermStructure.build(T, r)
+    np.testing.assert_allclose(
+        forward_price(S, T, r, 0.01, term_structure=term_structure),
+        forward_price(S, T, r, 0.01),
+    )
+
+
+def test_term_structure_rejects_other_inputs(book):
+    S, K, T, r, vol = book
+    term_structure = TermStructure.build(T, r)
+    with pytest.raises(ValueError, match="term_structure"):
+        black_scholes_price(S, K, T + 0.1, r, vol, term_structure=term_structure)
+
+
+def test_term_structure_rejects_inputs_mutated_in_place(book):
+    S, K, T, r, vol = book
+    T = T.copy()
+    term_structure = TermStructure.build(T, r)
+    assert not np.shares_memory(term_structure.T, T)
+    assert not term_structure.T.flags.writeable
+
+    T += 1.0
+    with pytest.raises(ValueError, match="term_structure"):
+        black_scholes_price(S, K, T, r, vol, term_structure=term_structure)
+
+
+def test_term_structure_with_float32_precision(book):
+    S, K, T, r, vol = book
+    term_structure = TermStructure.build(T, r)
+    for option_type in ("call", "put"):
+        bucketed = black_scholes_price(
+            S,
+            K,
+            T,
+            r,
+            vol,
+            option_type,
+            term_structure,
+            precision=Precision.FLOAT32,
+        )
+        expected = black_scholes_price(
+            S, K, T, r, vol, option_type, precision=Precision.FLOAT32
+        )
+        assert bucketed.dtype == np.float32
+        np.testing.assert_allclose(bucketed, expected, rtol=1e-5, atol=1e-5)
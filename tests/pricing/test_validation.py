@@ -0,0 +1,144 @@
+import numpy as np
+import pytest
+from tests.constants import GREEK_IDENT_ATOL
+
+from bspx.greeks.formulas.analytical import calculate_greeks
+from bspx.instruments import OptionChain
+from bspx.pricing import (
+    BlackScholesState,
+    black_scholes_price,
+    black_scholes_price_chunked,
+    validity_mask,
+)
+from bspx.types import OptionType, Validation
+
+_GREEK_NAMES = ("delta", "theta", "gamma", "vega", "rho")
+
+
+def _quotes() -> tuple[np.ndarray, ...]:
+    S = np.array([42.0, -1.0, 49.0, 50.0, 60.0, np.nan, 45.0])
+    K = np.array([40.0, 40.0, 0.0, 50.0, 55.0, 50.0, 45.0])
+    T = np.array([0.5, 0.5, 0.5, -0.1, 1.0, 0.5, 0.0])
+    vol = np.array([0.2, 0.2, 0.2, 0.2, -0.3, 0.2, 0.2])
+    return S, K, T, vol
+
+
+_VALID = np.array([True, False, False, False, False, False, True])
+
+
+def test_validity_mask_flags_each_rule():
+    np.testing.assert_array_equal(validity_mask(*_quotes()), _VALID)
+
+
+def test_validity_mask_broadcasts():
+    mask = validity_mask(np.array([[10.0], [-10.0]]), 5.0, [0.5, 1.0], 0.2)
+    np.testing.assert_array_equal(mask, [[True, True], [False, False]])
+
+
+@pytest.mark.filterwarnings("error")
+@pytest.mark.parametrize("option_type", ["call", "put"])
+def test_mask_price_is_nan_only_for_invalid_rows(option_type: OptionType):
+    S, K, T, vol = _quotes()
+    price = black_scholes_price(S, K, T, 0.05, vol, option_type, validation="mask")
+
+    assert np.isnan(price[~_VALID]).all()
+    expected = black_scholes_price(
+        S[_VALID], K[_VALID], T[_VALID], 0.05, vol[_VALID], option_type
+    )
+    np.testing.assert_array_equal(price[_VALID], expected)
+
+
+@pytest.mark.filterwarnings("error")
+@pytest.mark.parametrize("option_type", ["call", "put"])
+def test_mask_state_greeks_are_nan_only_for_invalid_rows(option_type: OptionType):
+    S, K, T, vol = _quotes()
+    state = BlackScholesState.build(S, K, T, 0.05, vol, validation=Validation.MASK)
+    reference = BlackScholesState.build(
+        S[_VALID], K[_VALID], T[_VALID], 0.05, vol[_VALID]
+    )
+
+    assert np.isnan(state.call_price()[~_VALID]).all()
+    # The expired row has a zero denominator in gamma in both states
+    with np.errstate(divide="ignore", invalid="ignore"):
+        greeks = calculate_greeks(state, option_type)
+        expected = calculate_greeks(reference, option_type)
+
+    for name in _GREEK_NAMES:
+        value = getattr(greeks, name)
+        assert np.isnan(value[~_VALID]).all()
+        np.testing.assert_allclose(
+            value[_VALID], getattr(expected, name), atol=GREEK_IDENT_ATOL
+        )
+
+
+@pytest.mark.filterwarnings("error")
+def test_mask_survives_update_spot():
+    S, K, T, vol = _quotes()
+    state = BlackScholesState.build(S, K, T, 0.05, vol, validation="mask")
+
+    # The invalid spots of rows 1 and 5 become valid and row 0 gets a bad tick
+    spot = np.where(_VALID, S, 50.0) + 1.0
+    spot[0] = -5.0
+    price = state.update_spot(spot).call_price()
+
+    valid = validity_mask(spot, K, T, vol)
+    np.testing.assert_array_equal(valid, [False, True, False, False, False, True, True])
+    assert np.isnan(price[~valid]).all()
+    expected = black_scholes_price(
+        spot[valid], K[valid], T[valid], 0.05, vol[valid], "call"
+    )
+    np.testing.assert_allclose(price[valid], expected, rtol=1e-12)
+
+
+@pytest.mark.filterwarnings("error")
+def test_mask_expired_invalid_rows_are_nan_not_payoff():
+    S = np.array([110.0, 110.0, 90.0])
+    T = np.array([0.5, 0.0, 0.0])
+    vol = np.array([0.2, 0.0, 0.2])
+    state = BlackScholesState.build(S, 100.0, T, 0.05, vol, validation="mask")
+
+    for option_type, payoff in (("call", 0.0), ("put", 10.0)):
+        from_state = state.call_price() if option_type == "call" else state.put_price()
+        price = black_scholes_price(
+            S, 100.0, T, 0.05, vol, option_type, validation="mask"
+        )
+        chain = OptionChain.build(S, 100.0, T, 0.05, vol, option_type)
+        # The chain's gamma has a zero denominator on the expired rows
+        with np.errstate(divide="ignore", invalid="ignore"):
+            chain_price, _ = chain.price_and_greeks(validation=Validation.MASK)
+        for result in (from_state, price, chain_price):
+            assert np.isnan(result[1])
+            assert result[2] == payoff
+
+
+def test_raise_state_rejects_invalid_spot_on_update():
+    state = BlackScholesState.build(42.0, 40.0, 0.5, 0.05, 0.2)
+    with pytest.raises(ValueError, match="Asset price 'S' must be positive"):
+        state.update_spot(-1.0)
+
+
+def test_mask_chunked_matches_whole_batch():
+    S, K, T, vol = (np.tile(x, 50) for x in _quotes())
+    whole = black_scholes_price(S, K, T, 0.05, vol, validation="mask")
+    chunked = black_scholes_price_chunked(
+        S, K, T, 0.05, vol, memory_budget=1024, validation="mask"
+    )
+    np.testing.assert_array_equal(chunked, whole)
+
+
+def test_trusted_skips_validation():
+    with np.errstate(invalid="ignore"):
+        price = black_scholes_price(-1.0, 40.0, 0.5, 0.05, 0.2, validation="trusted")
+    assert np.isnan(price)
+
+
+def test_raise_message_does_not_embed_the_batch():
+    S = np.full(1_000_000, 50.0)
+    S[123_456] = -2.0
+    with pytest.raises(ValueError, match="Asset price") as error:
+        black_scholes_price(S, 50.0, 0.5, 0.05, 0.2)
+
+    message = str(error.value)
+    assert "1 of 1000000 values" in message
+    assert "(123456,)" in message
+    assert len(message) < 200
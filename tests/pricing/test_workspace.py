@@ -0,0 +1,103 @@
+import tracemalloc
+from collections.abc import Callable
+
+import numpy as np
+import pytest
+
+from bspx.greeks.formulas.analytical import calculate_greeks
+from bspx.instruments import Greeks
+from bspx.pricing import (
+    BlackScholesStatics,
+    PricingWorkspace,
+    black_scholes_price,
+    build_black_scholes_state,
+)
+
+_N = 100_000
+# A single batch-sized float64 array is _N * 8 = 800 KB, anything below this is
+# interpreter bookkeeping (small Python objects) rather than array allocations
+_ALLOCATION_SLACK = 16 * 1024
+
+
+def _allocated_during(func: Callable[[], object]) -> int:
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak - start
+
+
+@pytest.fixture
+def batch() -> tuple[np.ndarray, ...]:
+    rng = np.random.default_rng(3)
+    return (
+        rng.uniform(20.0, 80.0, _N),
+        rng.uniform(20.0, 80.0, _N),
+        rng.uniform(0.1, 2.0, _N),
+        rng.uniform(0.0, 0.1, _N),
+        rng.uniform(0.1, 0.6, _N),
+    )
+
+
+@pytest.mark.parametrize("option_type", ["call", "put"])
+def test_price_with_workspace_allocates_nothing_after_warm_up(batch, option_type):
+    workspace = PricingWorkspace()
+    out = np.empty(_N)
+
+    def cycle() -> None:
+        black_scholes_price(*batch, option_type, out=out, workspace=workspace)
+
+    cycle()
+    assert _allocated_during(cycle) < _ALLOCATION_SLACK
+    np.testing.assert_allclose(out, black_scholes_price(*batch, option_type))
+
+
+def test_greeks_with_workspace_allocate_nothing_after_warm_up(batch):
+    workspace = PricingWorkspace()
+    price = np.empty(_N)
+    greeks = Greeks(*(np.empty(_N) for _ in range(5)))
+
+    def cycle() -> None:
+        state = build_black_scholes_state(*batch, workspace=workspace)
+        state.call_price(out=price)
+        calculate_greeks(state, "put", out=greeks)
+
+    cycle()
+    assert _allocated_during(cycle) < _ALLOCATION_SLACK
+
+    expected = calculate_greeks(build_black_scholes_state(*batch), "put")
+    for name in ("delta", "theta", "gamma", "vega", "rho"):
+        np.testing.assert_allclose(getattr(greeks, name), getattr(expected, name))
+
+
+def test_reprice_with_workspace_allocates_nothing_after_warm_up(batch):
+    S, K, T, r, vol = batch
+    statics = BlackScholesStatics.build(K, T, r, vol)
+    workspace = PricingWorkspace()
+    out = np.empty(_N)
+
+    def cycle() -> None:
+        statics.reprice(S, workspace).call_price(out=out)
+
+    cycle()
+    assert _allocated_during(cycle) < _ALLOCATION_SLACK
+
+
+def test_out_shape_is_checked(batch):
+    with pytest.raises(ValueError, match="out"):
+        black_scholes_price(*batch, out=np.empty(_N - 1))
+
+
+def test_out_dtype_is_checked(batch):
+    with pytest.raises(ValueError, match="dtype float64"):
+        black_scholes_price(*batch, out=np.empty(_N, dtype=np.float32))
+
+    state = build_black_scholes_state(*batch)
+    with pytest.raises(ValueError, match="dtype float64"):
+        state.call_price(out=np.empty(_N, dtype=np.float32))
+    with pytest.raises(ValueError, match="dtype float64"):
+        calculate_greeks(state, "call", out=Greeks.empty((_N,), np.float32))
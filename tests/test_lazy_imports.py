@@ -0,0 +1,68 @@
+import importlib
+import os
+import subprocess
+import sys
+
+import pytest
+
+PACKAGES: tuple[str, ...] = (
+    "bspx",
+    "bspx.greeks",
+    "bspx.indicators",
+    "bspx.instruments",
+    "bspx.market_data",
+    "bspx.pricing",
+    "bspx.visualizations",
+    "bspx.volatility",
+)
+
+HEAVY: tuple[str, ...] = ("scipy", "pandas", "pyarrow", "numba", "yfinance", "plotly")
+
+# Optional dependencies a package needs once one of its names is used
+REQUIRES: dict[str, str] = {
+    "bspx.indicators": "pandas",
+    "bspx.market_data": "yfinance",
+    "bspx.visualizations": "plotly",
+}
+
+
+def _loaded_after(statement: str) -> set[str]:
+    check = f"import sys; {statement}; print(' '.join(sorted(sys.modules)))"
+    # The child interpreter sees the same 'src' directory as the test session
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    result = subprocess.run(
+        [sys.executable, "-c", check],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+    return set(result.stdout.split()) & set(HEAVY)
+
+
+def test_packages_import_no_heavy_dependency():
+    assert _loaded_after(f"import {', '.join(PACKAGES)}") == set()
+
+
+def test_implied_vol_does_not_need_pandas():
+    loaded = _loaded_after(
+        "from bspx.volatility import implied_vol; implied_vol(4.76, 42, 40, 0.5, 0.1)"
+    )
+    assert loaded == {"scipy"}
+
+
+@pytest.mark.parametrize("package", PACKAGES)
+def test_every_exported_name_resolves(package: str):
+    if package in REQUIRES:
+        pytest.importorskip(REQUIRES[package])
+    module = importlib.import_module(package)
+    for name in module.__all__:
+        assert getattr(module, name) is not None
+        assert name in dir(module)
+
+
+def test_unknown_name_raises_attribute_error():
+    import bspx.pricing
+
+    with pytest.raises(AttributeError, match="no attribute 'missing'"):
+        _ = bspx.pricing.missing
@@ -0,0 +1,14 @@
+import pytest
+from benchmarks.memory_budget import CASES, Case, measure
+
+# Large enough that per-element costs dominate fixed allocations
+SIZE: int = 200_000
+
+
+@pytest.mark.parametrize("case", CASES, ids=lambda case: case.name)
+def test_peak_memory_within_budget(case: Case):
+    peak = measure(case, SIZE)
+    assert peak <= case.limit(SIZE), (
+        f"{case.name} peaked at {peak / SIZE:.1f} bytes per element, "
+        f"budget {case.budget:.0f}"
+    )
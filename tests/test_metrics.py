@@ -0,0 +1,84 @@
+from collections.abc import Iterator
+
+import numpy as np
+import pytest
+
+from bspx.greeks import AnalyticalBackend, calculate_greeks
+from bspx.metrics import METRICS
+from bspx.pricing import BlackScholesState, black_scholes_price
+from bspx.volatility import implied_vol, implied_volatility
+
+
+@pytest.fixture
+def metrics() -> Iterator[None]:
+    METRICS.reset()
+    METRICS.enable()
+    yield
+    METRICS.disable()
+    METRICS.reset()
+
+
+def test_disabled_by_default_records_nothing():
+    METRICS.reset()
+    black_scholes_price(np.full(8, 42.0), 40.0, 0.5, 0.1, 0.2)
+    assert METRICS.snapshot() == {"stages": {}, "counters": {}}
+
+
+@pytest.mark.usefixtures("metrics")
+def test_pricing_stages_count_elements():
+    black_scholes_price(np.full(8, 42.0), 40.0, 0.5, 0.1, 0.2)
+    stages = METRICS.snapshot()["stages"]
+
+    assert stages["pricing.price"]["calls"] == 1
+    assert stages["pricing.price"]["elements"] == 8
+    # N(d1) and N(d2)
+    assert stages["cdf"] == {**stages["cdf"], "calls": 2, "elements": 16}
+    assert stages["pricing.price"]["seconds"] >= stages["cdf"]["seconds"] > 0
+
+
+@pytest.mark.usefixtures("metrics")
+def test_state_and_greek_stages():
+    state = BlackScholesState.build(np.full((2, 3), 42.0), 40.0, 0.5, 0.1, 0.2)
+    calculate_greeks(AnalyticalBackend(state), "put")
+    stages = METRICS.snapshot()["stages"]
+
+    assert stages["state.build"]["elements"] == 6
+    assert stages["state.d1_d2"]["calls"] == 1
+    assert stages["greeks.analytical"]["elements"] == 6
+
+
+@pytest.mark.usefixtures("metrics")
+def test_implied_vol_counts_iterations_and_fallbacks(monkeypatch: pytest.MonkeyPatch):
+    implied_vol(4.76, 42.0, 40.0, 0.5, 0.1)
+    counters = METRICS.snapshot()["counters"]
+    assert counters["iv.newton_iterations"] > 0
+    assert "iv.brent_fallbacks" not in counters
+
+    def diverge(*args: object) -> float:
+        raise RuntimeError("Failed to converge")
+
+    monkeypatch.setattr(implied_volatility, "implied_vol_newton", diverge)
+    implied_vol(4.76, 42.0, 40.0, 0.5, 0.1)
+
+    snapshot = METRICS.snapshot()
+    assert snapshot["counters"]["iv.brent_fallbacks"] == 1
+    assert snapshot["counters"]["iv.brent_iterations"] > 0
+    assert snapshot["stages"]["iv.solve"]["calls"] == 2
+
+
+@pytest.mark.usefixtures("metrics")
+def test_prometheus_text():
+    black_scholes_price(42.0, 40.0, 0.5, 0.1, 0.2)
+    implied_vol(4.76, 42.0, 40.0, 0.5, 0.1)
+    text = METRICS.to_prometheus()
+
+    assert "# TYPE bspx_stage_seconds_total counter" in text
+    assert 'bspx_stage_elements_total{stage="pricing.price"} 1\n' in text
+    assert "bspx_iv_newton_iterations_total " in text
+
+
+@pytest.mark.usefixtures("metrics")
+def test_reset_clears_everything():
+    black_scholes_price(42.0, 40.0, 0.5, 0.1, 0.2)
+    METRICS.reset()
+    assert METRICS.snapshot() == {"stages": {}, "counters": {}}